@@ -4,8 +4,15 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
 from core.security import get_user_id_from_token
-from hooks.http_errors import AuthenticationError, NotFoundError
-from mongo.schemas import Users, Workspaces
+from hooks.http_errors import AuthenticationError, NotFoundError, PermissionDeniedError
+from mongo.memberships import (
+    indexed_project_role,
+    member_roles,
+    membership_index_enabled,
+    sync_project_memberships,
+)
+from mongo.schemas import Projects, Users, Workspaces
+from services.caches import users_cache
 
 security = HTTPBearer()
 
@@ -32,12 +39,16 @@ async def get_current_user(
     if user_id is None:
         raise AuthenticationError("Invalid authentication token")
     
-    # Fetch user from database
-    user = await Users.get(user_id)
+    # Fetch user from cache or database; handlers may mutate the returned document, so hand out a copy
+    user = users_cache.get(user_id)
     if user is None:
-        raise AuthenticationError("Users not found")
-    
-    return user
+        user = await Users.get(user_id)
+        if user is None:
+            raise AuthenticationError("Users not found")
+        users_cache.set(user_id, user.model_copy())
+        return user
+
+    return user.model_copy()
 
 
 async def get_current_active_user(
@@ -76,6 +87,48 @@ async def get_workspace_by_id(workspace_id: UUID) -> Workspaces:
     
     return workspace
 
+async def get_project_role(project_id: UUID, user_id: UUID) -> str | None:
+    """
+    Role of a user in a project, None if they are not a member
+
+    Answered from the `memberships` rows when the index is enabled; without a
+    row (or without the index) the project document decides, and a row found
+    missing that way is re-synced.
+
+    Raises:
+        NotFoundError: If project not found
+    """
+    role = await indexed_project_role(user_id, project_id)
+    if role is not None:
+        return role
+
+    project = await Projects.get(project_id)
+    if project is None:
+        raise NotFoundError("Project not found")
+
+    role = member_roles(project.ownerId, project.members).get(user_id)
+    if role is not None and membership_index_enabled():
+        await sync_project_memberships(project)
+    return role
+
+
+async def require_project_member(project_id: UUID, user: Users) -> str:
+    """
+    Check that user is the owner or a member of a project
+
+    Returns:
+        The user's role in the project
+
+    Raises:
+        NotFoundError: If project not found
+        PermissionDeniedError: If user is not a member
+    """
+    role = await get_project_role(project_id, user.id)
+    if role is None:
+        raise PermissionDeniedError("You don't have access to this project")
+    return role
+
+
 def check_workspace_access(user: Users, workspace: Workspaces) -> bool:
     """
     Check if user has access to workspace
@@ -1,10 +1,18 @@
 # api/main.py
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 
-from api.router import authentication, columns, projects, search, tasks, workspaces
+from api.router import (
+    authentication,
+    columns,
+    profiles,
+    projects,
+    search,
+    tasks,
+    workspaces,
+)
 from api.websocket import (
     count_active_connections,
     count_total_rooms,
@@ -14,25 +22,69 @@ from api.websocket import (
 )
 from api.websocket import router as ws_router
 from clients import Clients
-from configs import get_logger
+from configs import (
+    cache_config,
+    get_logger,
+    metrics_config,
+    profiling_config,
+    rate_limit_config,
+    serving_config,
+)
+from configs.metrics_config import MetricsConfig
+from configs.serving_config import ServingConfig
+from services.background import drain_background_tasks
+from services.change_stream import ChangeStreamConsumer
+from services.db_budget import DBBudgetMiddleware
+from services.loop_monitor import loop_monitor
+from services.metrics import (
+    CONTENT_TYPE,
+    MetricsMiddleware,
+    render_metrics,
+    scrape_allowed,
+    worker_metrics,
+)
+from services.profiling import ProfilingMiddleware
+from services.rate_limit import RateLimitMiddleware
+from services.tracing import configure_tracing, shutdown_tracing
+from utils.json_response import FastJSONResponse
+from websocket.manager import worker_bus
 
 mongo_clients = Clients().get_mongo_client()
 logger = get_logger("api-main")
+_serving_config = serving_config or ServingConfig()
+_metrics_config = metrics_config or MetricsConfig()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting up API application...")
+    loop_monitor.start()
+    worker_bus.start()
+    worker_metrics.start(_metrics_config.worker_snapshot_seconds)
     
     await mongo_clients.initialize()
+
+    change_stream = None
+    if cache_config and cache_config.enabled:
+        change_stream = ChangeStreamConsumer(mongo_clients.db, cache_config)
+        await change_stream.start()
     
     await start_socketio_client()
+    app.state.ready = True
     
     yield
     
     logger.info("Shutting down API application...")
+    app.state.ready = False
     await stop_socketio_client()
+    await drain_background_tasks(_serving_config.drain_timeout_seconds)
+    worker_bus.stop()
+    await worker_metrics.stop()
+    if change_stream:
+        await change_stream.stop()
     await mongo_clients.close()
+    shutdown_tracing()
+    await loop_monitor.stop()
 
 
 app = FastAPI(
@@ -40,16 +92,27 @@ app = FastAPI(
     description="This API allows managing projects, tasks, and users.",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 
+if profiling_config and profiling_config.enabled:
+    app.add_middleware(ProfilingMiddleware)
+app.add_middleware(DBBudgetMiddleware)
+# Inside CORSMiddleware, so that preflights are answered without taking a token and 429 responses
+# carry the CORS headers; inside MetricsMiddleware, so that they are still counted
+if rate_limit_config and rate_limit_config.enabled:
+    app.add_middleware(RateLimitMiddleware)
 app.add_middleware(
     middleware_class=CORSMiddleware,
     allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Retry-After"],
 )
+app.add_middleware(MetricsMiddleware)
+configure_tracing(app)
 
 # Include Routers
 app.include_router(authentication.router, prefix="/api/v1")
@@ -59,6 +122,8 @@ app.include_router(columns.router, prefix="/api/v1")
 app.include_router(projects.router, prefix="/api/v1")
 app.include_router(search.router, prefix="/api/v1")
 app.include_router(ws_router)
+if profiling_config and profiling_config.enabled:
+    app.include_router(profiles.router, prefix="/api/v1")
 
 
 @app.get(path="/", summary="Health Check", tags=["Health"])
@@ -72,10 +137,11 @@ async def root():
 
 @app.get("/health")
 async def health():
+    database_up = await mongo_clients.ping()
     return {
-        "status": "healthy",
+        "status": "healthy" if database_up else "degraded",
         "api": "running",
-        "database": "connected",
+        "database": "connected" if database_up else "unreachable",
         "websocket": {
             "active_connections": await count_active_connections(),
             "total_users": await count_total_users(),
@@ -83,6 +149,31 @@ async def health():
         }
     }
 
+
+@app.get("/health/live", summary="Liveness", tags=["Health"])
+async def health_live():
+    """The process is serving requests; restart it when this fails."""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready", summary="Readiness", tags=["Health"])
+async def health_ready():
+    """Ready for traffic: started, not shutting down, and Mongo answers. 503 otherwise."""
+    if not getattr(app.state, "ready", False):
+        return FastJSONResponse({"status": "not ready"}, status_code=503)
+    if not await mongo_clients.ping():
+        return FastJSONResponse({"status": "not ready", "database": "unreachable"}, status_code=503)
+    return {"status": "ready"}
+
+
+if _metrics_config.enabled:
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics(request: Request):
+        if not scrape_allowed(request, _metrics_config):
+            return FastJSONResponse({"detail": "Forbidden"}, status_code=403)
+        return Response(render_metrics(), media_type=CONTENT_TYPE)
+
 if __name__ == "__main__":
     import uvicorn
     
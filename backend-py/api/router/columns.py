@@ -13,6 +13,7 @@ from hooks.http_errors import (
     NotFoundError,
     PermissionDeniedError,
 )
+from migrate_nodejs_backend import native_columns
 from migrate_nodejs_backend.columns import (
     ColumnGetResponse,
     ColumnResponse,
@@ -23,6 +24,8 @@ from migrate_nodejs_backend.columns import (
     delete_column,
     update_column,
 )
+from migrate_nodejs_backend.shadow import is_native
+from mongo.projections import DEFAULT_BATCH_SIZE
 from mongo.schemas import Columns, Comments, Labels, Tasks, Users
 
 logger = get_logger("columns")
@@ -65,6 +68,8 @@ async def api_update_column(
     
   
     try:
+        if is_native():
+            return await native_columns.update_column(column_id=column_id, update_data=update_data, current_user=current_user)
         return await update_column(column_id=column_id, update_data=update_data, token=bearer_token)
     except AuthenticationError as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
@@ -107,6 +112,8 @@ async def api_delete_column(
     
   
     try:
+        if is_native():
+            return await native_columns.delete_column(column_id=column_id, current_user=current_user)
         return await delete_column(column_id=column_id, token=bearer_token)
     except AuthenticationError as e:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
@@ -165,11 +172,11 @@ async def api_get_column(
                 continue
             labels_info.append(label.text)
 
-        comments_task = await Comments.find(
-            Comments.taskId == task.id
-        ).to_list()
+        comments_task = Comments.find(
+            Comments.taskId == task.id, batch_size=DEFAULT_BATCH_SIZE
+        ).sort(+Comments.createdAt)
         comments_info = []
-        for comment in comments_task:
+        async for comment in comments_task:
             user = await Users.find_one(Users.id == comment.userId)
             if user:
                 comments_info.append(CommentData(
@@ -0,0 +1,31 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+
+from api.dependencies import get_current_user
+from configs import profiling_config
+from hooks.http_errors import NotFoundError, PermissionDeniedError
+from mongo.schemas import Users
+from services.profiling import list_profiles, profile_path
+
+router = APIRouter(prefix="/profiles", tags=["Profiling"], include_in_schema=False)
+
+
+async def get_profiling_admin(current_user: Annotated[Users, Depends(get_current_user)]) -> Users:
+    if current_user.id not in profiling_config.admin_user_ids:
+        raise PermissionDeniedError("Only profiling admins can read profiles")
+    return current_user
+
+
+@router.get(path="", summary="List stored request profiles, newest first")
+async def get_profiles(_: Annotated[Users, Depends(get_profiling_admin)]) -> list[str]:
+    return list_profiles()
+
+
+@router.get(path="/{profile_id}", summary="Folded stacks of one request profile", response_class=PlainTextResponse)
+async def get_profile(profile_id: str, _: Annotated[Users, Depends(get_profiling_admin)]):
+    path = profile_path(profile_id)
+    if path is None:
+        raise NotFoundError("Profile not found")
+    return PlainTextResponse(path.read_text())
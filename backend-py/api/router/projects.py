@@ -10,6 +10,13 @@ from hooks.http_errors import (
     NotFoundError,
     PermissionDeniedError,
 )
+from migrate_nodejs_backend import (
+    native_board,
+    native_columns,
+    native_dashboard,
+    native_projects,
+)
+from migrate_nodejs_backend.passthrough import is_passthrough_enabled
 from migrate_nodejs_backend.projects import (
     ProjectAddMemberResponse,
     ProjectBoardResponse,
@@ -26,13 +33,18 @@ from migrate_nodejs_backend.projects import (
     get_project,
     get_project_board,
     get_project_dashboard,
+    stream_project,
+    stream_project_dashboard,
     update_project,
 )
+from migrate_nodejs_backend.shadow import is_native, project_fields, shadow_project
+from mongo.boards import boards_enabled
 from mongo.schemas import Labels, Projects, Users
 from utils.task_models import (
     LabelAdd,
     LabelCreate,
     LabelResponse,
+    ProjectTaskStatsResponse,
     TaskCreate,
     TaskResponse,
 )
@@ -61,6 +73,8 @@ async def api_get_project(
     bearer_token = auth_header[len("Bearer "):]
     
     try:
+        if is_passthrough_enabled("project"):
+            return await stream_project(project_id=project_id, token=bearer_token)
         return await get_project(
             project_id=project_id,
             token=bearer_token
@@ -100,6 +114,8 @@ async def api_get_project_board(
     bearer_token = auth_header[len("Bearer "):]
 
     try:
+        if boards_enabled():
+            return await native_board.get_project_board(project_id=project_id, current_user=current_user)
         return await get_project_board(
             project_id=project_id,
             token=bearer_token
@@ -138,6 +154,14 @@ async def api_update_project(
     bearer_token = auth_header[len("Bearer "):]
 
     try:
+        if is_native():
+            result = await native_projects.update_project(
+                project_id=project_id,
+                update_data=update_data,
+                current_user=current_user
+            )
+            shadow_project("update", project_id, bearer_token, project_fields(result.data))
+            return result
         return await update_project(
             project_id=project_id,
             update_data=update_data,
@@ -176,6 +200,13 @@ async def api_delete_project(
     bearer_token = auth_header[len("Bearer "):]
     
     try:
+        if is_native():
+            result = await native_projects.delete_project(
+                project_id=project_id,
+                current_user=current_user
+            )
+            shadow_project("delete", project_id, bearer_token, None)
+            return result
         return await delete_project(
             project_id=project_id,
             token=bearer_token
@@ -214,6 +245,14 @@ async def api_add_project_member(
     bearer_token = auth_header[len("Bearer "):]
     
     try:
+        if is_native():
+            result = await native_projects.add_project_member(
+                project_id=project_id,
+                member_email=member_email,
+                current_user=current_user
+            )
+            shadow_project("add_member", project_id, bearer_token, project_fields(result.data))
+            return result
         return await add_project_member(
             project_id=project_id,
             member_email=member_email,
@@ -253,6 +292,12 @@ async def api_create_project_columns(
     bearer_token = auth_header[len("Bearer "):]
 
     try:
+        if is_native():
+            return await native_columns.create_column(
+                project_id=project_id,
+                column_title=column_title,
+                current_user=current_user
+            )
         return await create_project_columns(
             project_id=project_id,
             column_title=column_title,
@@ -381,6 +426,10 @@ async def api_get_project_dashboard(
     bearer_token = auth_header[len("Bearer "):]
 
     try:
+        if is_native():
+            return await native_dashboard.get_project_dashboard(project_id=project_id, current_user=current_user)
+        if is_passthrough_enabled("dashboard"):
+            return await stream_project_dashboard(project_id=project_id, token=bearer_token)
         return await get_project_dashboard(
             project_id=project_id,
             token=bearer_token
@@ -394,4 +443,40 @@ async def api_get_project_dashboard(
     except BadRequestError as e:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except InternalServerError as e:
-        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
+
+
+@router.get(
+    path="/{project_id}/stats",
+    response_model=ProjectTaskStatsResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Get project task counters",
+    description="Get the open/closed task counters of the project without scanning its tasks"
+)
+async def api_get_project_stats(
+    project_id: UUID,
+    current_user: Annotated[Users, Depends(get_current_user)],
+):
+    r"""
+    **Get project task counters**
+    **Args:**
+        - `project_id`: The UUID of the project
+    """
+
+    project = await Projects.get(project_id)
+    if project is None:
+        raise NotFoundError("Project not found")
+
+    if current_user.id != project.ownerId and current_user.id not in [member.userId for member in project.members]:
+        raise PermissionDeniedError("You do not have permission to view this project")
+
+    open_tasks = max(project.taskStats.get("open", 0), 0)
+    closed_tasks = max(project.taskStats.get("closed", 0), 0)
+    total = open_tasks + closed_tasks
+    return ProjectTaskStatsResponse(
+        projectId=str(project.id),
+        open=open_tasks,
+        closed=closed_tasks,
+        totalTasks=total,
+        completion_rate=0 if total == 0 else closed_tasks / total * 100,
+    )
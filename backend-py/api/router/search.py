@@ -1,18 +1,39 @@
+import re
 from datetime import datetime, timedelta, timezone
-from typing import Annotated, List, Optional
+from typing import Annotated, Any, List, Optional
 from uuid import UUID
 
+from beanie.operators import In
 from fastapi import APIRouter, Depends, Query, status
 from pydantic import BaseModel
 
 from api.dependencies import get_current_user
+from clients import Clients
+from clients.mongo_client import SEARCH_QUERIES
+from mongo.projections import (
+    ColumnTitleView,
+    LabelTextView,
+    ProjectNameView,
+    ProjectRefView,
+    ProjectSummaryView,
+    TaskListView,
+    TaskSearchView,
+    find_view,
+    iter_view,
+)
 from mongo.schemas import Columns, Labels, Projects, Tasks, Users
 from utils.task_models import LabelResponse, TaskResponse
 
 router = APIRouter(prefix="/search", tags=["Search"])
 
+# Largest page a caller may ask for with `limit`; without one, every match is returned.
+MAX_PAGE_SIZE = 1000
 
 
+def contains_ignore_case(query: str, *fields: str) -> dict[str, Any]:
+    """Mongo filter matching documents where any of `fields` contains `query`, case-insensitively."""
+    pattern = {"$regex": re.escape(query), "$options": "i"}
+    return {"$or": [{field: pattern} for field in fields]}
 
 
 class ProjectSearchResponse(BaseModel):
@@ -32,32 +53,40 @@ class ProjectSearchResponse(BaseModel):
     summary="Search projects by name or description",
     description="Search for projects by their name or description that the current user is a member of"
 )
-async def search_projects(query: str, current_user: Annotated[Users, Depends(get_current_user)]):
+async def search_projects(
+    query: str,
+    current_user: Annotated[Users, Depends(get_current_user)],
+    skip: Annotated[int, Query(ge=0, description="Number of results to skip")] = 0,
+    limit: Annotated[Optional[int], Query(ge=1, le=MAX_PAGE_SIZE, description="Maximum number of results, all by default")] = None,
+):
     r"""
     **Search projects by name or description**
     **Args:**
         - `query`: The search query string
+        - `skip`, `limit`: Optional page of results, ordered by name
     """
 
-    projects = await Projects.find_all().to_list()
-    matching_projects: list[ProjectSearchResponse] = []
-
-    for project in projects:
-        if (query.lower() in project.name.lower() or
-                (project.description and query.lower() in project.description.lower())):
-            if any(member.userId == current_user.id for member in project.members):
-                matching_projects.append(
-                    ProjectSearchResponse(
-                        id=str(project.id),
-                        name=project.name,
-                        description=project.description if project.description else None,
-                        createdAt=project.createdAt,
-                        updatedAt=project.updatedAt,
-                        status=project.status,
-                        deadline=project.deadline if project.deadline else None,
-                        workspaceId=str(project.workspaceId)
-                    )
-                )
+    projects = iter_view(
+        Clients.get_mongo_client().collection(Projects, SEARCH_QUERIES),
+        {"members.userId": current_user.id, **contains_ignore_case(query, "name", "description")},
+        ProjectSummaryView,
+        sort=[("name", 1), ("_id", 1)],
+        skip=skip,
+        limit=limit or 0,
+    )
+    matching_projects = [
+        ProjectSearchResponse(
+            id=str(project.id),
+            name=project.name,
+            description=project.description if project.description else None,
+            createdAt=project.createdAt,
+            updatedAt=project.updatedAt,
+            status=project.status,
+            deadline=project.deadline if project.deadline else None,
+            workspaceId=str(project.workspaceId)
+        )
+        async for project in projects
+    ]
 
     return matching_projects
         
@@ -85,42 +114,76 @@ class TaskSearchResponse(BaseModel):
     summary="Search tasks by title or description",
     description="Search for tasks by their title or description that belong to projects the current user is a member of"    
 )
-async def search_tasks(query: str, current_user: Annotated[Users, Depends(get_current_user)]):
+async def search_tasks(
+    query: str,
+    current_user: Annotated[Users, Depends(get_current_user)],
+    skip: Annotated[int, Query(ge=0, description="Number of results to skip")] = 0,
+    limit: Annotated[Optional[int], Query(ge=1, le=MAX_PAGE_SIZE, description="Maximum number of results, all by default")] = None,
+):
     r"""
     **Search tasks by title or description**
     **Args:**
         - `query`: The search query string
+        - `skip`, `limit`: Optional page of results, most recently updated first
     """
 
-    tasks = await Tasks.find_all().to_list()
-    matching_tasks: list[TaskSearchResponse] = []
+    projects = {
+        project.id: project
+        for project in await Projects.find(
+            {"members.userId": current_user.id},
+            projection_model=ProjectNameView,
+        ).to_list()
+    }
+    if not projects:
+        return []
+
+    tasks = await find_view(
+        Clients.get_mongo_client().collection(Tasks, SEARCH_QUERIES),
+        {"projectId": {"$in": list(projects)}, **contains_ignore_case(query, "title", "description")},
+        TaskSearchView,
+        sort=[("updatedAt", -1), ("_id", 1)],
+        skip=skip,
+        limit=limit or 0,
+    )
+
+    columns = {
+        column.id: column
+        for column in await Columns.find(
+            In(Columns.id, list({task.columnId for task in tasks})),
+            projection_model=ColumnTitleView,
+        ).to_list()
+    }
+    labels = {
+        label.id: label
+        for label in await Labels.find(
+            In(Labels.id, list({label_id for task in tasks for label_id in task.labels})),
+            projection_model=LabelTextView,
+        ).to_list()
+    }
 
+    matching_tasks: list[TaskSearchResponse] = []
     for task in tasks:
-        if (query.lower() in task.title.lower() or
-                (task.description and query.lower() in task.description.lower())):
-            project = await Projects.get(task.projectId)
-            if project and any(member.userId == current_user.id for member in project.members):
-                column = await Columns.find_one(Columns.id == task.columnId)
-                labels_data: list[LabelData] = []
-                for label_id in task.labels:
-                    label = await Labels.find_one(Labels.id == label_id)
-                    if label:
-                        labels_data.append(LabelData(labelId=str(label.id), text=label.text))
-                matching_tasks.append(
-                    TaskSearchResponse(
-                        id=str(task.id),
-                        title=task.title,
-                        description=task.description if task.description else None,
-                        createdAt=task.createdAt,
-                        updatedAt=task.updatedAt,
-                        dueDate=task.dueDate if task.dueDate else None,
-                        projectId=str(project.id),
-                        projectName=project.name,
-                        columnId=str(column.id) if column else "",
-                        columnName=column.title if column else "",
-                        labels=labels_data
-                    )
-                )
+        project = projects[task.projectId]
+        column = columns.get(task.columnId)
+        matching_tasks.append(
+            TaskSearchResponse(
+                id=str(task.id),
+                title=task.title,
+                description=task.description if task.description else None,
+                createdAt=task.createdAt,
+                updatedAt=task.updatedAt,
+                dueDate=task.dueDate if task.dueDate else None,
+                projectId=str(project.id),
+                projectName=project.name,
+                columnId=str(column.id) if column else "",
+                columnName=column.title if column else "",
+                labels=[
+                    LabelData(labelId=str(label_id), text=labels[label_id].text)
+                    for label_id in task.labels
+                    if label_id in labels
+                ]
+            )
+        )
 
     return matching_tasks
 
@@ -136,22 +199,20 @@ async def get_my_labels(
     """
     **Get all labels from projects the current user is a member of**
     """
-    projects = await Projects.find_all().to_list()
-    user_labels: list[LabelResponse] = []
-
-    
-
-    for project in projects:
-        if any(member.userId == current_user.id for member in project.members):
-            from mongo.schemas import Labels
-            labels = await Labels.find(Labels.projectId == project.id).to_list()
-            for label in labels:
-                user_labels.append(LabelResponse(
-                    id=str(label.id),
-                    projectId=str(label.projectId),
-                    text=label.text,
-                    color=label.color
-                ))
+    projects = await Projects.find(
+        {"members.userId": current_user.id},
+        projection_model=ProjectRefView,
+    ).to_list()
+    labels = await Labels.find(In(Labels.projectId, [project.id for project in projects])).to_list()
+    user_labels: list[LabelResponse] = [
+        LabelResponse(
+            id=str(label.id),
+            projectId=str(label.projectId),
+            text=label.text,
+            color=label.color
+        )
+        for label in labels
+    ]
 
     labels_dict = {str(label.text): label for label in user_labels}
 
@@ -168,96 +229,73 @@ async def get_my_labels(
 )
 async def get_my_tasks(
     current_user: Annotated[Users, Depends(get_current_user)],
-    project_id: Optional[UUID] = Query(None, description="Filter by project ID"),
-    label_text: Optional[str] = Query(None, description="Filter by label text"),
-    no_due_date: Optional[bool] = Query(None, description="Filter tasks with no due date"),
-    overdue: Optional[bool] = Query(None, description="Filter overdue tasks"),
-    this_week: Optional[bool] = Query(None, description="Filter tasks due this week"),
+    project_id: Annotated[Optional[UUID], Query(description="Filter by project ID")] = None,
+    label_text: Annotated[Optional[str], Query(description="Filter by label text")] = None,
+    no_due_date: Annotated[Optional[bool], Query(description="Filter tasks with no due date")] = None,
+    overdue: Annotated[Optional[bool], Query(description="Filter overdue tasks")] = None,
+    this_week: Annotated[Optional[bool], Query(description="Filter tasks due this week")] = None,
+    skip: Annotated[int, Query(ge=0, description="Number of tasks to skip")] = 0,
+    limit: Annotated[Optional[int], Query(ge=1, le=MAX_PAGE_SIZE, description="Maximum number of tasks, all by default")] = None,
 ):
     """
-    Get all tasks assigned to the current user
+    Get tasks assigned to the current user, by due date (tasks without one last), then creation date
     """
-    tasks = await Tasks.find_all().to_list()
-    tasks = [task for task in tasks if current_user.id in task.assignees]
+    now = datetime.now(timezone.utc)
 
+    task_filter: dict[str, Any] = {"assignees": current_user.id}
     if project_id:
-        tasks = [task for task in tasks if task.projectId == project_id]
-    
+        task_filter["projectId"] = project_id
+
     if label_text:
-        from mongo.schemas import Labels
-        matching_label_ids: list[UUID] = []
-        labels = await Labels.find(Labels.text == label_text).to_list()
-        for label in labels:
-            matching_label_ids.append(label.id)
-        
-        tasks = [
-            task for task in tasks
-            if any(label_id in matching_label_ids for label_id in task.labels)
-        ]
-    
-    now = datetime.now(timezone.utc)
-    
-    def to_utc(dt: Optional[datetime]) -> Optional[datetime]:
-        """Ensure datetime is timezone-aware for comparison."""
-        if dt is None:
-            return None
-        if dt.tzinfo is None:
-            return dt.replace(tzinfo=timezone.utc)
-        return dt
-    
+        labels = await Labels.find(Labels.text == label_text, projection_model=LabelTextView).to_list()
+        task_filter["labels"] = {"$in": [label.id for label in labels]}
+
+    due_date_conditions: list[dict[str, Any]] = []
     if overdue:
-        tasks = [
-            task for task in tasks
-            if task.dueDate and to_utc(task.dueDate) < now
-        ]
-    
+        due_date_conditions.append({"dueDate": {"$lt": now}})
     if this_week:
-        from datetime import timedelta
-        week_end = now + timedelta(days=7)
-        tasks = [
-            task for task in tasks
-            if task.dueDate and now <= to_utc(task.dueDate) <= week_end
-        ]
-    
+        due_date_conditions.append({"dueDate": {"$gte": now, "$lte": now + timedelta(days=7)}})
     if no_due_date:
-        tasks = [
-            task for task in tasks
-            if not task.dueDate
-        ]
-    
-    task_responses = [
-        TaskResponse(
-            id=task.id,
-            title=task.title,
-            description=task.description,
-            projectId=task.projectId,
-            columnId=task.columnId,
-            creatorId=task.creatorId,
-            assignees=task.assignees,
-            dueDate=task.dueDate,
-            labels=task.labels,
-            checklists=task.checklists,
-            createdAt=task.createdAt,
-            updatedAt=task.updatedAt
-        )
-        for task in tasks
-    ]
-    
-    def normalize_datetime(dt: Optional[datetime]) -> datetime:
-        """Ensure datetime is timezone-aware for consistent comparison."""
-        if dt is None:
-            return datetime.max.replace(tzinfo=timezone.utc)
-        if dt.tzinfo is None:
-            return dt.replace(tzinfo=timezone.utc)
-        return dt
-    
-    task_responses.sort(
-        key=lambda t: (
-            normalize_datetime(t.dueDate),
-            normalize_datetime(t.createdAt)
-        )
+        due_date_conditions.append({"dueDate": None})
+
+    # Mongo sorts missing dates first, so tasks with and without a due date are read as two ordered runs.
+    tasks_collection = Clients.get_mongo_client().collection(Tasks)
+    dated_filter = {**task_filter, "$and": [*due_date_conditions, {"dueDate": {"$ne": None}}]}
+    undated_filter = {**task_filter, "$and": [*due_date_conditions, {"dueDate": None}]}
+
+    task_responses: list[TaskResponse] = []
+    runs = (
+        (dated_filter, [("dueDate", 1), ("createdAt", 1)]),
+        (undated_filter, [("createdAt", 1)]),
     )
-    
+    for run_filter, sort in runs:
+        # 0 reads the whole run
+        remaining = 0 if limit is None else limit - len(task_responses)
+        if limit is not None and remaining <= 0:
+            break
+        if task_responses:
+            skip = 0
+        task_responses.extend([
+            TaskResponse(
+                id=task.id,
+                title=task.title,
+                description=task.description,
+                projectId=task.projectId,
+                columnId=task.columnId,
+                creatorId=task.creatorId,
+                assignees=task.assignees,
+                dueDate=task.dueDate,
+                labels=task.labels,
+                checklists=task.checklists,
+                createdAt=task.createdAt,
+                updatedAt=task.updatedAt
+            )
+            async for task in iter_view(tasks_collection, run_filter, TaskListView, sort=sort, skip=skip, limit=remaining)
+        ])
+        if not task_responses and skip:
+            # The whole run was skipped; carry the rest of the offset into the next one.
+            skip = max(0, skip - await tasks_collection.count_documents(run_filter))
+
     return task_responses
 
 
@@ -269,27 +307,33 @@ async def get_my_tasks(
     description="Get all projects the current user is a member of"
 )
 async def get_my_projects(
-    current_user: Annotated[Users, Depends(get_current_user)]
+    current_user: Annotated[Users, Depends(get_current_user)],
+    skip: Annotated[int, Query(ge=0, description="Number of projects to skip")] = 0,
+    limit: Annotated[Optional[int], Query(ge=1, le=MAX_PAGE_SIZE, description="Maximum number of projects, all by default")] = None,
 ):
     """
-    **Get all projects the current user is a member of**
+    **Get the projects the current user is a member of, ordered by name**
     """
-    projects = await Projects.find_all().to_list()
-    user_projects: list[ProjectSearchResponse] = []
-
-    for project in projects:
-        if any(member.userId == current_user.id for member in project.members):
-            user_projects.append(
-                ProjectSearchResponse(
-                    id=str(project.id),
-                    name=project.name,
-                    description=project.description if project.description else None,
-                    createdAt=project.createdAt,
-                    updatedAt=project.updatedAt,
-                    status=project.status,
-                    deadline=project.deadline if project.deadline else None,
-                    workspaceId=str(project.workspaceId)
-                )
-            )
+    projects = iter_view(
+        Clients.get_mongo_client().collection(Projects),
+        {"members.userId": current_user.id},
+        ProjectSummaryView,
+        sort=[("name", 1), ("_id", 1)],
+        skip=skip,
+        limit=limit or 0,
+    )
+    user_projects = [
+        ProjectSearchResponse(
+            id=str(project.id),
+            name=project.name,
+            description=project.description if project.description else None,
+            createdAt=project.createdAt,
+            updatedAt=project.updatedAt,
+            status=project.status,
+            deadline=project.deadline if project.deadline else None,
+            workspaceId=str(project.workspaceId)
+        )
+        async for project in projects
+    ]
 
     return user_projects
\ No newline at end of file
@@ -1,26 +1,33 @@
-import asyncio
 from datetime import datetime, timezone
-from typing import Annotated, List, Optional
+from typing import Annotated, Any, List, Optional
 from uuid import UUID
 
+from beanie import UpdateResponse
 from fastapi import APIRouter, Depends, Query, status
 
 from api.dependencies import (
     check_workspace_access,
     get_current_user,
+    get_project_role,
     get_workspace_by_id,
+    require_project_member,
 )
 from api.websocket import ws_manager
 from hooks.http_errors import NotFoundError, PermissionDeniedError, ValidationError
+from mongo.boards import board_task_deleted, board_task_saved, board_task_updated
+from mongo.projections import DEFAULT_BATCH_SIZE, ProjectWorkspaceView
 from mongo.schemas import (
-    Activities,
     ChecklistItem,
     Columns,
     Comments,
     Projects,
     Tasks,
     Users,
+    Workspaces,
 )
+from services.background import run_in_background
+from utils.activity_log import record_activity
+from utils.json_response import EncodedJSONResponse, encode_json
 from utils.task_models import (
     AssigneeAdd,
     ChecklistItemCreate,
@@ -38,10 +45,54 @@ from utils.task_models import (
     TaskResponse,
     TaskUpdate,
 )
+from utils.task_stats import inc_task_stats, move_task_stats, stats_key
 
 router = APIRouter(tags=["Tasks"])
 
 
+async def update_task_document(
+    task_id: UUID,
+    update: dict[str, Any] | list[dict[str, Any]],
+    extra_filter: Optional[dict[str, Any]] = None,
+    not_found_message: Optional[str] = None,
+) -> Tasks:
+    """
+    Apply a targeted update operator to one task and return the updated document.
+
+    Only the touched fields are sent to Mongo (one `findAndModify`) instead of
+    re-validating and rewriting the whole task, checklists included, through `save()`.
+    `update` is an operator document or an update pipeline (a list of stages).
+    `updatedAt` is always bumped. `extra_filter` lets the caller make the write
+    conditional, e.g. on a checklist index existing.
+    """
+    now = datetime.now(timezone.utc)
+    if isinstance(update, list):
+        update = [*update, {"$set": {"updatedAt": now}}]
+    else:
+        update = {**update, "$set": {**update.get("$set", {}), "updatedAt": now}}
+    task = await Tasks.find_one({"_id": task_id, **(extra_filter or {})}).update(
+        update,
+        response_type=UpdateResponse.NEW_DOCUMENT,
+    )
+    if task is None:
+        raise NotFoundError(not_found_message or f"Task with ID {task_id} not found")
+    return task
+
+
+async def is_workspace_owner(project_id: UUID, user_id: UUID) -> bool:
+    """
+    Whether user owns the workspace of a project. Workspace owners need not be
+    project members, so this is only asked where the project role is not enough.
+    """
+    project = await Projects.find_one(Projects.id == project_id, projection_model=ProjectWorkspaceView)
+    if project is None:
+        raise NotFoundError("Project not found")
+    workspace = await Workspaces.get(project.workspaceId)
+    if workspace is None:
+        raise NotFoundError("Workspace not found")
+    return workspace.ownerId == user_id
+
+
 
 @router.post(
     "/columns/{column_id}/tasks",
@@ -62,17 +113,7 @@ async def create_task(
     if not column:
         raise NotFoundError(f"Column with ID {column_id} not found")
     
-    project = await Projects.get(column.projectId)
-    if not project:
-        raise NotFoundError("Project not found")
-    
-    from mongo.schemas import Workspaces
-    workspace = await Workspaces.get(project.workspaceId)
-    # if not workspace or not check_workspace_access(current_user, workspace):
-    #     raise PermissionDeniedError("You don't have access to this workspace")
-
-    if (current_user.id not in [member.userId for member in project.members] and current_user.id != project.ownerId):
-        raise PermissionDeniedError("You don't have access to this project")
+    await require_project_member(column.projectId, current_user)
     
     new_task = Tasks(
         title=task_data.title,
@@ -87,42 +128,30 @@ async def create_task(
     
     await new_task.insert()
     
-    column.taskOrder.append(new_task.id)
-    await column.save()
+    await Columns.find_one(Columns.id == column_id).update({"$push": {"taskOrder": new_task.id}})
+    await board_task_saved(column.projectId, new_task)
+
+    await inc_task_stats(column.projectId, **{stats_key(column.title): 1})
     
-    activity = Activities(
+    await record_activity(
         projectId=column.projectId,
         taskId=new_task.id,
         userId=current_user.id,
         action="created task",
         details={"task_title": task_data.title}
     )
-    await activity.insert()
-    
-    task_response = TaskResponse(
-        id=new_task.id,
-        title=new_task.title,
-        description=new_task.description,
-        projectId=new_task.projectId,
-        columnId=new_task.columnId,
-        creatorId=new_task.creatorId,
-        assignees=new_task.assignees,
-        dueDate=new_task.dueDate,
-        labels=new_task.labels,
-        checklists=new_task.checklists,
-        createdAt=new_task.createdAt,
-        updatedAt=new_task.updatedAt
-    )
     
-    asyncio.create_task(
-        ws_manager.broadcast_to_project(
-            str(project.id),
+    body = encode_json(TaskResponse.from_task(new_task))
+    
+    run_in_background(
+        ws_manager.broadcast_json(
+            str(column.projectId),
             "server:task_created",
-            task_response.model_dump()
+            body
         )
     )
 
-    return task_response
+    return EncodedJSONResponse(body, status_code=status.HTTP_201_CREATED)
 
 
 @router.get(
@@ -142,21 +171,12 @@ async def get_task(
     if not task:
         raise NotFoundError(f"Task with ID {task_id} not found")
     
-    project = await Projects.get(task.projectId)
-    if not project:
-        raise NotFoundError("Project not found")
-    
-    from mongo.schemas import Comments, Workspaces
-    workspace = await Workspaces.get(project.workspaceId)
-    # if not workspace or not check_workspace_access(current_user, workspace):
-    #     raise PermissionDeniedError("You don't have access to this task")
-
-    if (current_user.id not in [member.userId for member in project.members] and current_user.id != project.ownerId):
-        raise PermissionDeniedError("You don't have access to this project")
+    from mongo.schemas import Comments
+    await require_project_member(task.projectId, current_user)
 
-    comments = await Comments.find(Comments.taskId == task.id).to_list()
+    comments = Comments.find(Comments.taskId == task.id, batch_size=DEFAULT_BATCH_SIZE).sort(+Comments.createdAt)
     comments_info = []
-    for comment in comments:
+    async for comment in comments:
         user = await Users.find_one(Users.id == comment.userId)
         if user:
             comments_info.append(CommentData(
@@ -168,21 +188,7 @@ async def get_task(
             ))
     
     
-    return TaskResponse(
-        id=task.id,
-        title=task.title,
-        description=task.description,
-        projectId=task.projectId,
-        columnId=task.columnId,
-        creatorId=task.creatorId,
-        assignees=task.assignees,
-        dueDate=task.dueDate,
-        labels=task.labels,
-        checklists=task.checklists,
-        createdAt=task.createdAt,
-        updatedAt=task.updatedAt,
-        comments=comments_info
-    )
+    return EncodedJSONResponse(encode_json(TaskResponse.from_task(task, comments_info)))
 
 
 @router.patch(
@@ -203,64 +209,34 @@ async def update_task(
     if not task:
         raise NotFoundError(f"Task with ID {task_id} not found")
     
-    project = await Projects.get(task.projectId)
-    if not project:
-        raise NotFoundError("Project not found")
-    
-    from mongo.schemas import Workspaces
-    workspace = await Workspaces.get(project.workspaceId)
-    # if not workspace or not check_workspace_access(current_user, workspace):
-    #     raise PermissionDeniedError("You don't have access to this task")
-
-    if (current_user.id not in [member.userId for member in project.members] and current_user.id != project.ownerId):
-        raise PermissionDeniedError("You don't have access to this project")
+    await require_project_member(task.projectId, current_user)
 
     
     
-    if task_data.title is not None:
-        task.title = task_data.title
-    if task_data.description is not None:
-        task.description = task_data.description
-    if task_data.dueDate is not None:
-        task.dueDate = task_data.dueDate
+    changes = task_data.model_dump(include={"title", "description", "dueDate"}, exclude_none=True)
+    task = await update_task_document(task_id, {"$set": changes})
+    await board_task_updated(task.projectId, task)
     
-    task.updatedAt = datetime.now(timezone.utc)
-    await task.save()
     
-    
-    activity = Activities(
+    await record_activity(
         projectId=task.projectId,
         taskId=task.id,
         userId=current_user.id,
         action="updated task",
         details={"fields_updated": task_data.model_dump_json(exclude_unset=True)}
     )
-    await activity.insert()
     
-    task_response = TaskResponse(
-        id=task.id,
-        title=task.title,
-        description=task.description,
-        projectId=task.projectId,
-        columnId=task.columnId,
-        creatorId=task.creatorId,
-        assignees=task.assignees,
-        dueDate=task.dueDate,
-        labels=task.labels,
-        checklists=task.checklists,
-        createdAt=task.createdAt,
-        updatedAt=task.updatedAt
-    )
+    body = encode_json(TaskResponse.from_task(task))
 
-    asyncio.create_task(
-        ws_manager.broadcast_to_project(
-            str(project.id),
+    run_in_background(
+        ws_manager.broadcast_json(
+            str(task.projectId),
             "server:task_updated",
-            task_response.model_dump()
+            body
         )
     )
 
-    return task_response
+    return EncodedJSONResponse(body)
 
 
 @router.patch(
@@ -287,19 +263,14 @@ async def move_task(
     if not task:
         raise NotFoundError(f"Task with ID {task_id} not found")
     
-    project = await Projects.get(task.projectId)
-    if not project:
-        raise NotFoundError("Project not found")
-    
-    from mongo.schemas import Workspaces
-    workspace = await Workspaces.get(project.workspaceId)
-    if not workspace:
-        raise NotFoundError("Workspace not found")
+    role = await get_project_role(task.projectId, current_user.id)
 
-    isAdminOrOwner = (workspace.ownerId == current_user.id or project.ownerId == current_user.id)
+    isAdminOrOwner = role == "owner"
 
-    isAssignedTask = (current_user.id in task.assignees) or (current_user.id in [member.userId for member in project.members]) or (task.creatorId == current_user.id)
+    isAssignedTask = (current_user.id in task.assignees) or (role is not None) or (task.creatorId == current_user.id)
     
+    if not isAssignedTask:
+        isAdminOrOwner = isAdminOrOwner or await is_workspace_owner(task.projectId, current_user.id)
     if not (isAdminOrOwner or isAssignedTask):
         raise PermissionDeniedError("You don't have access to this task")
 
@@ -314,33 +285,31 @@ async def move_task(
     if not new_column:
         raise NotFoundError(f"Target column with ID {new_column_id} not found")
 
-    if new_column.title == "Done" and not (isAdminOrOwner):
+    if new_column.title == "Done" and not (isAdminOrOwner or await is_workspace_owner(task.projectId, current_user.id)):
         raise PermissionDeniedError("Only workspace owners or project owners can move tasks to the 'Done' column")
 
     source_position = None
     
     if old_column and task_id in old_column.taskOrder:
         source_position = old_column.taskOrder.index(task_id)
-        old_column.taskOrder.remove(task_id)
-        await old_column.save()
+        await Columns.find_one(Columns.id == old_column_id).update({"$pull": {"taskOrder": task_id}})
 
-    new_position = move_data.position
-    
+    target_order = [existing_id for existing_id in new_column.taskOrder if existing_id != task_id]
     if move_data.position is not None:
-        position = min(move_data.position, len(new_column.taskOrder))
-        new_position = position
-        new_column.taskOrder.insert(position, task_id)
+        new_position = min(move_data.position, len(target_order))
     else:
-        new_position = len(new_column.taskOrder)
-        new_column.taskOrder.append(task_id)
-    
-    await new_column.save()
-    
-    task.columnId = new_column_id
-    task.updatedAt = datetime.now(timezone.utc)
-    await task.save()
+        new_position = len(target_order)
+
+    await Columns.find_one(Columns.id == new_column_id).update(
+        {"$push": {"taskOrder": {"$each": [task_id], "$position": new_position}}}
+    )
+
+    task = await update_task_document(task_id, {"$set": {"columnId": new_column_id}})
+    await board_task_saved(task.projectId, task, new_position)
+
+    await move_task_stats(task.projectId, old_column.title if old_column else None, new_column.title)
     
-    activity = Activities(
+    await record_activity(
         projectId=task.projectId,
         taskId=task.id,
         userId=current_user.id,
@@ -351,26 +320,12 @@ async def move_task(
             "position": str(move_data.position) if move_data.position is not None else "last"
         }
     )
-    await activity.insert()
     
-    task_response = TaskResponse(
-        id=task.id,
-        title=task.title,
-        description=task.description,
-        projectId=task.projectId,
-        columnId=task.columnId,
-        creatorId=task.creatorId,
-        assignees=task.assignees,
-        dueDate=task.dueDate,
-        labels=task.labels,
-        checklists=task.checklists,
-        createdAt=task.createdAt,
-        updatedAt=task.updatedAt
-    )
+    body = encode_json(TaskResponse.from_task(task))
 
-    asyncio.create_task(
+    run_in_background(
         ws_manager.broadcast_to_project(
-            str(project.id),
+            str(task.projectId),
             "server:task_moved",
             {
                 "taskId": str(task.id),
@@ -382,7 +337,7 @@ async def move_task(
         )
     )
 
-    return task_response
+    return EncodedJSONResponse(body)
 
 
 @router.delete(
@@ -402,35 +357,25 @@ async def delete_task(
     if not task:
         raise NotFoundError(f"Task with ID {task_id} not found")
     
-    project = await Projects.get(task.projectId)
-    if not project:
-        raise NotFoundError("Project not found")
-    
-    from mongo.schemas import Workspaces
-    workspace = await Workspaces.get(project.workspaceId)
-    # if not workspace or not check_workspace_access(current_user, workspace):
-    #     raise PermissionDeniedError("You don't have access to this task")
-
-    if (current_user.id not in [member.userId for member in project.members] and current_user.id != project.ownerId):
-        raise PermissionDeniedError("You don't have access to this project")
+    await require_project_member(task.projectId, current_user)
     
     column = await Columns.get(task.columnId)
     if column and task_id in column.taskOrder:
-        column.taskOrder.remove(task_id)
-        await column.save()
+        await Columns.find_one(Columns.id == column.id).update({"$pull": {"taskOrder": task_id}})
+
+    await inc_task_stats(task.projectId, **{stats_key(column.title if column else None): -1})
     
-    activity = Activities(
+    await record_activity(
         projectId=task.projectId,
         taskId=task.id,
         userId=current_user.id,
         action="deleted task",
         details={"task_title": task.title}
     )
-    await activity.insert()
 
-    asyncio.create_task(
+    run_in_background(
         ws_manager.broadcast_to_project(
-            str(project.id),
+            str(task.projectId),
             "server:task_deleted",
             {
                 "taskId": str(task.id),
@@ -440,6 +385,7 @@ async def delete_task(
     )
 
     await task.delete()
+    await board_task_deleted(task.projectId, task.id)
 
     return None
 
@@ -462,17 +408,7 @@ async def add_assignee(
     if not task:
         raise NotFoundError(f"Task with ID {task_id} not found")
     
-    project = await Projects.get(task.projectId)
-    if not project:
-        raise NotFoundError("Project not found")
-    
-    from mongo.schemas import Workspaces
-    workspace = await Workspaces.get(project.workspaceId)
-    # if not workspace or not check_workspace_access(current_user, workspace):
-    #     raise PermissionDeniedError("You don't have access to this task")
-
-    if (current_user.id not in [member.userId for member in project.members] and current_user.id != project.ownerId):
-        raise PermissionDeniedError("You don't have access to this project")
+    await require_project_member(task.projectId, current_user)
     
     if assignee_data.userId in task.assignees:
         raise ValidationError("User is already assigned to this task")
@@ -481,47 +417,31 @@ async def add_assignee(
     if not assignee:
         raise NotFoundError("User not found")
     
-    project_members = [member.userId for member in project.members]
-    if assignee_data.userId not in project_members:
+    if await get_project_role(task.projectId, assignee_data.userId) is None:
         raise ValidationError("User doesn't have access to this project")
     
-    task.assignees.append(assignee_data.userId)
-    task.updatedAt = datetime.now(timezone.utc)
-    await task.save()
+    task = await update_task_document(task_id, {"$addToSet": {"assignees": assignee_data.userId}})
+    await board_task_updated(task.projectId, task)
     
-    activity = Activities(
+    await record_activity(
         projectId=task.projectId,
         taskId=task.id,
         userId=current_user.id,
         action="added assignee",
         details={"assignee_id": str(assignee_data.userId), "assignee_name": assignee.name}
     )
-    await activity.insert()
     
-    task_response = TaskResponse(
-        id=task.id,
-        title=task.title,
-        description=task.description,
-        projectId=task.projectId,
-        columnId=task.columnId,
-        creatorId=task.creatorId,
-        assignees=task.assignees,
-        dueDate=task.dueDate,
-        labels=task.labels,
-        checklists=task.checklists,
-        createdAt=task.createdAt,
-        updatedAt=task.updatedAt
-    )
+    body = encode_json(TaskResponse.from_task(task))
 
-    asyncio.create_task(
-        ws_manager.broadcast_to_project(
-            str(project.id),
+    run_in_background(
+        ws_manager.broadcast_json(
+            str(task.projectId),
             "server:task_updated",
-            task_response.model_dump()
+            body
         )
     )
 
-    return task_response
+    return EncodedJSONResponse(body)
 
 
 @router.delete(
@@ -542,59 +462,34 @@ async def remove_assignee(
     if not task:
         raise NotFoundError(f"Task with ID {task_id} not found")
     
-    project = await Projects.get(task.projectId)
-    if not project:
-        raise NotFoundError("Project not found")
-    
-    from mongo.schemas import Workspaces
-    workspace = await Workspaces.get(project.workspaceId)
-    # if not workspace or not check_workspace_access(current_user, workspace):
-    #     raise PermissionDeniedError("You don't have access to this task")
-
-    if (current_user.id not in [member.userId for member in project.members] and current_user.id != project.ownerId):
-        raise PermissionDeniedError("You don't have access to this project")
+    await require_project_member(task.projectId, current_user)
     
     if user_id not in task.assignees:
         raise ValidationError("User is not assigned to this task")
     
-    task.assignees.remove(user_id)
-    task.updatedAt = datetime.now(timezone.utc)
-    await task.save()
+    task = await update_task_document(task_id, {"$pull": {"assignees": user_id}})
+    await board_task_updated(task.projectId, task)
     
     assignee = await Users.get(user_id)
-    activity = Activities(
+    await record_activity(
         projectId=task.projectId,
         taskId=task.id,
         userId=current_user.id,
         action="removed assignee",
         details={"assignee_id": str(user_id), "assignee_name": assignee.name if assignee else "Unknown"}
     )
-    await activity.insert()
     
-    task_response = TaskResponse(
-        id=task.id,
-        title=task.title,
-        description=task.description,
-        projectId=task.projectId,
-        columnId=task.columnId,
-        creatorId=task.creatorId,
-        assignees=task.assignees,
-        dueDate=task.dueDate,
-        labels=task.labels,
-        checklists=task.checklists,
-        createdAt=task.createdAt,
-        updatedAt=task.updatedAt
-    )
+    body = encode_json(TaskResponse.from_task(task))
 
-    asyncio.create_task(
-        ws_manager.broadcast_to_project(
-            str(project.id),
+    run_in_background(
+        ws_manager.broadcast_json(
+            str(task.projectId),
             "server:task_updated",
-            task_response.model_dump()
+            body
         )
     )
 
-    return task_response
+    return EncodedJSONResponse(body)
 
 
 
@@ -617,17 +512,8 @@ async def add_label(
     if not task:
         raise NotFoundError(f"Task with ID {task_id} not found")
     
-    project = await Projects.get(task.projectId)
-    if not project:
-        raise NotFoundError("Project not found")
-    
-    from mongo.schemas import Labels, Workspaces
-    workspace = await Workspaces.get(project.workspaceId)
-    # if not workspace or not check_workspace_access(current_user, workspace):
-    #     raise PermissionDeniedError("You don't have access to this task")
-
-    if (current_user.id not in [member.userId for member in project.members] and current_user.id != project.ownerId):
-        raise PermissionDeniedError("You don't have access to this project")
+    from mongo.schemas import Labels
+    await require_project_member(task.projectId, current_user)
     
     label = await Labels.get(label_data.labelId)
     if not label:
@@ -639,43 +525,28 @@ async def add_label(
     if label_data.labelId in task.labels:
         raise ValidationError("Label is already added to this task")
     
-    task.labels.append(label_data.labelId)
-    task.updatedAt = datetime.now(timezone.utc)
-    await task.save()
+    task = await update_task_document(task_id, {"$addToSet": {"labels": label_data.labelId}})
+    await board_task_updated(task.projectId, task)
     
-    activity = Activities(
+    await record_activity(
         projectId=task.projectId,
         taskId=task.id,
         userId=current_user.id,
         action="added label",
         details={"label_id": str(label_data.labelId), "label_text": label.text}
     )
-    await activity.insert()
     
-    task_response = TaskResponse(
-        id=task.id,
-        title=task.title,
-        description=task.description,
-        projectId=task.projectId,
-        columnId=task.columnId,
-        creatorId=task.creatorId,
-        assignees=task.assignees,
-        dueDate=task.dueDate,
-        labels=task.labels,
-        checklists=task.checklists,
-        createdAt=task.createdAt,
-        updatedAt=task.updatedAt
-    )
+    body = encode_json(TaskResponse.from_task(task))
 
-    asyncio.create_task(
-        ws_manager.broadcast_to_project(
-            str(project.id),
+    run_in_background(
+        ws_manager.broadcast_json(
+            str(task.projectId),
             "server:task_updated",
-            task_response.model_dump()
+            body
         )
     )
 
-    return task_response
+    return EncodedJSONResponse(body)
 
 
 @router.post(
@@ -697,17 +568,7 @@ async def add_comment(
     if not task:
         raise NotFoundError(f"Task with ID {task_id} not found")
     
-    project = await Projects.get(task.projectId)
-    if not project:
-        raise NotFoundError("Project not found")
-    
-    from mongo.schemas import Workspaces
-    workspace = await Workspaces.get(project.workspaceId)
-    # if not workspace or not check_workspace_access(current_user, workspace):
-    #     raise PermissionDeniedError("You don't have access to this task")
-
-    if (current_user.id not in [member.userId for member in project.members] and current_user.id != project.ownerId):
-        raise PermissionDeniedError("You don't have access to this project")
+    await require_project_member(task.projectId, current_user)
     
     new_comment = Comments(
         taskId=task_id,
@@ -717,14 +578,13 @@ async def add_comment(
     
     await new_comment.insert()
     
-    activity = Activities(
+    await record_activity(
         projectId=task.projectId,
         taskId=task.id,
         userId=current_user.id,
         action="added comment",
         details={"comment_preview": comment_data.content[:50]}
     )
-    await activity.insert()
     
     comment_response = CommentResponse(
         id=new_comment.id,
@@ -734,9 +594,9 @@ async def add_comment(
         createdAt=new_comment.createdAt
     )
 
-    asyncio.create_task(
+    run_in_background(
         ws_manager.broadcast_to_project(
-            str(project.id),
+            str(task.projectId),
             "server:comment_added",
             comment_response.model_dump()
         )
@@ -764,59 +624,34 @@ async def add_checklist_item(
     if not task:
         raise NotFoundError(f"Task with ID {task_id} not found")
     
-    project = await Projects.get(task.projectId)
-    if not project:
-        raise NotFoundError("Project not found")
-    
-    from mongo.schemas import Workspaces
-    workspace = await Workspaces.get(project.workspaceId)
-    # if not workspace or not check_workspace_access(current_user, workspace):
-    #     raise PermissionDeniedError("You don't have access to this task")
-    
-    if (current_user.id not in [member.userId for member in project.members] and current_user.id != project.ownerId):
-        raise PermissionDeniedError("You don't have access to this project")
+    await require_project_member(task.projectId, current_user)
 
     new_item = ChecklistItem(
         text=item_data.text,
         checked=item_data.checked or False
     )
     
-    task.checklists.append(new_item)
-    task.updatedAt = datetime.now(timezone.utc)
-    await task.save()
+    task = await update_task_document(task_id, {"$push": {"checklists": new_item.model_dump()}})
+    await board_task_updated(task.projectId, task)
     
-    activity = Activities(
+    await record_activity(
         projectId=task.projectId,
         taskId=task.id,
         userId=current_user.id,
         action="added checklist item",
         details={"item_text": item_data.text}
     )
-    await activity.insert()
     
     item_response = ChecklistItemResponse(
         text=new_item.text,
         checked=new_item.checked
     )
 
-    asyncio.create_task(
-        ws_manager.broadcast_to_project(
-            str(project.id),
+    run_in_background(
+        ws_manager.broadcast_json(
+            str(task.projectId),
             "server:task_updated",
-            TaskResponse(
-                id=task.id,
-                title=task.title,
-                description=task.description,
-                projectId=task.projectId,
-                columnId=task.columnId,
-                creatorId=task.creatorId,
-                assignees=task.assignees,
-                dueDate=task.dueDate,
-                labels=task.labels,
-                checklists=task.checklists,
-                createdAt=task.createdAt,
-                updatedAt=task.updatedAt
-            ).model_dump()
+            encode_json(TaskResponse.from_task(task))
         )
     )
 
@@ -842,30 +677,24 @@ async def update_checklist_item(
     if not task:
         raise NotFoundError(f"Task with ID {task_id} not found")
     
-    project = await Projects.get(task.projectId)
-    if not project:
-        raise NotFoundError("Project not found")
-    
-    from mongo.schemas import Workspaces
-    workspace = await Workspaces.get(project.workspaceId)
-    # if not workspace or not check_workspace_access(current_user, workspace):
-    #     raise PermissionDeniedError("You don't have access to this task")
-    
-    if (current_user.id not in [member.userId for member in project.members] and current_user.id != project.ownerId):
-        raise PermissionDeniedError("You don't have access to this project")
+    await require_project_member(task.projectId, current_user)
 
     if item_index < 0 or item_index >= len(task.checklists):
         raise NotFoundError("Checklist item not found")
     
-    if item_data.text is not None:
-        task.checklists[item_index].text = item_data.text
-    if item_data.checked is not None:
-        task.checklists[item_index].checked = item_data.checked
-    
-    task.updatedAt = datetime.now(timezone.utc)
-    await task.save()
+    item_changes = {
+        f"checklists.{item_index}.{field}": value
+        for field, value in item_data.model_dump(include={"text", "checked"}, exclude_none=True).items()
+    }
+    task = await update_task_document(
+        task_id,
+        {"$set": item_changes},
+        extra_filter={f"checklists.{item_index}": {"$exists": True}},
+        not_found_message="Checklist item not found",
+    )
+    await board_task_updated(task.projectId, task)
     
-    activity = Activities(
+    await record_activity(
         projectId=task.projectId,
         taskId=task.id,
         userId=current_user.id,
@@ -875,31 +704,17 @@ async def update_checklist_item(
             "changes": item_data.model_dump_json(exclude_unset=True)
         }
     )
-    await activity.insert()
     
     item_response = ChecklistItemResponse(
         text=task.checklists[item_index].text,
         checked=task.checklists[item_index].checked
     )
 
-    asyncio.create_task(
-        ws_manager.broadcast_to_project(
-            str(project.id),
+    run_in_background(
+        ws_manager.broadcast_json(
+            str(task.projectId),
             "server:task_updated",
-            TaskResponse(
-                id=task.id,
-                title=task.title,
-                description=task.description,
-                projectId=task.projectId,
-                columnId=task.columnId,
-                creatorId=task.creatorId,
-                assignees=task.assignees,
-                dueDate=task.dueDate,
-                labels=task.labels,
-                checklists=task.checklists,
-                createdAt=task.createdAt,
-                updatedAt=task.updatedAt
-            ).model_dump()
+            encode_json(TaskResponse.from_task(task))
         )
     )
 
@@ -970,20 +785,14 @@ async def remove_label(
     if not task:
         raise NotFoundError(f"Task with ID {task_id} not found")
     
-    project = await Projects.get(task.projectId)
-    if not project:
-        raise NotFoundError("Project not found")
+    await require_project_member(task.projectId, current_user)
     
     assignees = task.assignees + [task.creatorId]
     if current_user.id not in assignees:
         raise PermissionDeniedError("You don't have access to this task")
     
-    for label_id in labels_list:
-        if label_id in task.labels:
-            task.labels.remove(label_id)
-    
-    task.updatedAt = datetime.now(timezone.utc)
-    await task.save()
+    task = await update_task_document(task_id, {"$pull": {"labels": {"$in": labels_list}}})
+    await board_task_updated(task.projectId, task)
     
     # activity = Activities(
     #     projectId=task.projectId,
@@ -994,30 +803,17 @@ async def remove_label(
     # )
     # await activity.insert()
     
-    task_response = TaskResponse(
-        id=task.id,
-        title=task.title,
-        description=task.description,
-        projectId=task.projectId,
-        columnId=task.columnId,
-        creatorId=task.creatorId,
-        assignees=task.assignees,
-        dueDate=task.dueDate,
-        labels=task.labels,
-        checklists=task.checklists,
-        createdAt=task.createdAt,
-        updatedAt=task.updatedAt
-    )
+    body = encode_json(TaskResponse.from_task(task))
 
-    asyncio.create_task(
-        ws_manager.broadcast_to_project(
-            str(project.id),
+    run_in_background(
+        ws_manager.broadcast_json(
+            str(task.projectId),
             "server:task_updated",
-            task_response.model_dump()
+            body
         )
     )
 
-    return task_response
+    return EncodedJSONResponse(body)
 
 
 @router.delete(
@@ -1038,25 +834,26 @@ async def delete_checklist_item(
     if not task:
         raise NotFoundError(f"Task with ID {task_id} not found")
     
-    project = await Projects.get(task.projectId)
-    if not project:
-        raise NotFoundError("Project not found")
+    await require_project_member(task.projectId, current_user)
     
     if current_user.id not in task.assignees and current_user.id != task.creatorId:
         raise PermissionDeniedError("You don't have access to this task")
     
-    item_to_delete = None
-    for item in task.checklists:
-        if item.text == item_text:
-            item_to_delete = item
-            break
-    
-    if not item_to_delete:
+    item_index = next((index for index, item in enumerate(task.checklists) if item.text == item_text), None)
+    if item_index is None:
         raise NotFoundError("Checklist item not found")
-    
-    task.checklists.remove(item_to_delete)
-    task.updatedAt = datetime.now(timezone.utc)
-    await task.save()
+
+    # Remove only the first item with this text, by position: a $pull by text would remove its duplicates too
+    task = await update_task_document(
+        task_id,
+        [{"$set": {"checklists": {"$concatArrays": [
+            {"$slice": ["$checklists", item_index]},
+            {"$slice": ["$checklists", item_index + 1, {"$size": "$checklists"}]},
+        ]}}}],
+        extra_filter={f"checklists.{item_index}.text": item_text},
+        not_found_message="Checklist item not found",
+    )
+    await board_task_updated(task.projectId, task)
     
     # activity = Activities(
     #     projectId=task.projectId,
@@ -1067,24 +864,11 @@ async def delete_checklist_item(
     # )
     # await activity.insert()
 
-    asyncio.create_task(
-        ws_manager.broadcast_to_project(
-            str(project.id),
+    run_in_background(
+        ws_manager.broadcast_json(
+            str(task.projectId),
             "server:task_updated",
-            TaskResponse(
-                id=task.id,
-                title=task.title,
-                description=task.description,
-                projectId=task.projectId,
-                columnId=task.columnId,
-                creatorId=task.creatorId,
-                assignees=task.assignees,
-                dueDate=task.dueDate,
-                labels=task.labels,
-                checklists=task.checklists,
-                createdAt=task.createdAt,
-                updatedAt=task.updatedAt
-            ).model_dump()
+            encode_json(TaskResponse.from_task(task))
         )
     )
 
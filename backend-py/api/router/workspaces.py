@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
 from typing import Annotated
 
+from beanie.operators import In
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 
 from api.dependencies import get_current_user
@@ -11,12 +12,22 @@ from hooks.http_errors import (
     NotFoundError,
     PermissionDeniedError,
 )
+from migrate_nodejs_backend import native_projects
+from migrate_nodejs_backend.passthrough import is_passthrough_enabled
+from migrate_nodejs_backend.shadow import is_native, project_fields, shadow_project
 from migrate_nodejs_backend.workspaces import (
     ProjectCreatedResponse,
     ProjectCreateRequest,
     ProjectGetResponse,
     create_project,
     get_projects,
+    stream_projects,
+)
+from mongo.memberships import (
+    membership_index_enabled,
+    sync_workspace_memberships,
+    user_project_roles,
+    user_workspace_ids,
 )
 from mongo.schemas import Users, WorkspaceMember, Workspaces
 from utils.workspace_model import (
@@ -47,18 +58,15 @@ async def get_workspaces(
     
     Requires authentication via Bearer token
     """
-    owned_workspaces = await Workspaces.find(
-        Workspaces.ownerId == current_user.id
-    ).to_list()
-    
-    all_workspaces = await Workspaces.find().to_list()
-    member_workspaces = [
-        ws for ws in all_workspaces
-        if any(member.userId == current_user.id for member in ws.members)
-        and ws.id not in [owned.id for owned in owned_workspaces]
-    ]
-    
-    workspaces = owned_workspaces + member_workspaces
+    if membership_index_enabled():
+        found_workspaces = await Workspaces.find(In(Workspaces.id, await user_workspace_ids(current_user.id))).to_list()
+    else:
+        found_workspaces = await Workspaces.find(
+            {"$or": [{"ownerId": current_user.id}, {"members.userId": current_user.id}]}
+        ).to_list()
+
+    # Owned workspaces first, then the ones the user was added to
+    workspaces = sorted(found_workspaces, key=lambda ws: ws.ownerId != current_user.id)
     
     return [
         WorkspaceResponse(
@@ -111,6 +119,7 @@ async def create_workspace(
     )
     
     await new_workspace.insert()
+    await sync_workspace_memberships(new_workspace)
     
     return WorkspaceResponse(
         id=new_workspace.id,
@@ -175,6 +184,7 @@ async def add_workspace_member(
         )
         workspace.members.append(new_member)
     await workspace.save()
+    await sync_workspace_memberships(workspace)
 
     return WorkspaceResponse(
         id=workspace.id,
@@ -273,6 +283,14 @@ async def api_create_project(
     bearer_token = auth_header[len("Bearer "):]
     
     try:
+        if is_native():
+            result = await native_projects.create_project(
+                workspace_id=workspace_id,
+                project_data=project_data,
+                current_user=current_user
+            )
+            shadow_project("create", result.data.id, bearer_token, project_fields(result.data))
+            return result
         return await create_project(
             workspace_id=workspace_id,
             project_data=project_data,
@@ -320,6 +338,8 @@ async def api_get_projects(
     
  
     try:
+        if is_passthrough_enabled("projects"):
+            return await stream_projects(workspace_id=workspace_id, token=bearer_token)
         return await get_projects(
             workspace_id=workspace_id,
             token=bearer_token
@@ -338,6 +358,7 @@ async def api_get_projects(
 
 from uuid import UUID
 
+from mongo.projections import ProjectMembershipView, ProjectWorkspaceView
 from mongo.schemas import Projects
 
 
@@ -365,11 +386,23 @@ async def get_joined_projects(
     
     Requires authentication via Bearer token.
     """
-    # Fetch all projects
+    if membership_index_enabled():
+        roles = await user_project_roles(current_user.id, UUID(workspace_id) if workspace_id else None)
+        projects = await Projects.find(In(Projects.id, list(roles)), projection_model=ProjectWorkspaceView).to_list()
+        return [
+            JoinedProjectResponse(
+                role=roles[project.id],
+                project_id=str(project.id),
+                project_name=project.name,
+                workspace_id=str(project.workspaceId),
+            )
+            for project in projects
+        ]
+
+    project_filter = {"members.userId": current_user.id}
     if workspace_id:
-        all_projects = await Projects.find(Projects.workspaceId == UUID(workspace_id)).to_list()
-    else:
-        all_projects = await Projects.find_all().to_list()
+        project_filter["workspaceId"] = UUID(workspace_id)
+    all_projects = await Projects.find(project_filter, projection_model=ProjectMembershipView).to_list()
 
     joined_projects = []
 
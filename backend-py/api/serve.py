@@ -0,0 +1,194 @@
+"""
+Production server, configured under `serving`:
+
+    python -m api.serve [--workers N] [--host HOST] [--port PORT]
+
+The app is imported once in the supervisor process (preload) and then
+`workers` processes are forked, sharing its memory pages and one listening
+socket; each worker runs its own event loop, Mongo client and Node.js relay
+connection from the app's lifespan. uvicorn picks uvloop and httptools when
+they are installed, asyncio and h11 otherwise. WebSocket broadcasts reach the
+clients of every worker through `websocket.worker_bus`, and /metrics merges
+the metrics of every worker through `services.metrics.worker_metrics`. A
+worker that dies is replaced.
+
+On SIGTERM or SIGINT the supervisor forwards SIGTERM to the workers, each of
+which stops accepting connections, finishes in-flight requests, closes its
+WebSocket clients with 1012 (service restart) so they reconnect elsewhere,
+and then waits for pending broadcasts and other background tasks in the
+lifespan shutdown. Workers still running after the graceful and drain
+timeouts are killed.
+
+With one worker the server runs in this process, without a supervisor.
+"""
+
+import argparse
+import os
+import shutil
+import signal
+import socket
+import sys
+import tempfile
+import time
+from importlib.util import find_spec
+from pathlib import Path
+
+import uvicorn
+
+from configs import get_logger, serving_config
+from configs.serving_config import ServingConfig
+from services.metrics import worker_metrics
+from websocket.manager import worker_bus
+
+logger = get_logger("serve")
+
+# Seconds past graceful_timeout + drain_timeout before a worker that is still running is killed
+KILL_GRACE_SECONDS = 5
+# A worker exiting sooner than this after it was started is restarted after a pause
+CRASH_LOOP_SECONDS = 1
+
+
+def default_workers() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def uvicorn_config(app, config: ServingConfig, **overrides) -> uvicorn.Config:
+    options = dict(
+        host=config.host,
+        port=config.port,
+        loop="auto",
+        http="auto",
+        lifespan="on",
+        timeout_keep_alive=config.keep_alive_seconds,
+        timeout_graceful_shutdown=config.graceful_timeout_seconds,
+        backlog=config.backlog,
+        access_log=False,
+    )
+    if config.forwarded_allow_ips is not None:
+        options["forwarded_allow_ips"] = config.forwarded_allow_ips
+    options.update(overrides)
+    return uvicorn.Config(app, **options)
+
+
+class Supervisor:
+    """Forks the workers, restarts those that die, and stops them all on SIGTERM/SIGINT."""
+
+    def __init__(self, config: uvicorn.Config, workers: int, stop_timeout: float):
+        self.config = config
+        self.workers = workers
+        self.stop_timeout = stop_timeout
+        self.children: dict[int, float] = {}
+        self.stopping_since: float | None = None
+
+    def _spawn(self, sock: socket.socket):
+        pid = os.fork()
+        if pid:
+            self.children[pid] = time.monotonic()
+            return
+        # Worker: uvicorn installs its own SIGTERM/SIGINT handlers. Its own process group keeps a
+        # Ctrl+C in the terminal from reaching it besides the supervisor's SIGTERM (twice is a forced exit).
+        code = 0
+        try:
+            os.setpgid(0, 0)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            uvicorn.Server(self.config).run(sockets=[sock])
+        except BaseException:
+            logger.exception("Worker failed")
+            code = 1
+        finally:
+            os._exit(code)
+
+    def _stop(self, signum, frame):
+        if self.stopping_since is None:
+            logger.info(f"Received {signal.Signals(signum).name}, stopping {len(self.children)} worker(s)")
+            self.stopping_since = time.monotonic()
+        for pid in self.children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def _reap(self) -> list[tuple[int, int, float]]:
+        """Exited workers as (pid, exit code, seconds they ran)."""
+        exited = []
+        while self.children:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                break
+            started = self.children.pop(pid, None)
+            if started is not None:
+                exited.append((pid, os.waitstatus_to_exitcode(status), time.monotonic() - started))
+        return exited
+
+    def run(self) -> int:
+        sock = self.config.bind_socket()
+        bus_directory = Path(tempfile.mkdtemp(prefix="backend-py-workers-"))
+        worker_bus.directory = bus_directory
+        worker_metrics.directory = bus_directory
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        logger.info(f"Starting {self.workers} workers on {self.config.host}:{self.config.port}")
+        failed = False
+        try:
+            for _ in range(self.workers):
+                self._spawn(sock)
+            while self.children:
+                time.sleep(0.1)
+                for pid, code, ran in self._reap():
+                    # A killed worker leaves its socket behind
+                    worker_bus.socket_path(pid).unlink(missing_ok=True)
+                    worker_metrics.worker_exited(pid)
+                    if self.stopping_since is not None:
+                        continue
+                    logger.error(f"Worker {pid} exited with {code} after {ran:.1f} s, starting a new one")
+                    if ran < CRASH_LOOP_SECONDS:
+                        time.sleep(CRASH_LOOP_SECONDS)
+                    self._spawn(sock)
+                if self.stopping_since is not None and time.monotonic() - self.stopping_since > self.stop_timeout:
+                    logger.error(f"Killing {len(self.children)} worker(s) still running after {self.stop_timeout:.0f} s")
+                    failed = True
+                    for pid in self.children:
+                        os.kill(pid, signal.SIGKILL)
+                    self.stop_timeout = float("inf")
+        finally:
+            sock.close()
+            shutil.rmtree(bus_directory, ignore_errors=True)
+        logger.info("All workers stopped")
+        return 1 if failed else 0
+
+
+def serve(app, config: ServingConfig, workers: int | None = None, **uvicorn_overrides) -> int:
+    """Serve the already imported `app`; blocks until the server is stopped."""
+    workers = workers or config.workers or default_workers()
+    server_config = uvicorn_config(app, config, **uvicorn_overrides)
+    loop = "uvloop" if find_spec("uvloop") else "asyncio"
+    http = "httptools" if find_spec("httptools") else "h11"
+    logger.info(f"Serving with {workers} worker(s), {loop} event loop, {http} HTTP parser")
+    if workers == 1:
+        uvicorn.Server(server_config).run()
+        return 0
+    stop_timeout = config.graceful_timeout_seconds + config.drain_timeout_seconds + KILL_GRACE_SECONDS
+    return Supervisor(server_config, workers, stop_timeout).run()
+
+
+def main() -> int:
+    config = serving_config or ServingConfig()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default=config.host)
+    parser.add_argument("--port", type=int, default=config.port)
+    parser.add_argument("--workers", type=int, default=config.workers, help="Default: one per CPU core")
+    args = parser.parse_args()
+    config = config.model_copy(update={"host": args.host, "port": args.port})
+
+    # Preload: imported once here, shared by the forked workers
+    from api.main import app
+
+    return serve(app, config, args.workers)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
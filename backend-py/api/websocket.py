@@ -6,6 +6,7 @@ import socketio
 from fastapi import APIRouter, Header, Query, WebSocket, WebSocketDisconnect
 
 from configs import get_logger, nodejs_backend_config
+from services.background import run_in_background
 from websocket.manager import ws_manager
 
 logger = get_logger("websocket")
@@ -22,33 +23,47 @@ async def forward_event_to_clients(event: str, data: dict):
     project_id = payload.get("projectId") or payload.get("project_id") or payload.get("_id")
     
     if project_id:
-        _ = asyncio.create_task(
+        # Every worker has its own relay connection and receives this event itself
+        run_in_background(
             ws_manager.broadcast_to_project(
                 str(project_id),
                 event,
-                payload
+                payload,
+                across_workers=False,
             )
         )
         logger.info(f"[RELAY] Forwarded {event} to project {project_id}")
     else:
         logger.warning(f"Event {event} missing projectId; cannot forward.")
 
+async def _connect():
+    try:
+        logger.info(f"Connecting to Node.js backend at {NODEJS_BACKEND_URL}...")
+        await sio.connect(
+            NODEJS_BACKEND_URL, 
+            transports=['websocket', 'polling'], 
+            wait_timeout=5
+        )
+        logger.info("Connected to Node.js backend")
+    except Exception as e:
+        logger.error(f"Failed to connect to Node.js backend: {e}")
+
+
+# Lần kết nối đang chạy; các lời gọi đồng thời dùng chung, không mở kết nối thứ hai
+_connecting: asyncio.Task | None = None
+
+
 async def ensure_connection():
     """
     Hàm này đảm bảo kết nối tới Node.js. 
     Nếu chưa kết nối sẽ thử kết nối.
     """
-    if not sio.connected:
-        try:
-            logger.info(f"Connecting to Node.js backend at {NODEJS_BACKEND_URL}...")
-            await sio.connect(
-                NODEJS_BACKEND_URL, 
-                transports=['websocket', 'polling'], 
-                wait_timeout=5
-            )
-            logger.info("Connected to Node.js backend")
-        except Exception as e:
-            logger.error(f"Failed to connect to Node.js backend: {e}")
+    global _connecting
+    if sio.connected:
+        return
+    if _connecting is None or _connecting.done():
+        _connecting = asyncio.create_task(_connect())
+    await asyncio.shield(_connecting)
 
 
 @sio.on('server:project_updated')
@@ -69,9 +84,14 @@ async def on_column_deleted(data):
 
 
 async def start_socketio_client():
-    await ensure_connection()
+    """Kết nối tới Node.js ở background: app sẵn sàng ngay, không chờ tới 5s khi Node.js không phản hồi."""
+    global _connecting
+    _connecting = asyncio.create_task(_connect())
 
 async def stop_socketio_client():
+    if _connecting is not None and not _connecting.done():
+        _connecting.cancel()
+        await asyncio.gather(_connecting, return_exceptions=True)
     if sio.connected:
         await sio.disconnect()
         logger.info("Disconnected from Node.js backend")
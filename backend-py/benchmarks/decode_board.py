@@ -0,0 +1,140 @@
+"""
+Microbenchmark for decoding Node.js board payloads.
+
+Compares the previous decoding path (`json.loads` followed by `model_validate`,
+which is what `aiohttp.ClientResponse.json()` did) with `ujson` and with
+pydantic's native `model_validate_json` on the raw response bytes.
+
+Usage:
+    python -m benchmarks.decode_board
+    python -m benchmarks.decode_board --sizes 100 1000 --repeat 20
+    python -m benchmarks.decode_board --payload recorded_board.json
+"""
+
+import argparse
+import base64
+import json
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+import ujson
+
+from migrate_nodejs_backend.projects import ProjectBoardResponse
+
+COLUMN_TITLES = ["To Do", "In Progress", "Review", "Done"]
+
+
+def _node_id(rng_uuid: uuid.UUID, as_base64: bool) -> str:
+    if as_base64:
+        return base64.b64encode(rng_uuid.bytes).decode()
+    return str(rng_uuid)
+
+
+def build_board_payload(task_count: int, base64_ids: bool = True) -> bytes:
+    """Build a board payload shaped like `GET /api/v1/projects/{id}/board` on Node.js."""
+    now = datetime.now(timezone.utc)
+    project_id = uuid.uuid4()
+    owner_id = uuid.uuid4()
+    members = [{"userId": _node_id(uuid.uuid4(), base64_ids), "role": "member"} for _ in range(20)]
+    members.append({"userId": _node_id(owner_id, base64_ids), "role": "owner"})
+    column_ids = [uuid.uuid4() for _ in COLUMN_TITLES]
+
+    columns: list[dict[str, Any]] = []
+    for index, (column_id, title) in enumerate(zip(column_ids, COLUMN_TITLES)):
+        tasks = [
+            {
+                "_id": _node_id(uuid.uuid4(), base64_ids),
+                "title": f"Task {task_index}",
+                "projectId": _node_id(project_id, base64_ids),
+                "columnId": _node_id(column_id, base64_ids),
+                "creatorId": _node_id(owner_id, base64_ids),
+                "assignees": [{"_id": _node_id(owner_id, base64_ids), "name": "Owner", "avatarUrl": None}],
+                "labels": [{"_id": _node_id(uuid.uuid4(), base64_ids), "text": "High Priority", "color": "#FF5733"}],
+                "dueDate": (now + timedelta(days=task_index % 30)).isoformat(),
+                "createdAt": now.isoformat(),
+                "updatedAt": now.isoformat(),
+            }
+            for task_index in range(index, task_count, len(COLUMN_TITLES))
+        ]
+        columns.append({
+            "_id": _node_id(column_id, base64_ids),
+            "title": title,
+            "projectId": _node_id(project_id, base64_ids),
+            "tasks": tasks,
+            "createdAt": now.isoformat(),
+            "updatedAt": now.isoformat(),
+            "__v": 0,
+        })
+
+    payload = {
+        "success": True,
+        "data": {
+            "project": {
+                "_id": _node_id(project_id, base64_ids),
+                "name": "Benchmark project",
+                "ownerId": _node_id(owner_id, base64_ids),
+                "members": members,
+                "columnOrder": [str(column_id) for column_id in column_ids],
+            },
+            "columns": columns,
+        },
+    }
+    return json.dumps(payload).encode()
+
+
+def decode_stdlib(body: bytes) -> ProjectBoardResponse:
+    return ProjectBoardResponse.model_validate(json.loads(body))
+
+
+def decode_ujson(body: bytes) -> ProjectBoardResponse:
+    return ProjectBoardResponse.model_validate(ujson.loads(body))
+
+
+def decode_native(body: bytes) -> ProjectBoardResponse:
+    return ProjectBoardResponse.model_validate_json(body)
+
+
+DECODERS: dict[str, Callable[[bytes], ProjectBoardResponse]] = {
+    "json.loads + model_validate": decode_stdlib,
+    "ujson.loads + model_validate": decode_ujson,
+    "model_validate_json": decode_native,
+}
+
+
+def run(label: str, body: bytes, repeat: int) -> None:
+    print(f"\n{label}: {len(body) / 1024:.1f} KiB")
+    for name, decoder in DECODERS.items():
+        decoder(body)  # warm up
+        timings: list[float] = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            decoder(body)
+            timings.append((time.perf_counter() - started) * 1000)
+        print(
+            f"  {name:<32} median {statistics.median(timings):8.2f} ms"
+            f"   min {min(timings):8.2f} ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000], help="Task counts to generate")
+    parser.add_argument("--repeat", type=int, default=10, help="Iterations per decoder")
+    parser.add_argument("--payload", type=Path, nargs="*", default=[], help="Recorded board responses to decode")
+    parser.add_argument("--uuid-ids", action="store_true", help="Generate UUID string ids instead of base64 ids")
+    args = parser.parse_args()
+
+    for path in args.payload:
+        run(str(path), path.read_bytes(), args.repeat)
+
+    if not args.payload:
+        for size in args.sizes:
+            run(f"{size} tasks", build_board_payload(size, base64_ids=not args.uuid_ids), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Peak memory per list request as the collections grow.
+
+Seeds `<mongo.db_name>_bench` with increasing numbers of tasks assigned to
+one user, then calls the search router endpoints directly and records the
+tracemalloc peak of each request, paged with `limit` (the endpoints return
+every match without one). Paged, streamed endpoints should allocate the same
+for 10k and 200k tasks; the run exits with status 1 if any
+endpoint's peak grows by more than `--max-growth` from the smallest dataset
+to the largest.
+
+Usage (needs the MongoDB from app-config.yaml):
+    python -m benchmarks.list_memory
+    python -m benchmarks.list_memory --sizes 10000 50000 200000 --max-growth 1.25
+"""
+
+import argparse
+import asyncio
+import sys
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from api.router import search
+from clients import Clients
+from configs import mongo_config
+from mongo.schemas import ChecklistItem, ProjectMember, Projects, Tasks, Users
+
+BENCH_USER_ID = uuid.UUID("00000000-0000-4000-8000-000000000002")
+PROJECTS = 100
+SEARCH_PAGE_SIZE = 50
+MY_ITEMS_PAGE_SIZE = 500
+
+
+async def seed(task_count: int) -> Users:
+    await Users.find(Users.id == BENCH_USER_ID).delete()
+    await Projects.delete_all()
+    await Tasks.delete_all()
+
+    user = Users(id=BENCH_USER_ID, name="Benchmark", email="list-memory@example.com", passwordHash="x")
+    await user.insert()
+    projects = [
+        Projects(
+            name=f"Project {index}",
+            workspaceId=uuid.uuid4(),
+            ownerId=BENCH_USER_ID,
+            members=[ProjectMember(userId=BENCH_USER_ID, role="owner")],
+        )
+        for index in range(PROJECTS)
+    ]
+    await Projects.insert_many(projects)
+
+    now = datetime.now(timezone.utc)
+    batch: list[Tasks] = []
+    for index in range(task_count):
+        batch.append(Tasks(
+            title=f"Task {index}",
+            description="Lorem ipsum dolor sit amet. " * 20,
+            projectId=projects[index % PROJECTS].id,
+            columnId=uuid.uuid4(),
+            creatorId=BENCH_USER_ID,
+            assignees=[BENCH_USER_ID],
+            dueDate=None if index % 4 == 0 else now + timedelta(hours=index % 1000),
+            checklists=[ChecklistItem(text=f"Item {item}") for item in range(5)],
+        ))
+        if len(batch) == 5_000:
+            await Tasks.insert_many(batch)
+            batch = []
+    if batch:
+        await Tasks.insert_many(batch)
+    return user
+
+
+def endpoints(user: Users):
+    return {
+        "my tasks": lambda: search.get_my_tasks(user, limit=MY_ITEMS_PAGE_SIZE),
+        "my tasks (deep page)": lambda: search.get_my_tasks(user, skip=5_000, limit=MY_ITEMS_PAGE_SIZE),
+        "search tasks": lambda: search.search_tasks("task 1", user, limit=SEARCH_PAGE_SIZE),
+        "my projects": lambda: search.get_my_projects(user, limit=MY_ITEMS_PAGE_SIZE),
+    }
+
+
+async def peak_of(call) -> float:
+    tracemalloc.start()
+    await call()
+    peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    return peak
+
+
+async def run(args) -> int:
+    mongo_client = Clients.get_mongo_client()
+    mongo_client.db = mongo_client.client[f"{mongo_config.db_name}_bench"]
+    await mongo_client.initialize()
+
+    peaks: dict[str, list[float]] = {}
+    for size in args.sizes:
+        user = await seed(size)
+        for name, call in endpoints(user).items():
+            await call()  # warm up the connection pool and pydantic validators
+            peaks.setdefault(name, []).append(await peak_of(call))
+
+    print(f"{'endpoint':<22}" + "".join(f"{size:>12}" for size in args.sizes) + f"{'growth':>9}")
+    failed = False
+    for name, values in peaks.items():
+        growth = values[-1] / values[0] if values[0] else 1.0
+        failed |= growth > args.max_growth
+        print(f"{name:<22}" + "".join(f"{value:>10.2f}MB" for value in values) + f"{growth:>8.2f}x")
+
+    await mongo_client.close()
+    if failed:
+        print(f"\nPeak memory grew more than {args.max_growth}x with collection size")
+        return 1
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 50_000, 200_000], help="Task counts")
+    parser.add_argument("--max-growth", type=float, default=1.5, help="Allowed peak ratio largest/smallest")
+    sys.exit(asyncio.run(run(parser.parse_args())))
+
+
+if __name__ == "__main__":
+    main()
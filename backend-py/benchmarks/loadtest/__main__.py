@@ -0,0 +1,208 @@
+"""
+End-to-end load test of the Python API.
+
+1. Seeds `<mongo.db_name>_loadtest` with synthetic data (`seed.py`), unless
+   `--manifest` points at the manifest of an earlier seed.
+2. Starts the fake Node.js backend (`fake_nodejs.py`) and the API
+   (`server.py`, configured for that database and that backend), each in its
+   own process.
+3. Runs the load driver (`driver.py`) and writes throughput, p50/p95/p99 per
+   endpoint and WebSocket fan-out latency to `--output` as JSON, and compares
+   it with `--baseline` when given (`compare.py`).
+
+With several `--workers` counts the API is restarted with each in turn
+against the same data, one results file per count (`-w<count>` appended to
+`--output`), and every run is compared with the first: single process
+against multi-worker throughput and latency.
+
+Needs a local MongoDB (database-mongo/docker-compose.yaml, or
+docker-compose.replset.yaml for change streams) and SECRET_KEY/ALGORITHM in
+`.env`, which the API uses to verify the seeded users' tokens.
+
+Usage:
+    python -m benchmarks.loadtest --duration 30 --concurrency 20
+    python -m benchmarks.loadtest --migration-mode native --baseline baseline.json
+    python -m benchmarks.loadtest --manifest loadtest-manifest.json --endpoints get_task update_task
+    python -m benchmarks.loadtest --workers 1 4
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import aiohttp
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from benchmarks.loadtest import fake_nodejs, server
+from benchmarks.loadtest.compare import compare
+from benchmarks.loadtest.driver import ENDPOINTS, LoadDriver
+from benchmarks.loadtest.seed import add_scale_arguments, scale_from_args, seed
+from clients.mongo_client import client_options
+from configs import mongo_config, nodejs_backend_config
+
+
+async def wait_until_up(url: str, timeout: float = 30):
+    deadline = time.monotonic() + timeout
+    async with aiohttp.ClientSession() as session:
+        while True:
+            try:
+                async with session.get(url) as response:
+                    if response.status < 500:
+                        return
+            except aiohttp.ClientError:
+                pass
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"{url} did not come up within {timeout:.0f} s")
+            await asyncio.sleep(0.2)
+
+
+async def prepare_manifest(args: argparse.Namespace) -> dict:
+    if args.manifest and Path(args.manifest).exists():
+        print(f"Using existing manifest {args.manifest}")
+        return json.loads(Path(args.manifest).read_text())
+    client = AsyncIOMotorClient(args.uri, **client_options(mongo_config))
+    try:
+        started = time.perf_counter()
+        manifest = await seed(client[args.db], scale_from_args(args), args.seed)
+        print(f"Seeded {args.db} in {time.perf_counter() - started:.1f} s: {manifest['counts']}")
+    finally:
+        client.close()
+    if args.manifest:
+        Path(args.manifest).write_text(json.dumps(manifest))
+    return manifest
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True).stdout.strip() or None
+    except OSError:
+        return None
+
+
+def run_load(args: argparse.Namespace, manifest: dict, processes, workers: int, output: Path) -> dict:
+    """Start the API with `workers` workers, run the load driver against it and write the results to `output`."""
+    api = processes.Process(
+        target=server.serve_api,
+        args=(args.api_port, args.uri, args.db, f"http://127.0.0.1:{args.nodejs_port}", args.migration_mode, workers),
+        daemon=True,
+    )
+    api.start()
+    base_url = f"http://127.0.0.1:{args.api_port}"
+    try:
+        asyncio.run(wait_until_up(f"{base_url}/health/ready"))
+        print(
+            f"\nLoad: {args.concurrency} clients for {args.duration:.0f} s against {base_url} "
+            f"({args.migration_mode} mode, {workers} worker(s))"
+        )
+        driver = LoadDriver(
+            base_url,
+            manifest,
+            endpoints=args.endpoints,
+            concurrency=args.concurrency,
+            ws_projects=args.ws_projects,
+            ws_clients=args.ws_clients,
+            seed=args.seed,
+        )
+        report = asyncio.run(driver.run(args.duration))
+    finally:
+        api.terminate()
+        api.join()
+
+    results = {
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "git_commit": git_commit(),
+        "python": sys.version.split()[0],
+        "settings": {
+            "migration_mode": args.migration_mode,
+            "workers": workers,
+            "duration_s": args.duration,
+            "concurrency": args.concurrency,
+            "endpoints": args.endpoints or sorted(ENDPOINTS),
+            "nodejs_latency_ms": args.nodejs_latency_ms,
+            "ws_projects": args.ws_projects,
+            "ws_clients": args.ws_clients,
+            "scale": manifest["scale"],
+        },
+        **report,
+    }
+    output.write_text(json.dumps(results, indent=2))
+
+    print(f"\n{'endpoint':<20} {'count':>7} {'errors':>7} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for name, stats in [*report["endpoints"].items(), ("TOTAL", report["total"]), ("ws_fanout", report["ws_fanout"])]:
+        if not stats.get("count"):
+            print(f"{name:<20} {stats.get('count', 0):>7} {stats.get('errors', 0):>7}")
+            continue
+        print(
+            f"{name:<20} {stats['count']:>7} {stats.get('errors', '-'):>7} {stats['rps']:>8.1f} "
+            f"{stats['p50_ms']:>8.1f} {stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f}"
+        )
+    if report["ws_fanout"].get("missed"):
+        print(f"ws_fanout: {report['ws_fanout']['missed']} of {report['ws_fanout']['expected']} deliveries missing")
+    for name, sample in report["error_samples"].items():
+        print(f"first {name} error: {sample}")
+    print(f"\nResults written to {output}")
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--uri", default=mongo_config.uri, help="MongoDB to seed and serve from (default: mongo.uri)")
+    parser.add_argument("--db", default=f"{mongo_config.db_name}_loadtest")
+    parser.add_argument("--manifest", help="Reuse this seed manifest if it exists, else write it after seeding")
+    add_scale_arguments(parser)
+    parser.add_argument("--api-port", type=int, default=8445)
+    parser.add_argument("--nodejs-port", type=int, default=8446)
+    parser.add_argument("--nodejs-latency-ms", type=float, default=5, help="Delay of every fake Node.js response")
+    parser.add_argument("--migration-mode", choices=["proxy", "shadow", "native"], default=nodejs_backend_config.migration_mode)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1], help="API worker counts, one run each")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds of load")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent HTTP clients")
+    parser.add_argument("--endpoints", nargs="+", choices=sorted(ENDPOINTS), help="Subset of the request mix")
+    parser.add_argument("--ws-projects", type=int, default=2, help="Project rooms with WebSocket clients")
+    parser.add_argument("--ws-clients", type=int, default=10, help="WebSocket clients per room")
+    parser.add_argument("--output", default="loadtest-results.json")
+    parser.add_argument("--baseline", type=Path, help="Earlier results to compare with")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative change reported as a regression")
+    args = parser.parse_args()
+
+    manifest = asyncio.run(prepare_manifest(args))
+
+    processes = multiprocessing.get_context("spawn")
+    nodejs = processes.Process(
+        target=fake_nodejs.serve,
+        args=(args.nodejs_port, args.nodejs_latency_ms, args.tasks_per_column * args.columns, args.projects, args.members),
+        daemon=True,
+    )
+    nodejs.start()
+    runs = []
+    try:
+        asyncio.run(wait_until_up(f"http://127.0.0.1:{args.nodejs_port}/"))
+        for workers in args.workers:
+            output = Path(args.output)
+            if len(args.workers) > 1:
+                output = output.with_name(f"{output.stem}-w{workers}{output.suffix}")
+            runs.append(run_load(args, manifest, processes, workers, output))
+    finally:
+        nodejs.terminate()
+        nodejs.join()
+
+    regressions = []
+    for results in runs[1:]:
+        print(f"\n{runs[0]['settings']['workers']} worker(s) -> {results['settings']['workers']} workers")
+        compare(runs[0], results, args.threshold)
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        for results in runs:
+            print(f"\nBaseline -> {results['settings']['workers']} worker(s)")
+            regressions += compare(baseline, results, args.threshold)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,62 @@
+"""
+Compare two load-test result files, endpoint by endpoint.
+
+Prints p50/p95/p99 and throughput of both runs with the relative change, and
+exits with status 1 when a latency percentile grew, or throughput dropped,
+by more than `--threshold` (default 10%).
+
+Usage:
+    python -m benchmarks.loadtest.compare baseline.json loadtest-results.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+LATENCY_KEYS = ("p50_ms", "p95_ms", "p99_ms")
+
+
+def _change(before: float, after: float) -> float:
+    return (after - before) / before if before else 0.0
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any], threshold: float) -> list[str]:
+    """Print the comparison; returns the regressions found."""
+    rows = {**baseline["endpoints"], **current["endpoints"]}
+    sections = [(name, baseline["endpoints"].get(name), current["endpoints"].get(name)) for name in sorted(rows)]
+    sections.append(("ws_fanout", baseline.get("ws_fanout"), current.get("ws_fanout")))
+
+    regressions = []
+    print(f"{'endpoint':<20} {'metric':<8} {'baseline':>10} {'current':>10} {'change':>8}")
+    for name, before, after in sections:
+        if not before or not after or not before.get("count") or not after.get("count"):
+            print(f"{name:<20} {'-':<8} {'missing in one run':>30}")
+            continue
+        # Fan-out deliveries per second follow the update rate, not fan-out speed
+        for key in LATENCY_KEYS if name == "ws_fanout" else (*LATENCY_KEYS, "rps"):
+            change = _change(before[key], after[key])
+            regressed = -change > threshold if key == "rps" else change > threshold
+            flag = "  <-- regression" if regressed else ""
+            print(f"{name:<20} {key:<8} {before[key]:>10.2f} {after[key]:>10.2f} {change:>+8.1%}{flag}")
+            if regressed:
+                regressions.append(f"{name} {key} {change:+.1%}")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative change reported as a regression")
+    args = parser.parse_args()
+    regressions = compare(json.loads(args.baseline.read_text()), json.loads(args.current.read_text()), args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s): " + ", ".join(regressions))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""
+Asyncio load driver: `concurrency` closed-loop clients issuing a weighted mix of
+API requests for `duration` seconds, and WebSocket clients in a few project
+rooms measuring how long task updates take to reach them.
+
+Each request is made by a member of the project it targets, with the JWT from
+the seed manifest. Task updates set a title carrying a sequence number; the
+WebSocket clients look it up when the `server:task_updated` event arrives, so
+fan-out latency is measured from the moment the PATCH was sent to the moment
+each client received the event.
+"""
+
+import asyncio
+import json
+import random
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+import aiohttp
+
+SEARCH_WORDS = ["deploy", "billing", "search", "login", "report", "webhook"]
+
+Request = tuple[str, str, dict[str, Any] | None]
+
+
+@dataclass
+class Endpoint:
+    weight: int
+    build: Callable[[dict[str, Any], random.Random], Request]
+
+
+def _update_task(project: dict[str, Any], rng: random.Random) -> Request:
+    # The title is replaced by the driver with one carrying the sequence number
+    return "PATCH", f"/api/v1/tasks/{rng.choice(project['tasks'])}", {"title": ""}
+
+
+ENDPOINTS: dict[str, Endpoint] = {
+    "get_task": Endpoint(20, lambda p, rng: ("GET", f"/api/v1/tasks/{rng.choice(p['tasks'])}", None)),
+    "get_column": Endpoint(10, lambda p, rng: ("GET", f"/api/v1/columns/{rng.choice(p['columns'])}", None)),
+    "get_board": Endpoint(15, lambda p, rng: ("GET", f"/api/v1/projects/{p['id']}/board", None)),
+    "get_project": Endpoint(5, lambda p, rng: ("GET", f"/api/v1/projects/{p['id']}", None)),
+    "workspace_projects": Endpoint(5, lambda p, rng: ("GET", f"/api/v1/workspaces/{p['workspace_id']}/projects", None)),
+    "joined_projects": Endpoint(5, lambda p, rng: ("GET", "/api/v1/workspaces/joined_projects", None)),
+    "search_tasks": Endpoint(
+        10, lambda p, rng: ("GET", f"/api/v1/search/tasks/search?query={rng.choice(SEARCH_WORDS)}", None)
+    ),
+    "my_tasks": Endpoint(10, lambda p, rng: ("GET", "/api/v1/search/me/tasks", None)),
+    "dashboard": Endpoint(5, lambda p, rng: ("GET", f"/api/v1/projects/{p['id']}/dashboard", None)),
+    "update_task": Endpoint(15, _update_task),
+}
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    values = sorted(values)
+    return values[max(int(len(values) * fraction + 0.5) - 1, 0)]
+
+
+def summarize(latencies_ms: list[float], errors: int, elapsed: float) -> dict[str, Any]:
+    if not latencies_ms:
+        return {"count": 0, "errors": errors}
+    return {
+        "count": len(latencies_ms),
+        "errors": errors,
+        "rps": round(len(latencies_ms) / elapsed, 2),
+        "mean_ms": round(statistics.fmean(latencies_ms), 2),
+        "p50_ms": round(percentile(latencies_ms, 0.50), 2),
+        "p95_ms": round(percentile(latencies_ms, 0.95), 2),
+        "p99_ms": round(percentile(latencies_ms, 0.99), 2),
+        "max_ms": round(max(latencies_ms), 2),
+    }
+
+
+@dataclass
+class LoadResult:
+    latencies: dict[str, list[float]] = field(default_factory=dict)
+    errors: dict[str, int] = field(default_factory=dict)
+    error_samples: dict[str, str] = field(default_factory=dict)
+    fanout: list[float] = field(default_factory=list)
+    fanout_expected: int = 0
+    elapsed: float = 0
+
+    def report(self) -> dict[str, Any]:
+        endpoints = {
+            name: summarize(self.latencies.get(name, []), self.errors.get(name, 0), self.elapsed)
+            for name in sorted(set(self.latencies) | set(self.errors))
+        }
+        all_latencies = [value for values in self.latencies.values() for value in values]
+        fanout = summarize(self.fanout, 0, self.elapsed)
+        fanout.pop("errors")
+        fanout["expected"] = self.fanout_expected
+        fanout["missed"] = max(self.fanout_expected - len(self.fanout), 0)
+        return {
+            "duration_s": round(self.elapsed, 2),
+            "total": summarize(all_latencies, sum(self.errors.values()), self.elapsed),
+            "endpoints": endpoints,
+            "ws_fanout": fanout,
+            "error_samples": self.error_samples,
+        }
+
+
+class LoadDriver:
+    def __init__(
+        self,
+        base_url: str,
+        manifest: dict[str, Any],
+        endpoints: list[str] | None = None,
+        concurrency: int = 20,
+        ws_projects: int = 2,
+        ws_clients: int = 10,
+        seed: int = 0,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.projects: list[dict[str, Any]] = manifest["projects"]
+        self.tokens: dict[str, str] = manifest["tokens"]
+        self.endpoints = {name: ENDPOINTS[name] for name in (endpoints or ENDPOINTS)}
+        self.concurrency = concurrency
+        self.ws_room_projects = self.projects[:ws_projects]
+        self.ws_clients = ws_clients
+        self.rng = random.Random(seed)
+        self.result = LoadResult()
+        # sequence number -> (send time, project id) of task updates in WS rooms
+        self._sent: dict[int, tuple[float, str]] = {}
+        self._sequence = 0
+
+    def _record(self, name: str, started: float, error: str | None):
+        if error is None:
+            self.result.latencies.setdefault(name, []).append((time.perf_counter() - started) * 1000)
+        else:
+            self.result.errors[name] = self.result.errors.get(name, 0) + 1
+            self.result.error_samples.setdefault(name, error[:300])
+
+    async def _request(self, session: aiohttp.ClientSession, name: str):
+        project = self.rng.choice(self.ws_room_projects if name == "update_task" and self.ws_room_projects else self.projects)
+        method, path, body = self.endpoints[name].build(project, self.rng)
+        headers = {"Authorization": f"Bearer {self.tokens[self.rng.choice(project['members'])]}"}
+        started = time.perf_counter()
+        if name == "update_task":
+            self._sequence += 1
+            body = {"title": f"Load test update #{self._sequence}"}
+            self._sent[self._sequence] = (started, project["id"])
+            if project in self.ws_room_projects:
+                self.result.fanout_expected += self.ws_clients
+        try:
+            async with session.request(method, self.base_url + path, json=body, headers=headers) as response:
+                await response.read()
+                error = None if response.status < 400 else f"{response.status}: {(await response.text())}"
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            error = repr(e)
+        self._record(name, started, error)
+
+    async def _client(self, session: aiohttp.ClientSession, deadline: float):
+        names = list(self.endpoints)
+        weights = [self.endpoints[name].weight for name in names]
+        while time.perf_counter() < deadline:
+            await self._request(session, self.rng.choices(names, weights)[0])
+
+    async def _ws_listener(self, session: aiohttp.ClientSession, project_id: str, ready: asyncio.Event):
+        ws_url = self.base_url.replace("http", "ws", 1) + f"/ws/projects/{project_id}"
+        async with session.ws_connect(ws_url) as ws:
+            ready.set()
+            async for message in ws:
+                if message.type != aiohttp.WSMsgType.TEXT:
+                    break
+                received = time.perf_counter()
+                payload = json.loads(message.data)
+                if payload.get("event") != "server:task_updated":
+                    continue
+                title = (payload.get("data") or {}).get("title", "")
+                _, _, sequence = title.rpartition("#")
+                sent = self._sent.get(int(sequence)) if sequence.isdigit() else None
+                if sent is not None and sent[1] == project_id:
+                    self.result.fanout.append((received - sent[0]) * 1000)
+
+    async def run(self, duration: float) -> dict[str, Any]:
+        timeout = aiohttp.ClientTimeout(total=30)
+        connector = aiohttp.TCPConnector(limit=self.concurrency + len(self.ws_room_projects) * self.ws_clients)
+        async with aiohttp.ClientSession(timeout=timeout, connector=connector) as session:
+            listeners, ready = [], []
+            for project in self.ws_room_projects:
+                for _ in range(self.ws_clients):
+                    event = asyncio.Event()
+                    ready.append(event)
+                    listeners.append(asyncio.create_task(self._ws_listener(session, project["id"], event)))
+            await asyncio.wait_for(asyncio.gather(*(event.wait() for event in ready)), timeout=30)
+
+            started = time.perf_counter()
+            await asyncio.gather(*(self._client(session, started + duration) for _ in range(self.concurrency)))
+            self.result.elapsed = time.perf_counter() - started
+
+            # Let the last broadcasts arrive
+            await asyncio.sleep(1)
+            for listener in listeners:
+                listener.cancel()
+            await asyncio.gather(*listeners, return_exceptions=True)
+        return self.result.report()
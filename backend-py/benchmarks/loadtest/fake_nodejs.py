@@ -0,0 +1,121 @@
+"""
+Fake Node.js backend for the routes the Python API still proxies.
+
+Answers `GET /projects/{id}`, `/projects/{id}/board`, `/projects/{id}/dashboard`
+and `/workspaces/{id}/projects` with synthetic bodies shaped like Node.js's
+(base64 ids, populated owners), after `latency_ms`, so proxied endpoints can
+be load tested without Node.js or its database. Bodies are built once per
+size and reused: the fake's own cost stays out of the measurement.
+
+Usage:
+    python -m benchmarks.loadtest.fake_nodejs --port 8346 --latency-ms 5
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import uuid
+from datetime import datetime, timezone
+
+from aiohttp import web
+
+from benchmarks.decode_board import build_board_payload
+from benchmarks.passthrough import build_projects_payload
+
+
+def _b64_id() -> str:
+    return base64.b64encode(uuid.uuid4().bytes).decode()
+
+
+def build_project_payload(members: int) -> bytes:
+    now = datetime.now(timezone.utc).isoformat()
+    owner = {"_id": _b64_id(), "name": "Owner", "email": "owner@example.com", "avatarUrl": None}
+    return json.dumps({
+        "success": True,
+        "data": {
+            "_id": _b64_id(),
+            "name": "Load test project",
+            "description": "Served by the fake Node.js backend",
+            "workspaceId": _b64_id(),
+            "ownerId": owner,
+            "members": [{"userId": owner, "role": "owner"}] + [
+                {"userId": {"_id": _b64_id(), "name": f"Member {index}", "email": f"m{index}@example.com"}, "role": "member"}
+                for index in range(members - 1)
+            ],
+            "status": "active",
+            "columnOrder": [str(uuid.uuid4()) for _ in range(4)],
+            "taskStats": {"open": 10, "closed": 5},
+            "createdAt": now,
+            "updatedAt": now,
+        },
+    }).encode()
+
+
+def build_dashboard_payload() -> bytes:
+    return json.dumps({
+        "success": True,
+        "data": {
+            "totalTasks": 0,
+            "to_do_tasks": 0,
+            "in_progress_tasks": 0,
+            "done_tasks": 0,
+            "review_tasks": 0,
+            "overdue_tasks": 0,
+            "overdue_task_lists": [],
+            "upcoming_deadlines_7d": [],
+            "completion_rate": 0.0,
+            "team_workload_list": [],
+        },
+    }).encode()
+
+
+def create_app(latency_ms: float = 5, board_tasks: int = 100, projects: int = 10, members: int = 10) -> web.Application:
+    bodies = {
+        "project": build_project_payload(members),
+        "board": build_board_payload(board_tasks),
+        "dashboard": build_dashboard_payload(),
+        "projects": build_projects_payload(projects),
+    }
+
+    def respond(name: str):
+        async def handler(_: web.Request) -> web.Response:
+            if latency_ms:
+                await asyncio.sleep(latency_ms / 1000)
+            return web.Response(body=bodies[name], content_type="application/json")
+
+        return handler
+
+    app = web.Application()
+    app.router.add_get("/api/v1/projects/{project_id}", respond("project"))
+    app.router.add_get("/api/v1/projects/{project_id}/board", respond("board"))
+    app.router.add_get("/api/v1/projects/{project_id}/dashboard", respond("dashboard"))
+    app.router.add_get("/api/v1/workspaces/{workspace_id}/projects", respond("projects"))
+    return app
+
+
+def serve(port: int, latency_ms: float, board_tasks: int, projects: int, members: int):
+    """Blocking; the load test runs it in its own process."""
+    web.run_app(
+        create_app(latency_ms, board_tasks, projects, members),
+        host="127.0.0.1",
+        port=port,
+        print=None,
+        access_log=None,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8346)
+    parser.add_argument("--latency-ms", type=float, default=5, help="Delay before every response")
+    parser.add_argument("--board-tasks", type=int, default=100, help="Tasks on the served board")
+    parser.add_argument("--projects", type=int, default=10, help="Projects in the served workspace list")
+    parser.add_argument("--members", type=int, default=10, help="Members of the served project")
+    args = parser.parse_args()
+    print(f"Fake Node.js backend on http://127.0.0.1:{args.port}")
+    serve(args.port, args.latency_ms, args.board_tasks, args.projects, args.members)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,245 @@
+"""
+Synthetic data for the load test: users, workspaces, projects, columns, labels,
+tasks and comments at a configurable scale, written straight to Mongo.
+
+Documents have the shape Beanie writes; `init_beanie` creates the indexes
+first, and the derived collections (`memberships`, `boards`) are rebuilt when
+they are enabled. The returned manifest lists the ids the driver requests,
+and a JWT per user.
+
+Usage (drops and fills `<mongo.db_name>_loadtest`, writes the manifest):
+    python -m benchmarks.loadtest.seed --projects 20 --tasks-per-column 50
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import uuid
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+
+from clients.mongo_client import client_options
+from configs import mongo_config
+
+COLUMN_TITLES = ["To Do", "In Progress", "Review", "Done"]
+LABELS = [("High Priority", "#FF5733"), ("Bug", "#C70039"), ("Feature", "#2ECC71"), ("Chore", "#95A5A6")]
+WORDS = "deploy refactor billing search cache login export report upload webhook invoice sync".split()
+
+
+@dataclass
+class Scale:
+    users: int = 50
+    workspaces: int = 2
+    projects: int = 10  # per workspace
+    members: int = 10  # per project, owner included
+    columns: int = 4
+    tasks_per_column: int = 25
+    comments_per_task: int = 3
+    checklist_items: int = 3
+
+
+def _uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _title(rng: random.Random, index: int) -> str:
+    return f"{rng.choice(WORDS).title()} {rng.choice(WORDS)} #{index}"
+
+
+def build_documents(scale: Scale, seed: int = 0) -> dict[str, list[dict[str, Any]]]:
+    """Every document to insert, by collection name."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc).replace(microsecond=0)
+    docs: dict[str, list[dict[str, Any]]] = {
+        name: [] for name in ("users", "workspaces", "projects", "columns", "labels", "tasks", "comments")
+    }
+
+    users = [_uuid(rng) for _ in range(scale.users)]
+    for index, user_id in enumerate(users):
+        docs["users"].append({
+            "_id": user_id,
+            "name": f"Load user {index}",
+            "email": f"load{index}@example.com",
+            "passwordHash": "!",
+            "avatarUrl": None,
+            "createdAt": now,
+            "updatedAt": now,
+        })
+
+    task_index = 0
+    for workspace_index in range(scale.workspaces):
+        workspace_id = _uuid(rng)
+        owner_id = users[workspace_index % len(users)]
+        workspace_members = rng.sample(users, min(len(users), scale.members * 2))
+        docs["workspaces"].append({
+            "_id": workspace_id,
+            "name": f"Workspace {workspace_index}",
+            "ownerId": owner_id,
+            "members": [{"userId": user_id, "role": "member"} for user_id in workspace_members if user_id != owner_id],
+            "createdAt": now,
+            "updatedAt": now,
+        })
+
+        for project_index in range(scale.projects):
+            project_id = _uuid(rng)
+            candidates = [user_id for user_id in workspace_members if user_id != owner_id]
+            members = [owner_id, *rng.sample(candidates, min(len(candidates), scale.members - 1))]
+            column_ids = [_uuid(rng) for _ in range(scale.columns)]
+            label_ids = [_uuid(rng) for _ in LABELS]
+            stats = {"open": 0, "closed": 0}
+
+            for label_id, (text, color) in zip(label_ids, LABELS):
+                docs["labels"].append({"_id": label_id, "projectId": project_id, "text": text, "color": color})
+
+            for column_position, column_id in enumerate(column_ids):
+                task_ids = []
+                for _ in range(scale.tasks_per_column):
+                    task_id = _uuid(rng)
+                    task_ids.append(task_id)
+                    created = now - timedelta(minutes=rng.randrange(60 * 24 * 30))
+                    docs["tasks"].append({
+                        "_id": task_id,
+                        "title": _title(rng, task_index),
+                        "description": " ".join(rng.choices(WORDS, k=20)),
+                        "projectId": project_id,
+                        "columnId": column_id,
+                        "creatorId": rng.choice(members),
+                        "assignees": rng.sample(members, min(2, len(members))),
+                        "dueDate": created + timedelta(days=rng.randrange(1, 30)) if rng.random() < 0.7 else None,
+                        "labels": rng.sample(label_ids, 2),
+                        "checklists": [
+                            {"text": f"Step {item}", "checked": rng.random() < 0.5}
+                            for item in range(scale.checklist_items)
+                        ],
+                        "createdAt": created,
+                        "updatedAt": created,
+                    })
+                    for comment in range(scale.comments_per_task):
+                        docs["comments"].append({
+                            "_id": _uuid(rng),
+                            "taskId": task_id,
+                            "userId": rng.choice(members),
+                            "content": f"Comment {comment}: " + " ".join(rng.choices(WORDS, k=12)),
+                            "createdAt": created + timedelta(minutes=comment + 1),
+                        })
+                    task_index += 1
+                stats["closed" if column_position == len(column_ids) - 1 else "open"] += len(task_ids)
+                docs["columns"].append({
+                    "_id": column_id,
+                    "title": COLUMN_TITLES[column_position % len(COLUMN_TITLES)],
+                    "projectId": project_id,
+                    "taskOrder": task_ids,
+                    "createdAt": now + timedelta(seconds=column_position),
+                    "updatedAt": now + timedelta(seconds=column_position),
+                })
+
+            docs["projects"].append({
+                "_id": project_id,
+                "name": f"Project {workspace_index}.{project_index}",
+                "description": "Synthetic project for the load test",
+                "workspaceId": workspace_id,
+                "ownerId": owner_id,
+                "members": [{"userId": user_id, "role": "member"} for user_id in members[1:]],
+                "status": "active",
+                "deadline": None,
+                "columnOrder": column_ids,
+                "taskStats": stats,
+                "createdAt": now,
+                "updatedAt": now,
+            })
+    return docs
+
+
+def build_manifest(docs: dict[str, list[dict[str, Any]]]) -> dict[str, Any]:
+    """Ids the driver requests, grouped per project so every request is made by a member."""
+    from core.security import create_access_token
+
+    projects = []
+    for project in docs["projects"]:
+        columns = [column for column in docs["columns"] if column["projectId"] == project["_id"]]
+        members = [project["ownerId"], *(member["userId"] for member in project["members"])]
+        projects.append({
+            "id": str(project["_id"]),
+            "workspace_id": str(project["workspaceId"]),
+            "members": [str(user_id) for user_id in members],
+            "columns": [str(column["_id"]) for column in columns],
+            "tasks": [str(task_id) for column in columns for task_id in column["taskOrder"]],
+        })
+    return {
+        "projects": projects,
+        "tokens": {
+            str(user["_id"]): create_access_token({"sub": str(user["_id"])}, expires_delta=timedelta(days=1))
+            for user in docs["users"]
+        },
+    }
+
+
+async def seed(db: AsyncIOMotorDatabase, scale: Scale, seed: int = 0) -> dict[str, Any]:
+    """Drop `db`, fill it at `scale` and return the manifest."""
+    from beanie import init_beanie
+
+    from mongo.boards import boards_enabled, rebuild_board
+    from mongo.memberships import membership_index_enabled, rebuild_memberships
+    from mongo.schemas import DocumentModels
+
+    await db.client.drop_database(db.name)
+    await init_beanie(database=db, document_models=DocumentModels)
+    docs = build_documents(scale, seed)
+    for name, documents in docs.items():
+        for start in range(0, len(documents), 5_000):
+            await db[name].insert_many(documents[start:start + 5_000], ordered=False)
+    if membership_index_enabled():
+        await rebuild_memberships()
+    if boards_enabled():
+        for project in docs["projects"]:
+            await rebuild_board(project["_id"])
+
+    manifest = build_manifest(docs)
+    manifest["scale"] = asdict(scale)
+    manifest["counts"] = {name: len(documents) for name, documents in docs.items()}
+    return manifest
+
+
+def add_scale_arguments(parser: argparse.ArgumentParser):
+    defaults = Scale()
+    parser.add_argument("--users", type=int, default=defaults.users)
+    parser.add_argument("--workspaces", type=int, default=defaults.workspaces)
+    parser.add_argument("--projects", type=int, default=defaults.projects, help="Projects per workspace")
+    parser.add_argument("--members", type=int, default=defaults.members, help="Members per project")
+    parser.add_argument("--columns", type=int, default=defaults.columns)
+    parser.add_argument("--tasks-per-column", type=int, default=defaults.tasks_per_column)
+    parser.add_argument("--comments-per-task", type=int, default=defaults.comments_per_task)
+    parser.add_argument("--checklist-items", type=int, default=defaults.checklist_items)
+    parser.add_argument("--seed", type=int, default=0, help="Random seed, for reproducible data")
+
+
+def scale_from_args(args: argparse.Namespace) -> Scale:
+    return Scale(**{name: getattr(args, name) for name in asdict(Scale())})
+
+
+async def main_async(args: argparse.Namespace):
+    client = AsyncIOMotorClient(args.uri, **client_options(mongo_config))
+    try:
+        manifest = await seed(client[args.db], scale_from_args(args), args.seed)
+    finally:
+        client.close()
+    Path(args.manifest).write_text(json.dumps(manifest))
+    print(f"Seeded {args.db}: {manifest['counts']}; manifest written to {args.manifest}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--uri", default=mongo_config.uri, help="MongoDB to write to (default: mongo.uri)")
+    parser.add_argument("--db", default=f"{mongo_config.db_name}_loadtest")
+    parser.add_argument("--manifest", default="loadtest-manifest.json")
+    add_scale_arguments(parser)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
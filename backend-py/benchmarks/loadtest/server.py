@@ -0,0 +1,35 @@
+"""
+The API under test, run in its own process against the load-test database and
+the fake Node.js backend.
+
+Configuration is `app-config.yaml` with the overrides below applied before
+`api.main` is imported, so module-level values derived from it (the Node.js
+base URLs, the Mongo client) see them.
+"""
+
+from typing import Literal
+
+
+def serve_api(
+    port: int,
+    mongo_uri: str,
+    db_name: str,
+    nodejs_url: str,
+    migration_mode: Literal["proxy", "shadow", "native"] | None = None,
+    workers: int = 1,
+):
+    """Blocking; the load test runs it in its own process. More than one worker serves like `api.serve`."""
+    from configs import mongo_config, nodejs_backend_config, serving_config
+
+    mongo_config.uri = mongo_uri
+    mongo_config.db_name = db_name
+    nodejs_backend_config.domain = nodejs_url
+    if migration_mode is not None:
+        nodejs_backend_config.migration_mode = migration_mode
+
+    from api.main import app
+    from api.serve import serve
+    from configs.serving_config import ServingConfig
+
+    config = (serving_config or ServingConfig()).model_copy(update={"host": "127.0.0.1", "port": port})
+    serve(app, config, workers, log_level="warning")
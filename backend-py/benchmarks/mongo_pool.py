@@ -0,0 +1,96 @@
+"""
+Throughput and latency of concurrent reads for different Motor pool sizes.
+
+Every pool size gets a fresh client built with `clients.mongo_client.client_options`
+(so compression and timeouts come from app-config.yaml) and `--concurrency`
+coroutines issuing board-style reads (`tasks` of one project) for `--duration`
+seconds. A pool smaller than the concurrency makes requests queue for a
+connection; a much larger one only adds connections on the server.
+
+Usage (needs the MongoDB from app-config.yaml; seeds `<mongo.db_name>_bench`):
+    python -m benchmarks.mongo_pool
+    python -m benchmarks.mongo_pool --pool-sizes 5 20 100 --concurrency 200 --duration 10
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from clients.mongo_client import client_options
+from configs import mongo_config
+
+PROJECTS = 50
+TASKS_PER_PROJECT = 100
+
+
+async def seed(collection) -> list[uuid.UUID]:
+    await collection.drop()
+    project_ids = [uuid.uuid4() for _ in range(PROJECTS)]
+    await collection.insert_many([
+        {
+            "_id": uuid.uuid4(),
+            "projectId": project_id,
+            "title": f"Task {index}",
+            "description": "Lorem ipsum dolor sit amet. " * 10,
+        }
+        for project_id in project_ids
+        for index in range(TASKS_PER_PROJECT)
+    ])
+    await collection.create_index("projectId")
+    return project_ids
+
+
+async def worker(collection, project_ids: list[uuid.UUID], deadline: float, latencies: list[float]):
+    index = 0
+    while time.perf_counter() < deadline:
+        project_id = project_ids[index % len(project_ids)]
+        index += 1
+        started = time.perf_counter()
+        await collection.find({"projectId": project_id}).to_list(None)
+        latencies.append((time.perf_counter() - started) * 1000)
+
+
+async def run_pool(pool_size: int, concurrency: int, duration: float, project_ids: list[uuid.UUID]) -> str:
+    options = {**client_options(mongo_config), "maxPoolSize": pool_size, "minPoolSize": 0}
+    client = AsyncIOMotorClient(mongo_config.uri, **options)
+    collection = client[f"{mongo_config.db_name}_bench"]["pool_tasks"]
+    await collection.find_one()
+
+    latencies: list[float] = []
+    deadline = time.perf_counter() + duration
+    await asyncio.gather(*(worker(collection, project_ids, deadline, latencies) for _ in range(concurrency)))
+    client.close()
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99) - 1]
+    return (
+        f"{pool_size:>5} {len(latencies) / duration:>10.0f} "
+        f"{statistics.median(latencies):>9.2f} {p99:>9.2f}"
+    )
+
+
+async def main_async(args):
+    client = AsyncIOMotorClient(mongo_config.uri, **client_options(mongo_config))
+    project_ids = await seed(client[f"{mongo_config.db_name}_bench"]["pool_tasks"])
+    client.close()
+
+    print(f"concurrency={args.concurrency} duration={args.duration}s compressors={mongo_config.compressors or 'none'}")
+    print(f"{'pool':>5} {'req/s':>10} {'p50 ms':>9} {'p99 ms':>9}")
+    for pool_size in args.pool_sizes:
+        print(await run_pool(pool_size, args.concurrency, args.duration, project_ids))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pool-sizes", type=int, nargs="+", default=[1, 5, 10, 25, 50, 100])
+    parser.add_argument("--concurrency", type=int, default=100, help="Concurrent request coroutines")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds per pool size")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Memory and CPU per request for the decoding proxy path vs. passthrough streaming.
+
+Starts a local aiohttp server that serves a synthetic `GET /workspaces/{id}/projects`
+body of the requested size, then fetches it through:
+
+- decode:       get_projects() -> pydantic models -> FastAPI-style JSON serialization
+- stream:       stream_projects() with passthrough_rewrite_ids disabled
+- stream+ids:   stream_projects() rewriting base64 ids while streaming
+
+Usage:
+    python -m benchmarks.passthrough
+    python -m benchmarks.passthrough --projects 1000 20000 --repeat 5
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import statistics
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timezone
+
+from aiohttp import web
+
+from configs import nodejs_backend_config
+from migrate_nodejs_backend import workspaces
+
+
+def _b64_id() -> str:
+    return base64.b64encode(uuid.uuid4().bytes).decode()
+
+
+def build_projects_payload(project_count: int) -> bytes:
+    now = datetime.now(timezone.utc).isoformat()
+    workspace_id = _b64_id()
+    projects = []
+    for index in range(project_count):
+        owner_id = _b64_id()
+        projects.append({
+            "_id": _b64_id(),
+            "name": f"Project {index}",
+            "description": "Synthetic project used by the passthrough benchmark",
+            "workspaceId": workspace_id,
+            "ownerId": {"_id": owner_id, "name": "Owner", "avatarUrl": None},
+            "members": [{"userId": owner_id, "role": "owner"}] + [
+                {"userId": _b64_id(), "role": "member"} for _ in range(5)
+            ],
+            "status": "active",
+            "taskStats": {"open": index % 17, "closed": index % 5},
+            "createdAt": now,
+            "updatedAt": now,
+        })
+    return json.dumps({"success": True, "count": project_count, "data": projects}).encode()
+
+
+async def _decode(workspace_id: str) -> int:
+    result = await workspaces.get_projects(workspace_id=workspace_id, token="benchmark")
+    return len(json.dumps(result.model_dump(mode="json")).encode())
+
+
+async def _stream(workspace_id: str) -> int:
+    response = await workspaces.stream_projects(workspace_id=workspace_id, token="benchmark")
+    size = 0
+    async for chunk in response.body_iterator:
+        size += len(chunk)
+    return size
+
+
+async def _measure(name: str, fetch, repeat: int) -> None:
+    await fetch("warmup")
+    cpu: list[float] = []
+    wall: list[float] = []
+    peaks: list[int] = []
+    size = 0
+    for _ in range(repeat):
+        tracemalloc.start()
+        cpu_started, wall_started = time.process_time(), time.perf_counter()
+        size = await fetch("workspace")
+        cpu.append((time.process_time() - cpu_started) * 1000)
+        wall.append((time.perf_counter() - wall_started) * 1000)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    print(
+        f"  {name:<12} cpu {statistics.median(cpu):8.1f} ms"
+        f"   wall {statistics.median(wall):8.1f} ms"
+        f"   peak {max(peaks) / 1024 / 1024:7.2f} MiB"
+        f"   out {size / 1024:8.1f} KiB"
+    )
+
+
+async def run(project_counts: list[int], repeat: int) -> None:
+    body = b""
+
+    async def handler(_: web.Request) -> web.Response:
+        return web.Response(body=body, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/api/v1/workspaces/{workspace_id}/projects", handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    workspaces.BASE_URL = f"http://127.0.0.1:{port}"
+
+    try:
+        for count in project_counts:
+            body = build_projects_payload(count)
+            print(f"\n{count} projects: upstream body {len(body) / 1024:.1f} KiB")
+            await _measure("decode", _decode, repeat)
+            nodejs_backend_config.passthrough_rewrite_ids = False
+            await _measure("stream", _stream, repeat)
+            nodejs_backend_config.passthrough_rewrite_ids = True
+            await _measure("stream+ids", _stream, repeat)
+    finally:
+        await runner.cleanup()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, nargs="+", default=[100, 1_000, 10_000], help="Projects per payload")
+    parser.add_argument("--repeat", type=int, default=5, help="Requests per path")
+    args = parser.parse_args()
+    asyncio.run(run(args.projects, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
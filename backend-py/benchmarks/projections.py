@@ -0,0 +1,199 @@
+"""
+Bytes transferred and allocations per list request: full documents vs projection models.
+
+Seeds a separate database (default: `<mongo.db_name>_bench`) with one user
+assigned to `--tasks` tasks spread over `--projects` projects, each task with
+a long description and a checklist, then runs every list query twice:
+hydrating full Beanie documents, and through the `mongo.projections` view
+used by the routers.
+
+Usage (needs the MongoDB from app-config.yaml):
+    python -m benchmarks.projections --seed
+    python -m benchmarks.projections --tasks 100000 --repeat 3
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import bson
+from beanie import init_beanie
+from beanie.operators import In
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import monitoring
+
+from configs import mongo_config
+from mongo.projections import (
+    ProjectRefView,
+    ProjectSummaryView,
+    TaskListView,
+    TaskSearchView,
+)
+from mongo.schemas import (
+    ChecklistItem,
+    DocumentModels,
+    Labels,
+    ProjectMember,
+    Projects,
+    Tasks,
+)
+
+BENCH_USER_ID = uuid.UUID("00000000-0000-4000-8000-000000000001")
+
+
+class ReplyBytes(monitoring.CommandListener):
+    def __init__(self):
+        self.total = 0
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        self.total += len(bson.encode(event.reply))
+
+    def failed(self, event):
+        pass
+
+
+async def seed(task_count: int, project_count: int):
+    await Tasks.delete_all()
+    await Projects.delete_all()
+    await Labels.delete_all()
+
+    now = datetime.now(timezone.utc)
+    projects = [
+        Projects(
+            name=f"Project {index}",
+            description="Benchmark project " * 20,
+            workspaceId=uuid.uuid4(),
+            ownerId=BENCH_USER_ID,
+            members=[ProjectMember(userId=BENCH_USER_ID, role="owner")]
+            + [ProjectMember(userId=uuid.uuid4()) for _ in range(10)],
+            columnOrder=[uuid.uuid4() for _ in range(4)],
+        )
+        for index in range(project_count)
+    ]
+    await Projects.insert_many(projects)
+    labels = [Labels(projectId=project.id, text=f"label-{index % 5}") for index, project in enumerate(projects)]
+    await Labels.insert_many(labels)
+
+    batch: list[Tasks] = []
+    for index in range(task_count):
+        project = projects[index % project_count]
+        batch.append(Tasks(
+            title=f"Task {index}",
+            description="Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 30,
+            projectId=project.id,
+            columnId=project.columnOrder[index % 4],
+            creatorId=BENCH_USER_ID,
+            assignees=[BENCH_USER_ID],
+            dueDate=now + timedelta(days=index % 60 - 30),
+            labels=[labels[index % project_count].id],
+            checklists=[ChecklistItem(text=f"Checklist item {item}") for item in range(10)],
+        ))
+        if len(batch) == 5_000:
+            await Tasks.insert_many(batch)
+            batch = []
+    if batch:
+        await Tasks.insert_many(batch)
+    print(f"Seeded {task_count} tasks in {project_count} projects")
+
+
+async def my_tasks_full():
+    return await Tasks.find({"assignees": BENCH_USER_ID}).to_list()
+
+
+async def my_tasks_view():
+    return await Tasks.find({"assignees": BENCH_USER_ID}, projection_model=TaskListView).to_list()
+
+
+async def search_tasks_full():
+    projects = await Projects.find({"members.userId": BENCH_USER_ID}).to_list()
+    return await Tasks.find(
+        {"projectId": {"$in": [project.id for project in projects]}, "title": {"$regex": "1", "$options": "i"}}
+    ).to_list()
+
+
+async def search_tasks_view():
+    projects = await Projects.find({"members.userId": BENCH_USER_ID}, projection_model=ProjectRefView).to_list()
+    return await Tasks.find(
+        {"projectId": {"$in": [project.id for project in projects]}, "title": {"$regex": "1", "$options": "i"}},
+        projection_model=TaskSearchView,
+    ).to_list()
+
+
+async def my_projects_full():
+    return await Projects.find({"members.userId": BENCH_USER_ID}).to_list()
+
+
+async def my_projects_view():
+    return await Projects.find({"members.userId": BENCH_USER_ID}, projection_model=ProjectSummaryView).to_list()
+
+
+async def my_labels_full():
+    projects = await Projects.find({"members.userId": BENCH_USER_ID}).to_list()
+    return await Labels.find(In(Labels.projectId, [project.id for project in projects])).to_list()
+
+
+async def my_labels_view():
+    projects = await Projects.find({"members.userId": BENCH_USER_ID}, projection_model=ProjectRefView).to_list()
+    return await Labels.find(In(Labels.projectId, [project.id for project in projects])).to_list()
+
+
+CASES = [
+    ("my tasks", my_tasks_full, my_tasks_view),
+    ("search tasks", search_tasks_full, search_tasks_view),
+    ("my projects", my_projects_full, my_projects_view),
+    ("my labels", my_labels_full, my_labels_view),
+]
+
+
+async def measure(listener: ReplyBytes, fetch, repeat: int) -> tuple[float, float, float, int]:
+    timings, peaks, transferred = [], [], []
+    rows = 0
+    for _ in range(repeat):
+        listener.total = 0
+        tracemalloc.start()
+        started = time.perf_counter()
+        rows = len(await fetch())
+        timings.append((time.perf_counter() - started) * 1000)
+        peaks.append(tracemalloc.get_traced_memory()[1] / 1024 / 1024)
+        tracemalloc.stop()
+        transferred.append(listener.total / 1024 / 1024)
+    return statistics.median(timings), max(peaks), statistics.median(transferred), rows
+
+
+async def run(args):
+    listener = ReplyBytes()
+    client = AsyncIOMotorClient(mongo_config.uri, uuidRepresentation="standard", event_listeners=[listener])
+    db = client[args.db or f"{mongo_config.db_name}_bench"]
+    await init_beanie(db, document_models=DocumentModels)
+
+    if args.seed or await Tasks.count() != args.tasks:
+        await seed(args.tasks, args.projects)
+
+    print(f"\n{'query':<14} {'mode':<6} {'wall ms':>9} {'peak MiB':>9} {'wire MiB':>9} {'rows':>8}")
+    for name, full, view in CASES:
+        for mode, fetch in (("full", full), ("view", view)):
+            wall, peak, wire, rows = await measure(listener, fetch, args.repeat)
+            print(f"{name:<14} {mode:<6} {wall:9.1f} {peak:9.2f} {wire:9.2f} {rows:8d}")
+
+    client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=100_000, help="Tasks in the dataset")
+    parser.add_argument("--projects", type=int, default=200, help="Projects in the dataset")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per query and mode")
+    parser.add_argument("--db", default=None, help="Benchmark database name")
+    parser.add_argument("--seed", action="store_true", help="Re-seed the dataset even if it looks complete")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Microbenchmark for serializing a task mutation's response and broadcast.
+
+Compares the previous path with the current one for one task:
+
+- before: `TaskResponse(...)` validated from the document, validated again by
+  FastAPI against `response_model`, then `jsonable_encoder` + `json.dumps` for
+  the HTTP body, and `model_dump()` + `json.dumps(default=str)` for the
+  WebSocket broadcast;
+- after: `TaskResponse.from_task` (no validation) encoded once with
+  `utils.json_response.encode_json`; the same bytes are the HTTP body and the
+  broadcast's `data`.
+
+Usage:
+    python -m benchmarks.serialization
+    python -m benchmarks.serialization --checklists 0 20 --repeat 5000
+"""
+
+import argparse
+import json
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from mongo.schemas import ChecklistItem, Tasks
+from utils.json_response import encode_json
+from utils.task_models import TaskResponse
+
+RESPONSE_ADAPTER = TypeAdapter(TaskResponse)
+
+
+def build_task(checklists: int) -> Tasks:
+    """A task as Beanie loads it; `model_construct` because no database is initialized."""
+    now = datetime.now(timezone.utc)
+    return Tasks.model_construct(
+        id=uuid.uuid4(),
+        title="Implement user authentication",
+        description="Add JWT-based authentication system " * 4,
+        projectId=uuid.uuid4(),
+        columnId=uuid.uuid4(),
+        creatorId=uuid.uuid4(),
+        assignees=[uuid.uuid4() for _ in range(3)],
+        dueDate=now + timedelta(days=7),
+        labels=[uuid.uuid4() for _ in range(2)],
+        checklists=[ChecklistItem(text=f"Step {index}", checked=index % 2 == 0) for index in range(checklists)],
+        createdAt=now,
+        updatedAt=now,
+    )
+
+
+def serialize_before(task: Tasks) -> tuple[bytes, str]:
+    response = TaskResponse(
+        id=task.id,
+        title=task.title,
+        description=task.description,
+        projectId=task.projectId,
+        columnId=task.columnId,
+        creatorId=task.creatorId,
+        assignees=task.assignees,
+        dueDate=task.dueDate,
+        labels=task.labels,
+        checklists=task.checklists,
+        createdAt=task.createdAt,
+        updatedAt=task.updatedAt,
+    )
+    broadcast = json.dumps({"event": "server:task_updated", "data": response.model_dump()}, default=str)
+    validated = RESPONSE_ADAPTER.validate_python(response, from_attributes=True)
+    body = json.dumps(jsonable_encoder(validated), separators=(",", ":")).encode()
+    return body, broadcast
+
+
+def serialize_after(task: Tasks) -> tuple[bytes, str]:
+    body = encode_json(TaskResponse.from_task(task))
+    broadcast = (b'{"event":' + encode_json("server:task_updated") + b',"data":' + body + b"}").decode()
+    return body, broadcast
+
+
+PATHS: dict[str, Callable[[Tasks], tuple[bytes, str]]] = {
+    "before": serialize_before,
+    "after": serialize_after,
+}
+
+
+def run(task: Tasks, repeat: int) -> None:
+    print(f"\n{len(task.checklists)} checklist items: {len(serialize_after(task)[0])} bytes")
+    for name, serialize in PATHS.items():
+        serialize(task)  # warm up
+        timings: list[float] = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            serialize(task)
+            timings.append((time.perf_counter() - started) * 1_000_000)
+        print(f"  {name:<8} median {statistics.median(timings):8.1f} us   min {min(timings):8.1f} us")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--checklists", type=int, nargs="+", default=[0, 5, 50], help="Checklist sizes to generate")
+    parser.add_argument("--repeat", type=int, default=2000, help="Iterations per path")
+    args = parser.parse_args()
+
+    for size in args.checklists:
+        run(build_task(size), args.repeat)
+
+
+if __name__ == "__main__":
+    main()
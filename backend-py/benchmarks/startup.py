@@ -0,0 +1,103 @@
+"""
+Startup time of the API, with budgets.
+
+- Import: `import api.main` in `--repeat` fresh interpreters; the median is
+  checked against `--import-budget-ms`, and the modules with the largest
+  own import time (`python -X importtime`) are listed.
+- Lifespan (`--lifespan`): time from entering the app's lifespan to the point
+  where it would serve, i.e. `/health/ready` turning 200 once imported;
+  checked against `--startup-budget-ms`. Needs the MongoDB from
+  app-config.yaml. Index sync (`mongo.sync_indexes_on_startup`) and the
+  Node.js relay connection are not part of it unless the former is turned on.
+
+Exits with status 1 when a budget is exceeded, so CI can run it as the
+import-time budget test.
+
+Usage:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --lifespan
+    python -m benchmarks.startup --repeat 10 --import-budget-ms 1500 --startup-budget-ms 300
+"""
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+_TIMED_IMPORT = "import time; started = time.perf_counter(); import api.main; print((time.perf_counter() - started) * 1000)"
+
+
+def import_times(repeat: int) -> list[float]:
+    times = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", _TIMED_IMPORT], cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+        )
+        times.append(float(result.stdout.strip().splitlines()[-1]))
+    return times
+
+
+def slowest_imports(top: int) -> list[tuple[float, float, str]]:
+    """(own ms, cumulative ms, module) of the `top` modules with the largest own import time."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import api.main"], cwd=BACKEND_DIR, capture_output=True, text=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        own, cumulative, module = line.removeprefix("import time:").split("|")
+        rows.append((int(own) / 1000, int(cumulative) / 1000, module.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+async def lifespan_time() -> tuple[float, float]:
+    """Seconds to enter and to leave the app's lifespan."""
+    from api.main import app
+
+    started = time.perf_counter()
+    async with app.router.lifespan_context(app):
+        entered = time.perf_counter()
+        assert app.state.ready
+    return entered - started, time.perf_counter() - entered
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters importing api.main")
+    parser.add_argument("--import-budget-ms", type=float, default=2000, help="Allowed median import time")
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports listed")
+    parser.add_argument("--lifespan", action="store_true", help="Also time the lifespan startup (needs MongoDB)")
+    parser.add_argument("--startup-budget-ms", type=float, default=500, help="Allowed lifespan startup time")
+    args = parser.parse_args()
+
+    over = []
+    times = import_times(args.repeat)
+    median = statistics.median(times)
+    print(f"import api.main: median {median:.0f} ms, min {min(times):.0f} ms, max {max(times):.0f} ms ({args.repeat} runs)")
+    if median > args.import_budget_ms:
+        over.append(f"import {median:.0f} ms > {args.import_budget_ms:.0f} ms")
+
+    print(f"\n{'own ms':>8} {'cumul. ms':>10}  module")
+    for own, cumulative, module in slowest_imports(args.top):
+        print(f"{own:>8.1f} {cumulative:>10.1f}  {module}")
+
+    if args.lifespan:
+        startup, shutdown = asyncio.run(lifespan_time())
+        print(f"\nlifespan: startup {startup * 1000:.0f} ms, shutdown {shutdown * 1000:.0f} ms")
+        if startup * 1000 > args.startup_budget_ms:
+            over.append(f"startup {startup * 1000:.0f} ms > {args.startup_budget_ms:.0f} ms")
+
+    if over:
+        print("\nOver budget: " + ", ".join(over))
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
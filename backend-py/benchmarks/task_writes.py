@@ -0,0 +1,130 @@
+"""
+Write payload and latency of task mutations: whole-document save() vs targeted operators.
+
+`save()` sends the entire task (every checklist item included) as one `$set`,
+the targeted path sends only the touched field through `findAndModify`. The
+payload column is the BSON size of the command each path sends; it is
+computed offline. With `--live` both paths also run against the MongoDB from
+app-config.yaml (database `<mongo.db_name>_bench`) to report latency.
+
+Usage:
+    python -m benchmarks.task_writes
+    python -m benchmarks.task_writes --live --repeat 200
+"""
+
+import argparse
+import statistics
+import time
+import uuid
+from datetime import datetime, timezone
+
+import bson
+from bson.binary import UuidRepresentation
+from bson.codec_options import CodecOptions
+from pymongo import ReturnDocument
+
+CODEC_OPTIONS = CodecOptions(uuid_representation=UuidRepresentation.STANDARD)
+
+
+def make_task(checklist_items: int) -> dict:
+    now = datetime.now(timezone.utc)
+    return {
+        "_id": uuid.uuid4(),
+        "title": "Benchmark task",
+        "description": "Lorem ipsum dolor sit amet, consectetur adipiscing elit. " * 10,
+        "projectId": uuid.uuid4(),
+        "columnId": uuid.uuid4(),
+        "creatorId": uuid.uuid4(),
+        "assignees": [uuid.uuid4() for _ in range(3)],
+        "dueDate": now,
+        "labels": [uuid.uuid4() for _ in range(3)],
+        "checklists": [{"text": f"Checklist item number {index}", "checked": False} for index in range(checklist_items)],
+        "createdAt": now,
+        "updatedAt": now,
+    }
+
+
+def save_command(task: dict) -> dict:
+    """What `Document.save()` sends: the whole document as one upserting `$set`."""
+    body = {key: value for key, value in task.items() if key != "_id"}
+    return {
+        "update": "tasks",
+        "updates": [{"q": {"_id": task["_id"]}, "u": {"$set": body}, "upsert": True}],
+    }
+
+
+def targeted_command(task: dict, index: int) -> dict:
+    """What `update_task_document` sends to toggle one checklist item."""
+    return {
+        "findAndModify": "tasks",
+        "query": {"_id": task["_id"], f"checklists.{index}": {"$exists": True}},
+        "update": {"$set": {f"checklists.{index}.checked": True, "updatedAt": datetime.now(timezone.utc)}},
+        "new": True,
+    }
+
+
+def payload_bytes(command: dict) -> int:
+    return len(bson.encode(command, codec_options=CODEC_OPTIONS))
+
+
+def measure_live(collection, task: dict, repeat: int) -> tuple[float, float]:
+    collection.insert_one(task)
+    index = len(task["checklists"]) // 2
+
+    save_timings = []
+    for _ in range(repeat):
+        task["checklists"][index]["checked"] = not task["checklists"][index]["checked"]
+        task["updatedAt"] = datetime.now(timezone.utc)
+        body = {key: value for key, value in task.items() if key != "_id"}
+        started = time.perf_counter()
+        collection.update_one({"_id": task["_id"]}, {"$set": body}, upsert=True)
+        save_timings.append((time.perf_counter() - started) * 1000)
+
+    targeted_timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        collection.find_one_and_update(
+            {"_id": task["_id"], f"checklists.{index}": {"$exists": True}},
+            {"$set": {f"checklists.{index}.checked": True, "updatedAt": datetime.now(timezone.utc)}},
+            return_document=ReturnDocument.AFTER,
+        )
+        targeted_timings.append((time.perf_counter() - started) * 1000)
+
+    collection.delete_one({"_id": task["_id"]})
+    return statistics.median(save_timings), statistics.median(targeted_timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="Checklist lengths to test")
+    parser.add_argument("--live", action="store_true", help="Also time both paths against MongoDB")
+    parser.add_argument("--repeat", type=int, default=100, help="Writes per path and size in live mode")
+    args = parser.parse_args()
+
+    collection = None
+    if args.live:
+        from pymongo import MongoClient
+
+        from configs import mongo_config
+
+        client = MongoClient(mongo_config.uri, uuidRepresentation="standard")
+        collection = client[f"{mongo_config.db_name}_bench"]["tasks"]
+
+    header = f"{'items':>6} {'save B':>9} {'targeted B':>11} {'ratio':>7}"
+    if collection is not None:
+        header += f" {'save ms':>9} {'targeted ms':>12}"
+    print(header)
+
+    for size in args.sizes:
+        task = make_task(size)
+        save_size = payload_bytes(save_command(task))
+        targeted_size = payload_bytes(targeted_command(task, size // 2))
+        line = f"{size:>6} {save_size:>9} {targeted_size:>11} {save_size / targeted_size:>6.1f}x"
+        if collection is not None:
+            save_ms, targeted_ms = measure_live(collection, task, args.repeat)
+            line += f" {save_ms:>9.2f} {targeted_ms:>12.2f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
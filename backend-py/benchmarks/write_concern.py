@@ -0,0 +1,128 @@
+"""
+Request latency of task mutations with and without write-concern tiers.
+
+Every simulated request does what a task mutation does: one task update with
+the default write concern (`mongo.write_concern`), then an activity bucket
+upsert and a taskStats increment. In the "uniform" run those two also use the
+default write concern, as before write tiers existed; in the "tiered" run
+they use `mongo.write_tiers.best_effort`. With a lagging replica set the
+uniform run waits for the lagging members three times per request, the
+tiered run once.
+
+Replica lag is simulated with database-mongo/docker-compose.replset-lagged.yaml:
+a primary and two voting secondaries applying the oplog `secondaryDelaySecs`
+behind, so a majority acknowledgement waits for that delay.
+
+Usage (seeds `<mongo.db_name>_bench`):
+    python -m benchmarks.write_concern
+    python -m benchmarks.write_concern --uri "mongodb://localhost:27059/?directConnection=true" --requests 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import datetime, timezone
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from clients.mongo_client import BEST_EFFORT_WRITES, client_options, write_concern
+from configs import mongo_config
+from configs.mongo_config import MongoWriteConcernConfig
+
+TASKS = 100
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    values = sorted(values)
+    return values[max(int(len(values) * fraction) - 1, 0)]
+
+
+async def replication_lag(client: AsyncIOMotorClient) -> str:
+    try:
+        status = await client.admin.command("replSetGetStatus")
+    except Exception:
+        return "not a replica set"
+    primary = next((member for member in status["members"] if member["stateStr"] == "PRIMARY"), None)
+    if primary is None:
+        return "no primary"
+    lags = [
+        (primary["optimeDate"] - member["optimeDate"]).total_seconds()
+        for member in status["members"]
+        if member["stateStr"] == "SECONDARY"
+    ]
+    return ", ".join(f"{lag:.1f}s" for lag in lags) or "no secondaries"
+
+
+async def run(db, tasks, buckets, projects, requests: int, concurrency: int) -> tuple[list[float], float]:
+    project_id = uuid.uuid4()
+    await projects.insert_one({"_id": project_id, "taskStats": {"open": 0, "closed": 0}})
+    task_ids = [uuid.uuid4() for _ in range(TASKS)]
+    await db["wc_tasks"].insert_many([{"_id": task_id, "title": "Task", "projectId": project_id} for task_id in task_ids])
+
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def request(index: int):
+        async with semaphore:
+            started = time.perf_counter()
+            now = datetime.now(timezone.utc)
+            await tasks.update_one({"_id": task_ids[index % TASKS]}, {"$set": {"title": f"Task {index}", "updatedAt": now}})
+            await buckets.update_one(
+                {"projectId": project_id, "hour": now.replace(minute=0, second=0, microsecond=0)},
+                {"$push": {"events": {"action": "updated task", "createdAt": now}}, "$inc": {"eventCount": 1}},
+                upsert=True,
+            )
+            await projects.update_one({"_id": project_id}, {"$inc": {"taskStats.open": 1}})
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(request(index) for index in range(requests)))
+    return latencies, time.perf_counter() - started
+
+
+async def main_async(args):
+    client = AsyncIOMotorClient(args.uri, **client_options(mongo_config))
+    db = client[f"{mongo_config.db_name}_bench"]
+    for name in ("wc_tasks", "wc_buckets", "wc_projects"):
+        await db[name].drop()
+
+    best_effort = mongo_config.write_tiers.get(BEST_EFFORT_WRITES) or MongoWriteConcernConfig(w=1)
+    best_effort_concern = write_concern(best_effort)
+    print(f"default write concern: {client.write_concern.document or 'server default'}")
+    print(f"best_effort write concern: {best_effort_concern.document}")
+    print(f"secondary lag before: {await replication_lag(client)}")
+    print(f"{'run':>8} {'requests':>9} {'req/s':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+
+    tasks = db["wc_tasks"]
+    runs = {
+        "uniform": (db["wc_buckets"], db["wc_projects"]),
+        "tiered": (
+            db["wc_buckets"].with_options(write_concern=best_effort_concern),
+            db["wc_projects"].with_options(write_concern=best_effort_concern),
+        ),
+    }
+    for name, (buckets, projects) in runs.items():
+        latencies, elapsed = await run(db, tasks, buckets, projects, args.requests, args.concurrency)
+        print(
+            f"{name:>8} {len(latencies):>9} {len(latencies) / elapsed:>8.1f} "
+            f"{statistics.median(latencies):>9.1f} {percentile(latencies, 0.95):>9.1f} {percentile(latencies, 0.99):>9.1f}"
+        )
+        await db["wc_tasks"].drop()
+        await db["wc_projects"].drop()
+
+    print(f"secondary lag after: {await replication_lag(client)}")
+    client.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--uri", default=mongo_config.uri, help="MongoDB to write to (default: mongo.uri)")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
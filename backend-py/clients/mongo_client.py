@@ -1,31 +1,144 @@
+import asyncio
 from typing import Any
 
-from beanie import init_beanie
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from beanie import Document, init_beanie
+from motor.motor_asyncio import (
+    AsyncIOMotorClient,
+    AsyncIOMotorCollection,
+    AsyncIOMotorDatabase,
+)
+from pymongo.read_preferences import (
+    Nearest,
+    Primary,
+    PrimaryPreferred,
+    Secondary,
+    SecondaryPreferred,
+)
+from pymongo.write_concern import WriteConcern
 
 from configs import get_logger, mongo_config
+from configs.mongo_config import (
+    MongoConfig,
+    MongoQueryClassConfig,
+    MongoWriteConcernConfig,
+)
+from mongo.indexes import sync_index_options
 from mongo.schemas import DocumentModels
+from services import db_budget, tracing
 from services.base_singleton import SingletonMeta
+from services.metrics import MongoCommandMetrics
 
 logger = get_logger(__name__)
 
+# Query classes routed through `MongoClient.collection`; configured under `mongo.query_classes`.
+SEARCH_QUERIES = "search"
+DASHBOARD_QUERIES = "dashboard"
+# Write tiers routed through `MongoClient.collection`; configured under `mongo.write_tiers`.
+# Everything else, Beanie writes included, uses `mongo.write_concern`.
+BEST_EFFORT_WRITES = "best_effort"
+
+_READ_PREFERENCES = {
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
+
+
+def read_preference(
+    query_class: MongoQueryClassConfig,
+) -> Primary | PrimaryPreferred | Secondary | SecondaryPreferred | Nearest:
+    if query_class.read_preference == "primary":
+        return Primary()
+    return _READ_PREFERENCES[query_class.read_preference](max_staleness=query_class.max_staleness_seconds)
+
+
+def write_concern(config: MongoWriteConcernConfig) -> WriteConcern:
+    return WriteConcern(w=config.w, j=config.journal, wtimeout=config.wtimeout_ms)
+
+
+def client_options(config: MongoConfig) -> dict[str, Any]:
+    options: dict[str, Any] = {
+        "uuidRepresentation": "standard",
+        "maxPoolSize": config.max_pool_size,
+        "minPoolSize": config.min_pool_size,
+        "serverSelectionTimeoutMS": config.server_selection_timeout_ms,
+        "readPreference": config.read_preference,
+    }
+    if config.max_idle_time_ms is not None:
+        options["maxIdleTimeMS"] = config.max_idle_time_ms
+    if config.compressors:
+        options["compressors"] = ",".join(config.compressors)
+    if config.write_concern.w is not None:
+        options["w"] = config.write_concern.w
+    if config.write_concern.journal is not None:
+        options["journal"] = config.write_concern.journal
+    if config.write_concern.wtimeout_ms is not None:
+        options["wTimeoutMS"] = config.write_concern.wtimeout_ms
+    return options
+
 
 class MongoClient(metaclass=SingletonMeta):
     def __init__(self):
         self.client: AsyncIOMotorClient[Any] = AsyncIOMotorClient(
             f"{mongo_config.uri}",
-            uuidRepresentation="standard",
+            **client_options(mongo_config),
+            event_listeners=[
+                MongoCommandMetrics(),
+                *db_budget.mongo_event_listeners(),
+                *tracing.mongo_event_listeners(),
+            ],
         )
         self.database: str = str(mongo_config.db_name)
         self.db: AsyncIOMotorDatabase[Any] = self.client[self.database]
 
     async def initialize(self):
+        if mongo_config.sync_indexes_on_startup:
+            await sync_index_options(self.db)
         await init_beanie(
             self.db,
             document_models=DocumentModels,
+            skip_indexes=not mongo_config.sync_indexes_on_startup,
         )
         logger.info("MongoDB client initialized.")
 
+    def collection(
+        self,
+        model: type[Document],
+        query_class: str | None = None,
+        write_tier: str | None = None,
+    ) -> AsyncIOMotorCollection:
+        """
+        Collection of `model`, with the read preference configured for `query_class`
+        and the write concern configured for `write_tier`.
+
+        Beanie queries always use the client defaults, so read-heavy paths that may
+        be served by secondaries, and writes that need not wait for the replica set,
+        go through this collection directly.
+        """
+        collection = self.db[model.get_collection_name()]
+        options: dict[str, Any] = {}
+        class_config = mongo_config.query_classes.get(query_class) if query_class else None
+        if class_config is not None:
+            options["read_preference"] = read_preference(class_config)
+        tier_config = mongo_config.write_tiers.get(write_tier) if write_tier else None
+        if tier_config is not None:
+            options["write_concern"] = write_concern(tier_config)
+        return collection.with_options(**options) if options else collection
+
+    def reads_primary(self, query_class: str) -> bool:
+        class_config = mongo_config.query_classes.get(query_class)
+        mode = class_config.read_preference if class_config else mongo_config.read_preference
+        return mode == "primary"
+
+    async def ping(self, timeout_seconds: float = 2.0) -> bool:
+        try:
+            await asyncio.wait_for(self.db.command("ping"), timeout_seconds)
+            return True
+        except Exception as e:
+            logger.warning(f"MongoDB ping failed: {e}")
+            return False
+
     async def close(self):
         self.client.close()
         logger.info("MongoDB client closed.")
@@ -5,16 +5,19 @@ from typing import Any
 
 import yaml
 from dotenv import load_dotenv
+from pydantic import BaseModel, model_validator
 
-#from opentelemetry.instrumentation.logging import LoggingInstrumentor
-from pydantic import BaseModel
-
+from .activities_config import ActivitiesConfig
+from .cache_config import CacheConfig
+from .db_budget_config import DBBudgetConfig
+from .loop_monitor_config import LoopMonitorConfig
+from .metrics_config import MetricsConfig
 from .mongo_config import MongoConfig
 from .nodejs_backend_config import NodeJSBackendConfig
-
-# HACK: This service needs to initialize the logging instrumentor before any logging is done.
-# Still not sure why this service has to do this.
-#LoggingInstrumentor().instrument(set_logging_format=True)
+from .profiling_config import ProfilingConfig
+from .rate_limit_config import RateLimitConfig
+from .serving_config import ServingConfig
+from .tracing_config import TracingConfig
 
 _ = load_dotenv()
 
@@ -47,6 +50,26 @@ def expand_env_vars(obj: Any) -> Any:
 class AppConfig(BaseModel):
     mongo: MongoConfig
     nodejs_backend: NodeJSBackendConfig
+    cache: CacheConfig = CacheConfig()
+    activities: ActivitiesConfig = ActivitiesConfig()
+    tracing: TracingConfig = TracingConfig()
+    db_budget: DBBudgetConfig = DBBudgetConfig()
+    loop_monitor: LoopMonitorConfig = LoopMonitorConfig()
+    profiling: ProfilingConfig = ProfilingConfig()
+    serving: ServingConfig = ServingConfig()
+    rate_limit: RateLimitConfig = RateLimitConfig()
+    metrics: MetricsConfig = MetricsConfig()
+
+    @model_validator(mode="after")
+    def check_membership_sync(self) -> "AppConfig":
+        # Outside native mode Node.js removes members, deletes projects and transfers ownership; only the
+        # change stream re-syncs the rows after that, and a stale row would keep granting access.
+        if self.mongo.membership_index and not self.cache.enabled and self.nodejs_backend.migration_mode != "native":
+            raise ValueError(
+                "mongo.membership_index needs cache.enabled (the change stream re-syncs memberships after "
+                "Node.js writes) unless nodejs_backend.migration_mode is \"native\""
+            )
+        return self
 
 
 def load_config(config_path: str = "app-config.yaml") -> AppConfig:
@@ -103,3 +126,12 @@ except Exception as e:
 
 mongo_config = _config.mongo if _config else None
 nodejs_backend_config = _config.nodejs_backend if _config else None
+cache_config = _config.cache if _config else None
+activities_config = _config.activities if _config else None
+tracing_config = _config.tracing if _config else None
+db_budget_config = _config.db_budget if _config else None
+loop_monitor_config = _config.loop_monitor if _config else None
+profiling_config = _config.profiling if _config else None
+serving_config = _config.serving if _config else None
+rate_limit_config = _config.rate_limit if _config else None
+metrics_config = _config.metrics if _config else None
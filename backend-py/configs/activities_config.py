@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+
+class ActivitiesConfig(BaseModel):
+    # Activity buckets (one document per project per hour) expire this long after their hour.
+    ttl_days: int = 180
+    # Per-event documents in `activities`, still written by Node.js, are kept forever by default.
+    # When set, `python -m mongo.archive_activities` exports the ones older than this to NDJSON
+    # and deletes them; they are never expired without being archived.
+    legacy_ttl_days: int | None = None
+    # `python -m mongo.archive_activities` moves buckets older than this to compressed NDJSON files.
+    archive_after_days: int = 30
+    archive_dir: str = "archive/activities"
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+
+class CacheConfig(BaseModel):
+    # In-process caches invalidated from Mongo change streams. Change streams
+    # need a replica set (see database-mongo/docker-compose.replset.yaml), so
+    # this stays off for a standalone mongod.
+    enabled: bool = False
+    ttl_seconds: float = 60
+    max_entries: int = 10_000
+    # Collection and document id under which the last processed resume token is stored.
+    resume_token_collection: str = "change_stream_tokens"
+    consumer_name: str = "backend-py"
+    # How often the resume token is written back, in seconds.
+    token_flush_seconds: float = 5
@@ -0,0 +1,20 @@
+from pydantic import BaseModel
+
+
+class DBBudget(BaseModel):
+    # Mongo commands one request may issue before it is logged.
+    max_calls: int = 50
+    # Cumulative driver-measured Mongo time per request, in milliseconds.
+    max_db_ms: float = 250
+
+
+class DBBudgetConfig(BaseModel):
+    # Count Mongo commands per request and log requests over budget with their repeated query shapes.
+    enabled: bool = True
+    default: DBBudget = DBBudget()
+    # Per route template overrides, e.g. "/api/v1/tasks/{task_id}".
+    routes: dict[str, DBBudget] = {}
+    # Log single commands slower than this, in milliseconds, whether or not a request is over budget.
+    slow_command_ms: float = 100
+    # Query shapes listed in an over-budget log line, most repeated first.
+    report_shapes: int = 5
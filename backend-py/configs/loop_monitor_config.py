@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+
+class LoopMonitorConfig(BaseModel):
+    # Event-loop lag sampling, exported as event_loop_lag_seconds on /metrics; always on.
+    sample_interval_ms: float = 100
+    # Debug: a watchdog thread logs the event loop thread's stack whenever the loop
+    # has not run for blocking_threshold_ms, i.e. while a callback is blocking it.
+    blocking_debug: bool = False
+    blocking_threshold_ms: float = 100
@@ -0,0 +1,13 @@
+from pydantic import BaseModel, IPvAnyNetwork
+
+
+class MetricsConfig(BaseModel):
+    # Prometheus exposition at /metrics on the API port; when disabled the route is not registered.
+    enabled: bool = True
+    # Scrapers must send `Authorization: Bearer <bearer_token>` when set.
+    bearer_token: str | None = None
+    # Client networks allowed to scrape, e.g. ["10.0.0.0/8", "127.0.0.1/32"]; empty allows any.
+    allowed_ips: list[IPvAnyNetwork] = []
+    # With several `api.serve` workers, each writes a snapshot of its metrics this often for the
+    # worker answering a scrape to merge; the other workers' values are up to this old.
+    worker_snapshot_seconds: float = 5
@@ -1,6 +1,54 @@
+from typing import Literal
+
 from pydantic import BaseModel
 
+ReadPreferenceMode = Literal["primary", "primaryPreferred", "secondary", "secondaryPreferred", "nearest"]
+
+
+class MongoQueryClassConfig(BaseModel):
+    # Where reads of this class go; anything but "primary" may return slightly stale data.
+    read_preference: ReadPreferenceMode = "primary"
+    # Skip secondaries lagging more than this; -1 means no limit (minimum 90 otherwise).
+    max_staleness_seconds: int = -1
+
+
+class MongoWriteConcernConfig(BaseModel):
+    # Members that must acknowledge: "majority", a number, or 0 for unacknowledged writes.
+    # None keeps the server default (majority on replica sets since MongoDB 5.0).
+    w: int | Literal["majority"] | None = None
+    # Wait for the write to reach the on-disk journal.
+    journal: bool | None = None
+    # Give up waiting for acknowledgement after this; the write itself is not rolled back.
+    wtimeout_ms: int | None = None
+
 
 class MongoConfig(BaseModel):
     uri: str
     db_name: str
+    # Connection pool per mongod/mongos the driver talks to.
+    max_pool_size: int = 100
+    min_pool_size: int = 0
+    # Close pooled connections idle for longer than this; None keeps them open.
+    max_idle_time_ms: int | None = None
+    server_selection_timeout_ms: int = 30000
+    # Wire compression, first one the server supports wins.
+    # "zlib" is built in; "zstd" needs the zstandard package, "snappy" needs python-snappy.
+    compressors: list[Literal["zstd", "snappy", "zlib"]] = []
+    # Default read preference for everything not listed in query_classes.
+    read_preference: ReadPreferenceMode = "primary"
+    # Per query class overrides, e.g. "search" and "dashboard" reads routed to secondaries.
+    query_classes: dict[str, MongoQueryClassConfig] = {}
+    # Default write concern, used by every Beanie write (task, column, project, comment data).
+    write_concern: MongoWriteConcernConfig = MongoWriteConcernConfig()
+    # Per write tier overrides, e.g. "best_effort" for activity log and counter writes.
+    write_tiers: dict[str, MongoWriteConcernConfig] = {}
+    # Serve GET /projects/{id}/board from the materialized `boards` collection, kept up to date
+    # by the write paths. Boards are not maintained while this is off: run
+    # `python -m mongo.boards rebuild` when turning it on.
+    materialized_boards: bool = False
+    # Answer access checks and "workspaces/projects of user" from the `memberships` collection.
+    # Rows are not maintained while this is off: run `python -m mongo.memberships rebuild` when turning it on.
+    membership_index: bool = False
+    # Create and update the catalog indexes (mongo/indexes.py) on every startup. Off by default: indexes
+    # are a migration step, `python -m mongo.indexes apply`, run before deploying.
+    sync_indexes_on_startup: bool = False
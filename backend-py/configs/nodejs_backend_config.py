@@ -1,7 +1,22 @@
+from typing import Literal
+
 from pydantic import BaseModel
 
 
 class NodeJSBackendConfig(BaseModel):
     host: str
     port: str | None
-    domain: str | None
\ No newline at end of file
+    domain: str | None
+    # Endpoints whose Node.js body is streamed to the client without decoding:
+    # "project", "projects", "dashboard". Only "dashboard" keeps its response shape.
+    # "project" and "projects" then answer with Node's own body instead of the
+    # documented response model: camelCase keys ("_id", "workspaceId", "ownerId",
+    # "taskStats", ...), every field Node.js sends, and Node's datetime format.
+    # Enable them only for clients that read that shape.
+    passthrough_endpoints: list[str] = []
+    # Rewrite base64 ids to UUID strings while streaming.
+    passthrough_rewrite_ids: bool = True
+    # How migrated write endpoints are served:
+    # "proxy" forwards to Node.js, "native" writes to Mongo directly and
+    # "shadow" writes natively then compares the result with Node.js in the background.
+    migration_mode: Literal["proxy", "shadow", "native"] = "proxy"
@@ -0,0 +1,17 @@
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class ProfilingConfig(BaseModel):
+    # Sampling profiler around single requests; when disabled the middleware is not installed at all.
+    enabled: bool = False
+    # Users whose bearer token may ask for a profile with the `X-Profile: 1` header.
+    admin_user_ids: list[UUID] = []
+    # Fraction of all HTTP requests profiled without being asked, e.g. 0.001.
+    sample_ratio: float = 0
+    # Time between two stack samples of a profiled request, in milliseconds.
+    interval_ms: float = 1
+    # Profiles are written here as folded stacks (<profile id>.folded); only the newest `keep` are kept.
+    output_dir: str = "profiles"
+    keep: int = 200
@@ -0,0 +1,40 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class RateLimitRule(BaseModel):
+    # Sustained requests per second for one client, and how many it may send at once after being idle.
+    rate: float
+    burst: int
+    # Whose bucket a request takes from: the user of its bearer token (the client IP without a valid
+    # token), or always the client IP.
+    key: Literal["user", "ip"] = "user"
+
+
+class RateLimitConfig(BaseModel):
+    # Token buckets per client and route class; requests over the limit get 429 with Retry-After.
+    # Off by default: client IPs are only right behind a reverse proxy once its addresses are listed
+    # in serving.forwarded_allow_ips, otherwise every client shares the proxy's bucket.
+    enabled: bool = False
+    classes: dict[str, RateLimitRule] = {
+        "search": RateLimitRule(rate=5, burst=30),
+        "auth": RateLimitRule(rate=1, burst=10, key="ip"),
+    }
+    # Route template -> class; routes not listed are not limited.
+    routes: dict[str, str] = {
+        "/api/v1/search/tasks/search": "search",
+        "/api/v1/search/projects/search": "search",
+        "/api/v1/search/me/tasks": "search",
+        "/api/v1/search/me/labels": "search",
+        "/api/v1/search/me/projects": "search",
+        "/api/v1/auth/login": "auth",
+        "/api/v1/auth/register": "auth",
+        "/api/v1/auth/change-password": "auth",
+    }
+    # "memory" keeps buckets per process; "shared" keeps one table in shared memory for all workers
+    # forked by `api.serve`, so a client's limit does not grow with the worker count.
+    backend: Literal["memory", "shared"] = "memory"
+    # Buckets kept: the least recently seen client is forgotten first ("memory"), or the table has this
+    # many slots ("shared").
+    max_clients: int = 100_000
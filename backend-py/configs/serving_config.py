@@ -0,0 +1,18 @@
+from pydantic import BaseModel
+
+
+class ServingConfig(BaseModel):
+    # `python -m api.serve`, the production server started by the Dockerfile.
+    host: str = "0.0.0.0"
+    port: int = 8000
+    # Worker processes; None starts one per CPU core available to the process.
+    workers: int | None = None
+    # On SIGTERM, seconds in-flight requests and WebSocket closes get before they are cancelled.
+    graceful_timeout_seconds: float = 30
+    # Then seconds pending broadcasts and other background tasks get before they are cancelled.
+    drain_timeout_seconds: float = 10
+    keep_alive_seconds: float = 5
+    backlog: int = 2048
+    # Addresses (or networks) of reverse proxies whose X-Forwarded-For / X-Forwarded-Proto are trusted
+    # as the client's; None keeps uvicorn's default, $FORWARDED_ALLOW_IPS or localhost.
+    forwarded_allow_ips: list[str] | None = None
@@ -0,0 +1,18 @@
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class TracingConfig(BaseModel):
+    # OpenTelemetry spans for HTTP requests, Mongo commands, Node.js calls and WebSocket broadcasts.
+    enabled: bool = False
+    # Fraction of new traces recorded; requests carrying a sampled `traceparent` are always recorded.
+    sample_ratio: float = 0.1
+    # "file" appends one JSON span per line to file_path, "console" prints to stdout,
+    # "otlp" sends to a collector at otlp_endpoint.
+    exporter: Literal["file", "console", "otlp"] = "file"
+    file_path: str = "traces/spans.ndjson"
+    otlp_endpoint: str = "http://localhost:4317"
+    service_name: str = "backend-py"
+    # Comma-separated URL patterns that get no server span.
+    excluded_urls: str = "/health,/metrics"
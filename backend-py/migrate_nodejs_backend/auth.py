@@ -2,6 +2,7 @@ import aiohttp
 
 from configs import get_logger, nodejs_backend_config
 from hooks.http_errors import AuthenticationError, BadRequestError, InternalServerError
+from services.metrics import upstream_trace_config
 
 logger = get_logger("nodejs-backend-auth")
 
@@ -9,7 +10,7 @@ BASE_URL = nodejs_backend_config.domain if len(nodejs_backend_config.domain) > 0
 
 
 async def login_to_get_token(email: str, password: str) -> str:
-    async with aiohttp.ClientSession() as session:
+    async with aiohttp.ClientSession(trace_configs=[upstream_trace_config]) as session:
         login_url = f"{BASE_URL}/api/v1/auth/login"
         payload = {"email": email, "password": password}
 
@@ -10,6 +10,7 @@ from hooks.http_errors import (
     InternalServerError,
     NotFoundError,
 )
+from services.metrics import upstream_trace_config
 
 logger = get_logger("nodejs-backend-columns")
 
@@ -63,12 +64,12 @@ async def update_column(column_id: str, update_data: ColumnUpdateRequest, token:
     }
     payload = update_data.model_dump()
 
-    async with aiohttp.ClientSession() as session:
+    async with aiohttp.ClientSession(trace_configs=[upstream_trace_config]) as session:
         async with session.patch(url, json=payload, headers=headers) as response:
             if response.status == 200:
-                data = await response.json()
+                body = await response.read()
                 logger.info(f"Column {column_id} updated successfully.")
-                return ColumnResponse.model_validate(data)
+                return ColumnResponse.model_validate_json(body)
             elif response.status == 401:
                 logger.error("Authentication failed while updating column.")
                 raise AuthenticationError("Invalid or expired token.")
@@ -91,12 +92,12 @@ async def delete_column(column_id: str, token: str):
         "Authorization": f"Bearer {token}",
     }
 
-    async with aiohttp.ClientSession() as session:
+    async with aiohttp.ClientSession(trace_configs=[upstream_trace_config]) as session:
         async with session.delete(url, headers=headers) as response:
             if response.status in [204, 200]:
                 logger.info(f"Column {column_id} deleted successfully.")
-                data = await response.json()
-                return ColumnResponse.model_validate(data)
+                body = await response.read()
+                return ColumnResponse.model_validate_json(body)
             elif response.status == 401:
                 logger.error("Authentication failed while deleting column.")
                 raise AuthenticationError("Invalid or expired token.")
@@ -0,0 +1,46 @@
+import re
+from typing import Annotated, Any
+from uuid import UUID
+
+from pydantic import AliasGenerator, BaseModel, BeforeValidator, ConfigDict
+from pydantic.alias_generators import to_camel
+
+from utils import base64_to_uuid
+
+_UUID_PATTERN = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
+    re.IGNORECASE,
+)
+
+
+def to_uuid_str(value: Any) -> Any:
+    """
+    Normalize an id returned by the Node.js backend to a canonical UUID string.
+
+    Node.js sends ids as UUID strings, as base64-encoded BSON binaries, or as
+    populated sub-documents carrying their own `_id`.
+    """
+    if isinstance(value, dict):
+        value = value.get("_id") or value.get("id")
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, str) and value and not _UUID_PATTERN.match(value):
+        return str(base64_to_uuid(value))
+    return value
+
+
+NodeId = Annotated[str, BeforeValidator(to_uuid_str)]
+
+
+class NodeModel(BaseModel):
+    """
+    Base model for payloads decoded from the Node.js backend.
+
+    camelCase keys sent by Node.js are accepted through validation aliases only,
+    so responses are still serialized with the snake_case field names.
+    """
+
+    model_config = ConfigDict(
+        alias_generator=AliasGenerator(validation_alias=to_camel),
+        populate_by_name=True,
+    )
@@ -0,0 +1,68 @@
+"""
+Native project board, read from the materialized `boards` collection.
+
+Same contract as `getProjectBoard` in `GetController.js`: columns by creation
+time, tasks in each column's `taskOrder` without description or checklists,
+assignees and labels populated. The board is one document fetched by `_id`;
+it is rebuilt from the source collections when missing (see `mongo.boards`).
+"""
+
+from uuid import UUID
+
+from configs import get_logger
+from hooks.http_errors import NotFoundError, PermissionDeniedError
+from migrate_nodejs_backend.projects import (
+    BoardColumn,
+    BoardData,
+    BoardProject,
+    BoardProjectMember,
+    ProjectBoardResponse,
+)
+from mongo.boards import rebuild_board
+from mongo.schemas import Boards, Users
+
+logger = get_logger("native-board")
+
+
+async def get_project_board(project_id: str, current_user: Users) -> ProjectBoardResponse:
+    try:
+        project_uuid = UUID(project_id)
+    except ValueError:
+        raise NotFoundError(f"Project with ID {project_id} not found.")
+
+    board = await Boards.get(project_uuid)
+    if board is None:
+        board = await rebuild_board(project_uuid)
+        if board is None:
+            raise NotFoundError(f"Project with ID {project_id} not found.")
+        logger.info(f"Board of project {project_id} materialized.")
+
+    if board.ownerId != current_user.id and not any(member.userId == current_user.id for member in board.members):
+        raise PermissionDeniedError(f"Permission denied for project ID {project_id}.")
+
+    return ProjectBoardResponse(
+        success=True,
+        data=BoardData(
+            project=BoardProject(
+                id=str(board.id),
+                name=board.name,
+                owner_id=str(board.ownerId),
+                members=[
+                    BoardProjectMember(user_id=str(member.userId), role=member.role)
+                    for member in board.members
+                ],
+                column_order=[str(column_id) for column_id in board.columnOrder],
+            ),
+            columns=[
+                BoardColumn(
+                    id=str(column.id),
+                    title=column.title,
+                    project_id=str(board.id),
+                    tasks=[task.model_dump(by_alias=True, mode="json") for task in column.tasks],
+                    created_at=column.createdAt,
+                    updated_at=column.updatedAt,
+                )
+                for column in board.columns
+            ],
+        ),
+    )
@@ -0,0 +1,203 @@
+"""
+Native Mongo implementations of the column endpoints served by Node.js.
+
+Mirrors `Module4Controller.js`. `Projects.columnOrder` is only ever changed
+with atomic `$push`/`$pull`, and the events Node.js used to emit over
+Socket.IO are broadcast straight to our WebSocket clients through `ws_manager`.
+"""
+
+from datetime import datetime, timezone
+from uuid import UUID
+
+from configs import get_logger
+from hooks.http_errors import (
+    BadRequestError,
+    NotFoundError,
+    PermissionDeniedError,
+)
+from migrate_nodejs_backend.columns import ColumnResponse, ColumnUpdateRequest
+from migrate_nodejs_backend.projects import ColumnData, ProjectColumnCreatedResponse
+from mongo.boards import (
+    board_column_created,
+    board_column_deleted,
+    board_column_renamed,
+)
+from mongo.schemas import Columns, Projects, Tasks, Users
+from services.background import run_in_background
+from utils.activity_log import record_activity
+from utils.task_stats import inc_task_stats, stats_key
+from websocket.manager import ws_manager
+
+logger = get_logger("native-columns")
+
+
+def _parse_id(value: str, not_found_message: str) -> UUID:
+    try:
+        return UUID(value)
+    except ValueError:
+        raise NotFoundError(not_found_message)
+
+
+def _has_access(project: Projects | None, user_id: UUID) -> bool:
+    if project is None:
+        return False
+    return project.ownerId == user_id or any(member.userId == user_id for member in project.members)
+
+
+async def create_column(project_id: str, column_title: str, current_user: Users) -> ProjectColumnCreatedResponse:
+    if not column_title:
+        raise BadRequestError("Column title is required.")
+
+    project_uuid = _parse_id(project_id, f"Project {project_id} not found.")
+    project = await Projects.get(project_uuid)
+    if not _has_access(project, current_user.id):
+        raise PermissionDeniedError("Access denied.")
+
+    column = Columns(title=column_title, projectId=project_uuid)
+    await column.insert()
+    await Projects.find_one(Projects.id == project_uuid).update(
+        {"$push": {"columnOrder": column.id}, "$set": {"updatedAt": datetime.now(timezone.utc)}}
+    )
+    await board_column_created(project_uuid, column)
+
+    await record_activity(
+        projectId=project_uuid,
+        userId=current_user.id,
+        action="CREATED_COLUMN",
+        details={"columnTitle": column_title},
+    )
+
+    run_in_background(
+        ws_manager.broadcast_to_project(
+            str(project_uuid),
+            "server:column_created",
+            {
+                "columnId": str(column.id),
+                # Node.js sends the id under this misspelled key, keep it for existing clients
+                "columId": str(column.id),
+                "title": column.title,
+                "projectId": str(project_uuid),
+                "taskOrder": [],
+            },
+        )
+    )
+
+    return ProjectColumnCreatedResponse(
+        success=True,
+        message="Column created successfully.",
+        data=ColumnData(
+            id=str(column.id),
+            title=column.title,
+            project_id=str(column.projectId),
+            task_order=[],
+            created_at=column.createdAt,
+            updated_at=column.updatedAt,
+        ),
+    )
+
+
+async def update_column(column_id: str, update_data: ColumnUpdateRequest, current_user: Users) -> ColumnResponse:
+    column_uuid = _parse_id(column_id, f"Column with ID {column_id} not found.")
+    column = await Columns.get(column_uuid)
+    if column is None:
+        raise NotFoundError(f"Column with ID {column_id} not found.")
+
+    project = await Projects.get(column.projectId)
+    if not _has_access(project, current_user.id):
+        raise PermissionDeniedError("Access denied.")
+
+    if not update_data.title:
+        raise BadRequestError("No fields provided.")
+
+    updated_at = datetime.now(timezone.utc)
+    await Columns.find_one(Columns.id == column_uuid).update(
+        {"$set": {"title": update_data.title, "updatedAt": updated_at}}
+    )
+    await board_column_renamed(column.projectId, column_uuid, update_data.title, updated_at)
+
+    await record_activity(
+        projectId=column.projectId,
+        userId=current_user.id,
+        action="UPDATED_COLUMN_TITLE",
+        details={"oldTitle": column.title, "newTitle": update_data.title},
+    )
+
+    run_in_background(
+        ws_manager.broadcast_to_project(
+            str(column.projectId),
+            "server:column_updated",
+            {
+                "columnId": column_id,
+                "title": update_data.title,
+                "projectId": str(column.projectId),
+            },
+        )
+    )
+
+    logger.info(f"Column {column_id} updated natively.")
+    return ColumnResponse(success=True, message="Column updated successfully.")
+
+
+async def delete_column(column_id: str, current_user: Users) -> ColumnResponse:
+    column_uuid = _parse_id(column_id, f"Column with ID {column_id} not found.")
+    column = await Columns.get(column_uuid)
+    if column is None:
+        raise NotFoundError(f"Column with ID {column_id} not found.")
+
+    project = await Projects.get(column.projectId)
+    if not _has_access(project, current_user.id):
+        raise PermissionDeniedError("Access denied.")
+
+    # Tasks move to the previous column, or the next one when deleting the first column.
+    target_column_id = None
+    if column_uuid in project.columnOrder:
+        index = project.columnOrder.index(column_uuid)
+        if index > 0:
+            target_column_id = project.columnOrder[index - 1]
+        elif index < len(project.columnOrder) - 1:
+            target_column_id = project.columnOrder[index + 1]
+
+    if target_column_id is not None:
+        moved = await Tasks.find(Tasks.columnId == column_uuid).update(
+            {"$set": {"columnId": target_column_id}}
+        )
+        if column.taskOrder:
+            await Columns.find_one(Columns.id == target_column_id).update(
+                {"$push": {"taskOrder": {"$each": column.taskOrder, "$position": 0}}}
+            )
+        target_column = await Columns.get(target_column_id)
+        old_key = stats_key(column.title)
+        new_key = stats_key(target_column.title if target_column else None)
+        if moved is not None and old_key != new_key:
+            await inc_task_stats(column.projectId, **{old_key: -moved.modified_count, new_key: moved.modified_count})
+    else:
+        deleted = await Tasks.find(Tasks.columnId == column_uuid).delete()
+        if deleted is not None:
+            await inc_task_stats(column.projectId, **{stats_key(column.title): -deleted.deleted_count})
+
+    await Projects.find_one(Projects.id == column.projectId).update(
+        {"$pull": {"columnOrder": column_uuid}, "$set": {"updatedAt": datetime.now(timezone.utc)}}
+    )
+    await column.delete()
+    await board_column_deleted(column.projectId)
+
+    await record_activity(
+        projectId=column.projectId,
+        userId=current_user.id,
+        action="DELETED_COLUMN",
+        details={"columnTitle": column.title, "tasksRelocated": target_column_id is not None},
+    )
+
+    run_in_background(
+        ws_manager.broadcast_to_project(
+            str(column.projectId),
+            "server:column_deleted",
+            {
+                "columnId": column_id,
+                "projectId": str(column.projectId),
+            },
+        )
+    )
+
+    logger.info(f"Column {column_id} deleted natively.")
+    return ColumnResponse(success=True, message="Column deleted.")
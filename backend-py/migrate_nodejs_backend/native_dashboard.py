@@ -0,0 +1,155 @@
+"""
+Native project dashboard, computed with one `$facet` aggregation over tasks.
+
+Mirrors `getProjectDashboard` in `GetController.js`, which loaded every task
+and then looked up its column and assignees one query at a time.
+"""
+
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from clients import Clients
+from clients.mongo_client import DASHBOARD_QUERIES
+from configs import get_logger
+from hooks.http_errors import NotFoundError, PermissionDeniedError
+from migrate_nodejs_backend.projects import (
+    AssigneeData,
+    ColumnTaskCount,
+    DashboardData,
+    LabelTaskCount,
+    ProjectDashboardResponse,
+    TaskData,
+)
+from mongo.schemas import Columns, Labels, Projects, Tasks, Users
+from utils.task_stats import DONE_COLUMN_TITLE
+
+logger = get_logger("native-dashboard")
+
+UPCOMING_WINDOW = timedelta(days=7)
+
+_TASK_SUMMARY = {"$project": {"title": 1, "description": 1, "dueDate": 1}}
+
+
+def _lookup_one(collection: str, field: str, alias: str) -> list[dict]:
+    return [
+        {"$lookup": {"from": collection, "localField": "_id", "foreignField": "_id", "as": alias}},
+        {"$project": {"count": 1, field: {"$arrayElemAt": [f"${alias}.{field}", 0]}}},
+    ]
+
+
+def dashboard_pipeline(project_id: UUID, now: datetime) -> list[dict]:
+    return [
+        {"$match": {"projectId": project_id}},
+        {"$facet": {
+            "total": [{"$count": "count"}],
+            "columns": [
+                {"$group": {"_id": "$columnId", "count": {"$sum": 1}}},
+                *_lookup_one(Columns.Settings.name, "title", "column"),
+            ],
+            "assignees": [
+                {"$unwind": "$assignees"},
+                {"$group": {"_id": "$assignees", "count": {"$sum": 1}}},
+                {"$sort": {"count": -1}},
+                *_lookup_one(Users.Settings.name, "name", "user"),
+            ],
+            "labels": [
+                {"$unwind": "$labels"},
+                {"$group": {"_id": "$labels", "count": {"$sum": 1}}},
+                {"$sort": {"count": -1}},
+                {"$lookup": {"from": Labels.Settings.name, "localField": "_id", "foreignField": "_id", "as": "label"}},
+                {"$project": {
+                    "count": 1,
+                    "text": {"$arrayElemAt": ["$label.text", 0]},
+                    "color": {"$arrayElemAt": ["$label.color", 0]},
+                }},
+            ],
+            "overdue": [
+                {"$match": {"dueDate": {"$lt": now}}},
+                {"$sort": {"dueDate": 1}},
+                _TASK_SUMMARY,
+            ],
+            "upcoming": [
+                {"$match": {"dueDate": {"$gte": now, "$lte": now + UPCOMING_WINDOW}}},
+                {"$sort": {"dueDate": 1}},
+                _TASK_SUMMARY,
+            ],
+        }},
+    ]
+
+
+def _task_data(task: dict) -> TaskData:
+    return TaskData(
+        taskId=str(task["_id"]),
+        taskTitle=task["title"],
+        taskDescription=task.get("description") or None,
+        dueDate=task.get("dueDate"),
+    )
+
+
+async def get_project_dashboard(project_id: str, current_user: Users) -> ProjectDashboardResponse:
+    try:
+        project_uuid = UUID(project_id)
+    except ValueError:
+        raise NotFoundError(f"Project with ID {project_id} not found.")
+
+    project = await Projects.get(project_uuid)
+    if project is None:
+        raise NotFoundError(f"Project with ID {project_id} not found.")
+    if project.ownerId != current_user.id and not any(member.userId == current_user.id for member in project.members):
+        raise PermissionDeniedError(f"Permission denied for project ID {project_id}.")
+
+    now = datetime.now(timezone.utc)
+    mongo_client = Clients.get_mongo_client()
+    tasks = mongo_client.collection(Tasks, DASHBOARD_QUERIES)
+    result = await tasks.aggregate(dashboard_pipeline(project_uuid, now)).to_list(None)
+    facets = result[0] if result else {}
+
+    total = facets["total"][0]["count"] if facets.get("total") else 0
+    by_title: dict[str, int] = {}
+    for column in facets.get("columns", []):
+        title = column.get("title")
+        by_title[title] = by_title.get(title, 0) + column["count"]
+    done = by_title.get(DONE_COLUMN_TITLE, 0)
+
+    # Counters drift when tasks are written outside the Python API. They are only reported here: a $set
+    # from this read would overwrite the $inc of a task written since, and a secondary may lag anyway.
+    actual_stats = {"open": total - done, "closed": done}
+    if project.taskStats != actual_stats and mongo_client.reads_primary(DASHBOARD_QUERIES):
+        logger.warning(f"taskStats of project {project_id} differ from its tasks: {project.taskStats} != {actual_stats}")
+
+    overdue = [_task_data(task) for task in facets.get("overdue", [])]
+    return ProjectDashboardResponse(
+        success=True,
+        data=DashboardData(
+            totalTasks=total,
+            to_do_tasks=by_title.get("To Do", 0),
+            in_progress_tasks=by_title.get("In Progress", 0),
+            done_tasks=done,
+            review_tasks=by_title.get("Review", 0),
+            overdue_tasks=len(overdue),
+            overdue_task_lists=overdue,
+            upcoming_deadlines_7d=[_task_data(task) for task in facets.get("upcoming", [])],
+            completion_rate=0 if total == 0 else done / total * 100,
+            team_workload_list=[
+                AssigneeData(
+                    userId=str(assignee["_id"]),
+                    userName=assignee.get("name") or "Unknown User",
+                    taskCount=assignee["count"],
+                )
+                for assignee in facets.get("assignees", [])
+            ],
+            column_task_counts=[
+                ColumnTaskCount(columnId=str(column["_id"]), title=column.get("title"), taskCount=column["count"])
+                for column in facets.get("columns", [])
+            ],
+            label_histogram=[
+                LabelTaskCount(
+                    labelId=str(label["_id"]),
+                    text=label.get("text"),
+                    color=label.get("color"),
+                    taskCount=label["count"],
+                )
+                for label in facets.get("labels", [])
+            ],
+        ),
+    )
@@ -0,0 +1,303 @@
+"""
+Native Mongo implementations of the project endpoints served by Node.js.
+
+Each function mirrors the matching controller in backend-nodejs
+(`GetController.js`): same permission checks, same writes, same response
+contract as the proxied call in `migrate_nodejs_backend.projects` /
+`migrate_nodejs_backend.workspaces`, and the same Socket.IO event relayed
+to our WebSocket clients through `ws_manager`.
+"""
+
+from datetime import datetime, timezone
+from uuid import UUID
+
+from beanie import UpdateResponse
+from beanie.operators import In
+
+from configs import get_logger
+from hooks.http_errors import (
+    BadRequestError,
+    NotFoundError,
+    PermissionDeniedError,
+)
+from migrate_nodejs_backend.projects import (
+    NewlyAddedUser,
+    ProjectAddMemberData,
+    ProjectAddMemberResponse,
+    ProjectDeleteResponse,
+    ProjectMemberDetailed,
+    ProjectMemberSimple,
+    ProjectUpdateData,
+    ProjectUpdateRequest,
+    ProjectUpdateResponse,
+    UserInfo,
+)
+from migrate_nodejs_backend.workspaces import (
+    InitialColumn,
+    ProjectCreatedResponse,
+    ProjectCreateRequest,
+    ProjectData,
+    ProjectMember,
+)
+from mongo.boards import board_project_changed, board_project_deleted
+from mongo.memberships import drop_project_memberships, sync_project_memberships
+from mongo.schemas import (
+    Activities,
+    ActivityBuckets,
+    Columns,
+    Projects,
+    Tasks,
+    Users,
+    Workspaces,
+)
+from mongo.schemas import ProjectMember as ProjectMemberDocument
+from services.background import run_in_background
+from websocket.manager import ws_manager
+
+logger = get_logger("native-projects")
+
+DEFAULT_COLUMNS = ["To Do", "In Progress", "Review", "Done"]
+VALID_STATUSES = ["active", "on-hold", "completed"]
+
+
+def _parse_id(value: str, not_found_message: str) -> UUID:
+    try:
+        return UUID(value)
+    except ValueError:
+        raise NotFoundError(not_found_message)
+
+
+def _is_member(project: Projects, user_id: UUID) -> bool:
+    return project.ownerId == user_id or any(member.userId == user_id for member in project.members)
+
+
+def _user_info(user: Users) -> UserInfo:
+    return UserInfo(id=str(user.id), name=user.name, email=user.email, avatar_url=user.avatarUrl)
+
+
+async def update_project(project_id: str, update_data: ProjectUpdateRequest, current_user: Users) -> ProjectUpdateResponse:
+    project_uuid = _parse_id(project_id, f"Project {project_id} not found.")
+    project = await Projects.get(project_uuid)
+    if project is None:
+        raise NotFoundError(f"Project {project_id} not found.")
+    if project.ownerId != current_user.id:
+        raise PermissionDeniedError("Only the project owner can update project details.")
+
+    requested = update_data.model_dump(exclude_unset=True)
+    update_fields = {}
+    if requested.get("name"):
+        update_fields["name"] = requested["name"].strip()
+    if "description" in requested:
+        update_fields["description"] = requested["description"]
+    if requested.get("status"):
+        if requested["status"] not in VALID_STATUSES:
+            raise BadRequestError("Invalid status")
+        update_fields["status"] = requested["status"]
+    if requested.get("deadline"):
+        update_fields["deadline"] = requested["deadline"]
+    if not update_fields:
+        raise BadRequestError("No valid fields provided for update.")
+    update_fields["updatedAt"] = datetime.now(timezone.utc)
+
+    updated = await Projects.find_one(Projects.id == project_uuid).update(
+        {"$set": update_fields},
+        response_type=UpdateResponse.NEW_DOCUMENT,
+    )
+    if updated is None:
+        raise NotFoundError(f"Project {project_id} not found.")
+    await board_project_changed(updated.id, updated)
+
+    owner = current_user if updated.ownerId == current_user.id else await Users.get(updated.ownerId)
+
+    run_in_background(
+        ws_manager.broadcast_to_project(
+            str(updated.id),
+            "server:project_updated",
+            {
+                "projectId": str(updated.id),
+                "name": updated.name,
+                "description": updated.description,
+                "status": updated.status,
+                "updatedAt": updated.updatedAt,
+                "deadline": updated.deadline,
+            },
+        )
+    )
+
+    logger.info(f"Project {project_id} updated natively.")
+    return ProjectUpdateResponse(
+        success=True,
+        data=ProjectUpdateData(
+            id=str(updated.id),
+            name=updated.name,
+            description=updated.description,
+            workspace_id=str(updated.workspaceId),
+            owner=_user_info(owner),
+            members=[
+                ProjectMemberSimple(user_id=str(member.userId), role=member.role)
+                for member in updated.members
+            ],
+            status=updated.status,
+            column_order=[str(column_id) for column_id in updated.columnOrder],
+            task_stats=updated.taskStats,
+            created_at=updated.createdAt,
+            updated_at=updated.updatedAt,
+        ),
+    )
+
+
+async def delete_project(project_id: str, current_user: Users) -> ProjectDeleteResponse:
+    project_uuid = _parse_id(project_id, f"Project {project_id} not found.")
+    project = await Projects.get(project_uuid)
+    if project is None:
+        raise NotFoundError(f"Project {project_id} not found.")
+    if project.ownerId != current_user.id:
+        raise PermissionDeniedError("Only the project owner can delete the project.")
+
+    await Columns.find(Columns.projectId == project_uuid).delete()
+    await Tasks.find(Tasks.projectId == project_uuid).delete()
+    await Activities.find(Activities.projectId == project_uuid).delete()
+    await ActivityBuckets.find(ActivityBuckets.projectId == project_uuid).delete()
+    await project.delete()
+    await board_project_deleted(project_uuid)
+    await drop_project_memberships(project_uuid)
+
+    logger.info(f"Project {project_id} deleted natively.")
+    return ProjectDeleteResponse(
+        success=True,
+        message="Project and all related data deleted successfully.",
+    )
+
+
+async def add_project_member(project_id: str, member_email: list[str], current_user: Users) -> ProjectAddMemberResponse:
+    if not member_email:
+        raise BadRequestError("Email list cannot be empty.")
+
+    project_uuid = _parse_id(project_id, "Project not found.")
+    project = await Projects.get(project_uuid)
+    if project is None:
+        raise NotFoundError("Project not found.")
+    if not _is_member(project, current_user.id):
+        raise PermissionDeniedError("Not authorized to add members.")
+
+    users_to_add = await Users.find(In(Users.email, member_email)).to_list()
+    found_emails = {user.email for user in users_to_add}
+    not_found_emails = [email for email in member_email if email not in found_emails]
+    if not_found_emails:
+        raise NotFoundError(f"The following users were not found: {', '.join(not_found_emails)}")
+
+    current_member_ids = {member.userId for member in project.members}
+    current_member_ids.add(project.ownerId)
+    new_members = [user for user in users_to_add if user.id not in current_member_ids]
+
+    if new_members:
+        project = await Projects.find_one(Projects.id == project_uuid).update(
+            {
+                "$push": {
+                    "members": {
+                        "$each": [
+                            ProjectMemberDocument(userId=user.id, role="member").model_dump()
+                            for user in new_members
+                        ]
+                    }
+                },
+                "$set": {"updatedAt": datetime.now(timezone.utc)},
+            },
+            response_type=UpdateResponse.NEW_DOCUMENT,
+        )
+        if project is None:
+            raise NotFoundError("Project not found.")
+        await board_project_changed(project.id, project)
+        await sync_project_memberships(project)
+        message = f"{len(new_members)} new members added successfully."
+    else:
+        message = "All provided users are already members of this project."
+
+    member_users = {
+        user.id: user
+        for user in await Users.find(In(Users.id, [member.userId for member in project.members])).to_list()
+    }
+
+    return ProjectAddMemberResponse(
+        success=True,
+        message=message,
+        data=ProjectAddMemberData(
+            id=str(project.id),
+            name=project.name,
+            description=project.description,
+            workspace_id=str(project.workspaceId),
+            owner_id=str(project.ownerId),
+            members=[
+                ProjectMemberDetailed(user=_user_info(member_users[member.userId]), role=member.role)
+                for member in project.members
+                if member.userId in member_users
+            ],
+            status=project.status,
+            column_order=[str(column_id) for column_id in project.columnOrder],
+            task_stats=project.taskStats,
+            created_at=project.createdAt,
+            updated_at=project.updatedAt,
+        ),
+        newly_added_users=[
+            NewlyAddedUser(id=str(user.id), name=user.name, email=user.email)
+            for user in new_members
+        ],
+    )
+
+
+async def create_project(workspace_id: str, project_data: ProjectCreateRequest, current_user: Users) -> ProjectCreatedResponse:
+    workspace = None
+    try:
+        workspace = await Workspaces.get(UUID(workspace_id))
+    except ValueError:
+        pass
+    if workspace is None or workspace.ownerId != current_user.id:
+        raise PermissionDeniedError("Only workspace owners can create new projects")
+
+    project = Projects(
+        name=project_data.name,
+        description=project_data.description,
+        workspaceId=workspace.id,
+        ownerId=current_user.id,
+        members=[ProjectMemberDocument(userId=current_user.id, role="owner")],
+        deadline=project_data.deadline,
+    )
+    columns = [Columns(title=title, projectId=project.id) for title in DEFAULT_COLUMNS]
+    project.columnOrder = [column.id for column in columns]
+
+    await project.insert()
+    await Columns.insert_many(columns)
+    await sync_project_memberships(project)
+
+    logger.info(f"Project {project.id} created natively in workspace {workspace_id}.")
+    return ProjectCreatedResponse(
+        success=True,
+        message="Project created and initialized successfully",
+        data=ProjectData(
+            id=str(project.id),
+            name=project.name,
+            description=project.description,
+            workspace_id=str(project.workspaceId),
+            owner_id=str(project.ownerId),
+            members=[
+                ProjectMember(user_id=str(member.userId), role=member.role)
+                for member in project.members
+            ],
+            status=project.status,
+            column_order=[str(column_id) for column_id in project.columnOrder],
+            task_stats=project.taskStats,
+            created_at=project.createdAt,
+            updated_at=project.updatedAt,
+        ),
+        initial_columns=[
+            InitialColumn(
+                id=str(column.id),
+                title=column.title,
+                project_id=str(column.projectId),
+                task_order=[],
+                created_at=column.createdAt,
+                updated_at=column.updatedAt,
+            )
+            for column in columns
+        ],
+    )
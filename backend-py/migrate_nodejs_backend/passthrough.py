@@ -0,0 +1,139 @@
+import binascii
+import re
+from typing import AsyncIterator
+
+import aiohttp
+from fastapi.responses import StreamingResponse
+
+from configs import get_logger, nodejs_backend_config
+from hooks.http_errors import (
+    AuthenticationError,
+    BadRequestError,
+    InternalServerError,
+    NotFoundError,
+    PermissionDeniedError,
+)
+from services.metrics import upstream_trace_config
+
+logger = get_logger("nodejs-backend-passthrough")
+
+CHUNK_SIZE = 64 * 1024
+
+# A UUID stored as BSON binary is serialized by Node.js as a quoted 24 char base64 string.
+_BASE64_ID_PATTERN = re.compile(rb'"([A-Za-z0-9+/]{22}==)"')
+# Longest possible match minus one: a tail this long may hold an incomplete id.
+_CARRY_SIZE = 25
+
+
+def _replace_id(match: re.Match[bytes]) -> bytes:
+    # Same result as str(base64_to_uuid(...)), without the round trip through uuid.UUID.
+    h = binascii.hexlify(binascii.a2b_base64(match.group(1)))
+    return b'"%s-%s-%s-%s-%s"' % (h[:8], h[8:12], h[12:16], h[16:20], h[20:])
+
+
+class IdRewriter:
+    """
+    Incrementally rewrite base64 ids to UUID strings in a JSON byte stream.
+
+    Ids split across chunk boundaries are handled by carrying the last few
+    bytes of each chunk over to the next one.
+    """
+
+    def __init__(self):
+        self._carry = b""
+
+    def feed(self, chunk: bytes) -> bytes:
+        buffer = self._carry + chunk
+        cut = len(buffer) - _CARRY_SIZE
+        if cut <= 0:
+            self._carry = buffer
+            return b""
+
+        # Never cut through an id that straddles the carry boundary.
+        for match in _BASE64_ID_PATTERN.finditer(buffer, max(cut - _CARRY_SIZE, 0)):
+            if match.start() < cut < match.end():
+                cut = match.end()
+                break
+
+        self._carry = buffer[cut:]
+        return _BASE64_ID_PATTERN.sub(_replace_id, buffer[:cut])
+
+    def flush(self) -> bytes:
+        remaining, self._carry = self._carry, b""
+        return _BASE64_ID_PATTERN.sub(_replace_id, remaining)
+
+
+def rewrite_base64_ids(body: bytes) -> bytes:
+    return _BASE64_ID_PATTERN.sub(_replace_id, body)
+
+
+async def _raise_for_status(response: aiohttp.ClientResponse, not_found_message: str):
+    if response.status == 401:
+        raise AuthenticationError("Invalid or expired token.")
+    elif response.status == 404:
+        raise NotFoundError(not_found_message)
+    elif response.status == 403:
+        raise PermissionDeniedError("Permission denied.")
+    elif response.status == 400:
+        error_message = await response.text()
+        raise BadRequestError(f"Retrieval failed: {error_message}")
+    else:
+        error_message = await response.text()
+        raise InternalServerError(f"Retrieval failed: {error_message}")
+
+
+async def _iter_body(
+    session: aiohttp.ClientSession,
+    response: aiohttp.ClientResponse,
+    rewrite_ids: bool,
+) -> AsyncIterator[bytes]:
+    rewriter = IdRewriter() if rewrite_ids else None
+    try:
+        async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+            if rewriter is None:
+                yield chunk
+            else:
+                out = rewriter.feed(chunk)
+                if out:
+                    yield out
+        if rewriter is not None:
+            tail = rewriter.flush()
+            if tail:
+                yield tail
+    finally:
+        response.release()
+        await session.close()
+
+
+async def stream_get(url: str, token: str, not_found_message: str) -> StreamingResponse:
+    """
+    Proxy a GET request to the Node.js backend and stream its body unchanged.
+
+    The upstream status is checked before streaming starts, so errors are
+    raised the same way as on the decoding path.
+    """
+    headers = {
+        "accept": "*/*",
+        "Authorization": f"Bearer {token}",
+    }
+    session = aiohttp.ClientSession(trace_configs=[upstream_trace_config])
+    try:
+        response = await session.get(url, headers=headers)
+        if response.status != 200:
+            try:
+                await _raise_for_status(response, not_found_message)
+            finally:
+                response.release()
+    except BaseException:
+        await session.close()
+        raise
+
+    return StreamingResponse(
+        _iter_body(session, response, nodejs_backend_config.passthrough_rewrite_ids),
+        status_code=200,
+        media_type="application/json",
+    )
+
+
+def is_passthrough_enabled(endpoint: str) -> bool:
+    return endpoint in nodejs_backend_config.passthrough_endpoints
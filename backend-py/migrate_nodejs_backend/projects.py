@@ -1,8 +1,9 @@
 from datetime import datetime
-from typing import Any, List, Optional, Union
+from typing import Any, List, Optional
 
 import aiohttp
-from pydantic import BaseModel, field_validator
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 
 from configs import get_logger, nodejs_backend_config
 from hooks.http_errors import (
@@ -12,93 +13,43 @@ from hooks.http_errors import (
     NotFoundError,
     PermissionDeniedError,
 )
-from utils import base64_to_uuid
+from migrate_nodejs_backend.decoding import NodeId, NodeModel
+from migrate_nodejs_backend.passthrough import stream_get
+from services.metrics import upstream_trace_config
 
 logger = get_logger("nodejs-backend-projects")
 
 BASE_URL = nodejs_backend_config.domain if len(nodejs_backend_config.domain) > 0 else f"http://{nodejs_backend_config.host}:{nodejs_backend_config.port}"
 
 
-def _is_uuid(value: str) -> bool:
-    import re
-    uuid_pattern = re.compile(
-        r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
-        re.IGNORECASE,
-    )
-    return bool(uuid_pattern.match(value))
-
-
-
 class TaskStats(BaseModel):
     open: int
     closed: int
 
-class UserInfo(BaseModel):
-    id: str
+class UserInfo(NodeModel):
+    id: NodeId = Field(validation_alias="_id")
     name: str
     email: str
     avatar_url: Optional[str] = None
 
-    @field_validator("id", mode="before")
-    @classmethod
-    def convert_id(cls, v):
-        if v and not _is_uuid(v):
-            return base64_to_uuid(v)
-        return v
-
-    class Config:
-        populate_by_name = True
-
-    def __init__(self, **data):
-        if "_id" in data:
-            data["id"] = data.pop("_id")
-        if "avatarUrl" in data:
-            data["avatar_url"] = data.pop("avatarUrl")
-        super().__init__(**data)
-
-class OwnerInfo(BaseModel):
-    id: str
+
+class OwnerInfo(NodeModel):
+    id: NodeId = Field(validation_alias="_id")
     name: str
     avatar_url: Optional[str] = None
 
-    @field_validator("id", mode="before")
-    @classmethod
-    def convert_id(cls, v):
-        if v and not _is_uuid(v):
-            return base64_to_uuid(v)
-        return v
 
-    class Config:
-        populate_by_name = True
-
-    def __init__(self, **data):
-        if "_id" in data:
-            data["id"] = data.pop("_id")
-        if "avatarUrl" in data:
-            data["avatar_url"] = data.pop("avatarUrl")
-        super().__init__(**data)
-
-
-
-class ProjectMemberDetailed(BaseModel):
-    user: UserInfo
+class ProjectMemberDetailed(NodeModel):
+    user: UserInfo = Field(validation_alias="userId")
     role: str
 
-    class Config:
-        populate_by_name = True
-
-    def __init__(self, **data):
-        if "userId" in data:
-            data["user"] = data.pop("userId")
-        super().__init__(**data)
 
-
-class ProjectDetailData(BaseModel):
-    id: str
+class ProjectDetailData(NodeModel):
+    id: NodeId = Field(validation_alias="_id")
     name: str
     description: Optional[str] = None
-    workspace_id: str
-    owner: UserInfo
+    workspace_id: NodeId
+    owner: UserInfo = Field(validation_alias="ownerId")
     members: List[ProjectMemberDetailed]
     status: str
     column_order: List[str]
@@ -106,39 +57,10 @@ class ProjectDetailData(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    @field_validator("id", "workspace_id", mode="before")
-    @classmethod
-    def convert_ids(cls, v):
-        if v and not _is_uuid(v):
-            return base64_to_uuid(v)
-        return v
-
-    class Config:
-        populate_by_name = True
-
-    def __init__(self, **data):
-        if "_id" in data:
-            data["id"] = data.pop("_id")
-        if "workspaceId" in data:
-            data["workspace_id"] = data.pop("workspaceId")
-        if "ownerId" in data:
-            data["owner"] = data.pop("ownerId")
-        if "columnOrder" in data:
-            data["column_order"] = data.pop("columnOrder")
-        if "taskStats" in data:
-            data["task_stats"] = data.pop("taskStats")
-        if "createdAt" in data:
-            data["created_at"] = data.pop("createdAt")
-        if "updatedAt" in data:
-            data["updated_at"] = data.pop("updatedAt")
-        data.pop("__v", None)
-        super().__init__(**data)
-
 
 class ProjectDetailResponse(BaseModel): 
     success: bool
     data: ProjectDetailData
-import json
 
 
 async def get_project(project_id: str, token: str) -> ProjectDetailResponse:
@@ -147,12 +69,12 @@ async def get_project(project_id: str, token: str) -> ProjectDetailResponse:
         "accept": "*/*",
         "Authorization": f"Bearer {token}",
     }
-    async with aiohttp.ClientSession() as session:
+    async with aiohttp.ClientSession(trace_configs=[upstream_trace_config]) as session:
         async with session.get(url, headers=headers) as response:
             if response.status == 200:
-                data = await response.json()
+                body = await response.read()
                 logger.info(f"Project {project_id} retrieved successfully.")
-                return ProjectDetailResponse.model_validate(data)
+                return ProjectDetailResponse.model_validate_json(body)
             elif response.status == 401:
                 raise AuthenticationError("Invalid or expired token.")
             elif response.status == 404:
@@ -167,34 +89,26 @@ async def get_project(project_id: str, token: str) -> ProjectDetailResponse:
                 raise InternalServerError(f"Retrieval failed: {error_message}")
 
 
+async def stream_project(project_id: str, token: str) -> StreamingResponse:
+    return await stream_get(
+        url=f"{BASE_URL}/api/v1/projects/{project_id}",
+        token=token,
+        not_found_message=f"Project with ID {project_id} not found.",
+    )
+
+
 
-class ProjectMemberSimple(BaseModel):
-    user_id: str
+class ProjectMemberSimple(NodeModel):
+    user_id: NodeId
     role: str
 
-    @field_validator("user_id", mode="before")
-    @classmethod
-    def convert_user_id(cls, v):
-        if isinstance(v, dict):
-            return v.get("_id") or v.get("id")
-        if v and not _is_uuid(v):
-            return base64_to_uuid(v)
-        return v
-
-    class Config:
-        populate_by_name = True
-
-    def __init__(self, **data):
-        if "userId" in data:
-            data["user_id"] = data.pop("userId")
-        super().__init__(**data)
-
-class ProjectUpdateData(BaseModel):
-    id: str
+
+class ProjectUpdateData(NodeModel):
+    id: NodeId = Field(validation_alias="_id")
     name: str
     description: Optional[str] = None
-    workspace_id: str
-    owner: UserInfo 
+    workspace_id: NodeId
+    owner: UserInfo = Field(validation_alias="ownerId")
     members: List[ProjectMemberSimple] 
     status: str
     column_order: List[str]
@@ -202,33 +116,6 @@ class ProjectUpdateData(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    @field_validator("id", "workspace_id", mode="before")
-    @classmethod
-    def convert_ids(cls, v):
-        if v and not _is_uuid(v):
-            return base64_to_uuid(v)
-        return v
-
-    class Config:
-        populate_by_name = True
-
-    def __init__(self, **data):
-        if "_id" in data:
-            data["id"] = data.pop("_id")
-        if "workspaceId" in data:
-            data["workspace_id"] = data.pop("workspaceId")
-        if "ownerId" in data:
-            data["owner"] = data.pop("ownerId")
-        if "columnOrder" in data:
-            data["column_order"] = data.pop("columnOrder")
-        if "taskStats" in data:
-            data["task_stats"] = data.pop("taskStats")
-        if "createdAt" in data:
-            data["created_at"] = data.pop("createdAt")
-        if "updatedAt" in data:
-            data["updated_at"] = data.pop("updatedAt")
-        data.pop("__v", None)
-        super().__init__(**data)
 
 class ProjectUpdateResponse(BaseModel):
     success: bool
@@ -250,12 +137,12 @@ async def update_project(project_id: str, update_data: ProjectUpdateRequest, tok
         "Content-Type": "application/json",
     }
     payload = update_data.model_dump(exclude_unset=True, mode='json')
-    async with aiohttp.ClientSession() as session:
+    async with aiohttp.ClientSession(trace_configs=[upstream_trace_config]) as session:
         async with session.patch(url, json=payload, headers=headers) as response:
             if response.status == 200:
-                data = await response.json()
+                body = await response.read()
                 logger.info(f"Project {project_id} updated successfully.")
-                return ProjectUpdateResponse.model_validate(data)
+                return ProjectUpdateResponse.model_validate_json(body)
             elif response.status == 401:
                 raise AuthenticationError("Invalid or expired token.")
             elif response.status == 404:
@@ -284,15 +171,15 @@ async def delete_project(project_id: str, token: str) -> ProjectDeleteResponse:
         "Authorization": f"Bearer {token}",
     }
 
-    async with aiohttp.ClientSession() as session:
+    async with aiohttp.ClientSession(trace_configs=[upstream_trace_config]) as session:
         async with session.delete(url, headers=headers) as response:
             if response.status in [204, 200]:
                 logger.info(f"Project {project_id} deleted successfully.")
+                body = await response.read()
                 try:
-                    data = await response.json()
-                except:
-                    data = {"success": True, "message": "Project deleted"}
-                return ProjectDeleteResponse.model_validate(data)
+                    return ProjectDeleteResponse.model_validate_json(body)
+                except ValueError:
+                    return ProjectDeleteResponse(success=True, message="Project deleted")
             elif response.status == 401:
                 raise AuthenticationError("Invalid or expired token.")
             elif response.status == 404:
@@ -305,83 +192,27 @@ async def delete_project(project_id: str, token: str) -> ProjectDeleteResponse:
 
 
 
-class BoardProjectMember(BaseModel):
-    user_id: str
+class BoardProjectMember(NodeModel):
+    user_id: NodeId
     role: str
 
-    @field_validator("user_id", mode="before")
-    @classmethod
-    def convert_user_id(cls, v):
-        if v and not _is_uuid(v):
-            return base64_to_uuid(v)
-        return v
-
-    class Config:
-        populate_by_name = True
-
-    def __init__(self, **data):
-        if "userId" in data:
-            data["user_id"] = data.pop("userId")
-        super().__init__(**data)
-
 
-class BoardProject(BaseModel):
-    id: str
+class BoardProject(NodeModel):
+    id: NodeId = Field(validation_alias="_id")
     name: str
-    owner_id: str
+    owner_id: NodeId
     members: List[BoardProjectMember]
     column_order: List[str]
 
-    @field_validator("id", "owner_id", mode="before")
-    @classmethod
-    def convert_ids(cls, v):
-        if v and not _is_uuid(v):
-            return base64_to_uuid(v)
-        return v
 
-    class Config:
-        populate_by_name = True
-
-    def __init__(self, **data):
-        if "_id" in data:
-            data["id"] = data.pop("_id")
-        if "ownerId" in data:
-            data["owner_id"] = data.pop("ownerId")
-        if "columnOrder" in data:
-            data["column_order"] = data.pop("columnOrder")
-        super().__init__(**data)
-
-
-class BoardColumn(BaseModel):
-    id: str
+class BoardColumn(NodeModel):
+    id: NodeId = Field(validation_alias="_id")
     title: str
-    project_id: str
+    project_id: NodeId
     tasks: List[Any] 
     created_at: datetime
     updated_at: datetime
 
-    @field_validator("id", "project_id", mode="before")
-    @classmethod
-    def convert_ids(cls, v):
-        if v and not _is_uuid(v):
-            return base64_to_uuid(v)
-        return v
-
-    class Config:
-        populate_by_name = True
-
-    def __init__(self, **data):
-        if "_id" in data:
-            data["id"] = data.pop("_id")
-        if "projectId" in data:
-            data["project_id"] = data.pop("projectId")
-        if "createdAt" in data:
-            data["created_at"] = data.pop("createdAt")
-        if "updatedAt" in data:
-            data["updated_at"] = data.pop("updatedAt")
-        data.pop("__v", None)
-        super().__init__(**data)
-
 
 class BoardData(BaseModel):
     project: BoardProject
@@ -399,11 +230,11 @@ async def get_project_board(project_id: str, token: str) -> ProjectBoardResponse
         "accept": "*/*",
         "Authorization": f"Bearer {token}",
     }
-    async with aiohttp.ClientSession() as session:
+    async with aiohttp.ClientSession(trace_configs=[upstream_trace_config]) as session:
         async with session.get(url, headers=headers) as response:
             if response.status == 200:
-                data = await response.json()
-                return ProjectBoardResponse.model_validate(data)
+                body = await response.read()
+                return ProjectBoardResponse.model_validate_json(body)
             elif response.status == 401:
                 raise AuthenticationError("Invalid or expired token.")
             elif response.status == 404:
@@ -416,12 +247,12 @@ async def get_project_board(project_id: str, token: str) -> ProjectBoardResponse
 
 
 
-class ProjectAddMemberData(BaseModel):
-    id: str
+class ProjectAddMemberData(NodeModel):
+    id: NodeId = Field(validation_alias="_id")
     name: str
     description: Optional[str] = None
-    workspace_id: str
-    owner_id: str  
+    workspace_id: NodeId
+    owner_id: NodeId
     members: List[ProjectMemberDetailed] 
     status: str
     column_order: List[str]
@@ -429,70 +260,19 @@ class ProjectAddMemberData(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    @field_validator("id", "workspace_id", "owner_id", mode="before")
-    @classmethod
-    def convert_ids(cls, v):
-        if v and not _is_uuid(v):
-            return base64_to_uuid(v)
-        return v
-
-    class Config:
-        populate_by_name = True
-
-    def __init__(self, **data):
-        if "_id" in data:
-            data["id"] = data.pop("_id")
-        if "workspaceId" in data:
-            data["workspace_id"] = data.pop("workspaceId")
-        if "ownerId" in data:
-            data["owner_id"] = data.pop("ownerId")
-        if "columnOrder" in data:
-            data["column_order"] = data.pop("columnOrder")
-        if "taskStats" in data:
-            data["task_stats"] = data.pop("taskStats")
-        if "createdAt" in data:
-            data["created_at"] = data.pop("createdAt")
-        if "updatedAt" in data:
-            data["updated_at"] = data.pop("updatedAt")
-        data.pop("__v", None)
-        super().__init__(**data)
-
-
-class NewlyAddedUser(BaseModel):
-    id: str
+
+class NewlyAddedUser(NodeModel):
+    id: NodeId = Field(validation_alias="_id")
     name: str
     email: str
 
-    @field_validator("id", mode="before")
-    @classmethod
-    def convert_id(cls, v):
-        if v and not _is_uuid(v):
-            return base64_to_uuid(v)
-        return v
 
-    class Config:
-        populate_by_name = True
-    
-    def __init__(self, **data):
-        if "_id" in data:
-            data["id"] = data.pop("_id")
-        super().__init__(**data)
-
-
-class ProjectAddMemberResponse(BaseModel):
+class ProjectAddMemberResponse(NodeModel):
     success: bool
     message: str
     data: ProjectAddMemberData
     newly_added_users: List[NewlyAddedUser]
 
-    class Config:
-        populate_by_name = True
-
-    def __init__(self, **data):
-        if "newlyAddedUsers" in data:
-            data["newly_added_users"] = data.pop("newlyAddedUsers")
-        super().__init__(**data)
-
 
 async def add_project_member(project_id: str, member_email: List[str], token: str) -> ProjectAddMemberResponse:
     url = f"{BASE_URL}/api/v1/projects/{project_id}/members"
@@ -503,11 +283,11 @@ async def add_project_member(project_id: str, member_email: List[str], token: st
     }
     payload = {"newMemberEmails": member_email}
 
-    async with aiohttp.ClientSession() as session:
+    async with aiohttp.ClientSession(trace_configs=[upstream_trace_config]) as session:
         async with session.post(url, json=payload, headers=headers) as response:
             if response.status == 200:
-                data = await response.json()
-                return ProjectAddMemberResponse.model_validate(data)
+                body = await response.read()
+                return ProjectAddMemberResponse.model_validate_json(body)
             elif response.status == 401:
                 raise AuthenticationError("Invalid or expired token.")
             elif response.status == 404:
@@ -523,38 +303,14 @@ async def add_project_member(project_id: str, member_email: List[str], token: st
 
 
 
-class ColumnData(BaseModel):
-    id: str
+class ColumnData(NodeModel):
+    id: NodeId = Field(validation_alias="_id")
     title: str
-    project_id: str
+    project_id: NodeId
     task_order: List[str]
     created_at: datetime
     updated_at: datetime
 
-    @field_validator("id", "project_id", mode="before")
-    @classmethod
-    def convert_ids(cls, v):
-        if v and not _is_uuid(v):
-            return base64_to_uuid(v)
-        return v
-
-    class Config:
-        populate_by_name = True
-
-    def __init__(self, **data):
-        if "_id" in data:
-            data["id"] = data.pop("_id")
-        if "projectId" in data:
-            data["project_id"] = data.pop("projectId")
-        if "taskOrder" in data:
-            data["task_order"] = data.pop("taskOrder")
-        if "createdAt" in data:
-            data["created_at"] = data.pop("createdAt")
-        if "updatedAt" in data:
-            data["updated_at"] = data.pop("updatedAt")
-        data.pop("__v", None)
-        super().__init__(**data)
-
 
 class ProjectColumnCreatedResponse(BaseModel):
     success: bool
@@ -571,12 +327,12 @@ async def create_project_columns(project_id: str, column_title: str, token: str)
     }
     payload = {"title": column_title}
 
-    async with aiohttp.ClientSession() as session:
+    async with aiohttp.ClientSession(trace_configs=[upstream_trace_config]) as session:
         async with session.post(url, headers=headers, json=payload) as response:
             if response.status == 201:
-                data = await response.json()
+                body = await response.read()
                 logger.info(f"Column created in project {project_id} successfully.")
-                return ProjectColumnCreatedResponse.model_validate(data)
+                return ProjectColumnCreatedResponse.model_validate_json(body)
             elif response.status == 401:
                 raise AuthenticationError("Invalid or expired token.")
             elif response.status == 404:
@@ -592,32 +348,17 @@ async def create_project_columns(project_id: str, column_title: str, token: str)
 
 
 
-class ProjectMember(BaseModel):
-    user_id: str
+class ProjectMember(NodeModel):
+    user_id: NodeId
     role: str
-    
-    @field_validator("user_id", mode="before")
-    @classmethod
-    def convert_user_id(cls, v):
-        if v and not _is_uuid(v):
-            return base64_to_uuid(v)
-        return v
-
-    class Config:
-        populate_by_name = True
-    
-    def __init__(self, **data):
-        if "userId" in data:
-            data["user_id"] = data.pop("userId")
-        super().__init__(**data)
-
-
-class ProjectGetData(BaseModel):
-    id: str
+
+
+class ProjectGetData(NodeModel):
+    id: NodeId = Field(validation_alias="_id")
     name: str
     description: Optional[str] = None
-    workspace_id: str
-    owner: OwnerInfo 
+    workspace_id: NodeId
+    owner: OwnerInfo = Field(validation_alias="ownerId")
     members: List[ProjectMember] 
     status: str
     task_stats: TaskStats
@@ -625,32 +366,6 @@ class ProjectGetData(BaseModel):
     deadline: Optional[datetime] = None
     updated_at: datetime
 
-    @field_validator("id", "workspace_id", mode="before")
-    @classmethod
-    def convert_ids(cls, v):
-        if v and not _is_uuid(v):
-            return base64_to_uuid(v)
-        return v
-
-    class Config:
-        populate_by_name = True
-
-    def __init__(self, **data):
-        if "_id" in data:
-            data["id"] = data.pop("_id")
-        if "workspaceId" in data:
-            data["workspace_id"] = data.pop("workspaceId")
-        if "ownerId" in data:
-            data["owner"] = data.pop("ownerId")
-        if "taskStats" in data:
-            data["task_stats"] = data.pop("taskStats")
-        if "createdAt" in data:
-            data["created_at"] = data.pop("createdAt")
-        if "updatedAt" in data:
-            data["updated_at"] = data.pop("updatedAt")
-        data.pop("__v", None)
-        super().__init__(**data)
-
 
 class ProjectListResponse(BaseModel):
     success: bool
@@ -665,11 +380,11 @@ async def get_projects(workspace_id: str, token: str) -> ProjectListResponse:
         "Authorization": f"Bearer {token}",
     }
 
-    async with aiohttp.ClientSession() as session:
+    async with aiohttp.ClientSession(trace_configs=[upstream_trace_config]) as session:
         async with session.get(url, headers=headers) as response:
             if response.status == 200:
-                data = await response.json()
-                return ProjectListResponse.model_validate(data)
+                body = await response.read()
+                return ProjectListResponse.model_validate_json(body)
             elif response.status == 401:
                 raise AuthenticationError("Invalid or expired token.")
             elif response.status == 404:
@@ -690,6 +405,17 @@ class AssigneeData(BaseModel):
     userName: str
     taskCount: int
 
+class ColumnTaskCount(BaseModel):
+    columnId: str
+    title: str | None = None
+    taskCount: int
+
+class LabelTaskCount(BaseModel):
+    labelId: str
+    text: str | None = None
+    color: str | None = None
+    taskCount: int
+
 class DashboardData(BaseModel):
     totalTasks: int
     to_do_tasks: int
@@ -701,6 +427,9 @@ class DashboardData(BaseModel):
     upcoming_deadlines_7d: list[TaskData]
     completion_rate: float
     team_workload_list: list[AssigneeData]
+    # Only filled in by the native dashboard
+    column_task_counts: list[ColumnTaskCount] = []
+    label_histogram: list[LabelTaskCount] = []
 
 
 class ProjectDashboardResponse(BaseModel):
@@ -714,12 +443,12 @@ async def get_project_dashboard(project_id: str, token: str) -> ProjectDashboard
         "accept": "*/*",
         "Authorization": f"Bearer {token}",
     }
-    async with aiohttp.ClientSession() as session:
+    async with aiohttp.ClientSession(trace_configs=[upstream_trace_config]) as session:
         async with session.get(url, headers=headers) as response:
             if response.status == 200:
-                data = await response.json()
+                body = await response.read()
                 logger.info(f"Project {project_id} dashboard retrieved successfully.")
-                return ProjectDashboardResponse.model_validate(data)
+                return ProjectDashboardResponse.model_validate_json(body)
             elif response.status == 401:
                 raise AuthenticationError("Invalid or expired token.")
             elif response.status == 404:
@@ -731,4 +460,9 @@ async def get_project_dashboard(project_id: str, token: str) -> ProjectDashboard
                 raise InternalServerError(f"Retrieval failed: {error_message}")
 
 
-
+async def stream_project_dashboard(project_id: str, token: str) -> StreamingResponse:
+    return await stream_get(
+        url=f"{BASE_URL}/api/v1/projects/{project_id}/dashboard",
+        token=token,
+        not_found_message=f"Project with ID {project_id} not found.",
+    )
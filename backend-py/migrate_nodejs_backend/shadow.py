@@ -0,0 +1,81 @@
+"""
+Shadow comparison between native writes and the Node.js backend.
+
+Writes cannot be replayed against Node.js without duplicating them, so in
+"shadow" mode the native write is authoritative and Node.js is asked to read
+the same project back. Both services share the database, which makes any
+drift in document encoding, defaults or response contract show up as a
+logged mismatch while clients keep getting the native result.
+"""
+
+from typing import Any
+
+from configs import get_logger, nodejs_backend_config
+from hooks.http_errors import NotFoundError
+from migrate_nodejs_backend.projects import get_project
+from services.background import run_in_background
+
+logger = get_logger("nodejs-backend-shadow")
+
+
+def is_native() -> bool:
+    return nodejs_backend_config.migration_mode != "proxy"
+
+
+def is_shadow() -> bool:
+    return nodejs_backend_config.migration_mode == "shadow"
+
+
+def project_fields(data: Any) -> dict[str, Any]:
+    """
+    Project fields that every native and proxied project response carries.
+    """
+    owner = getattr(data, "owner", None)
+    return {
+        "id": str(data.id),
+        "name": data.name,
+        "description": data.description,
+        "workspace_id": str(data.workspace_id),
+        "owner_id": str(owner.id if owner is not None else data.owner_id),
+        "member_ids": sorted(
+            str(member.user.id if hasattr(member, "user") else member.user_id)
+            for member in data.members
+        ),
+        "status": data.status,
+        "column_order": list(data.column_order),
+        "task_stats": data.task_stats.model_dump(),
+    }
+
+
+async def _compare_project(operation: str, project_id: str, token: str, expected: dict[str, Any] | None):
+    try:
+        proxied = await get_project(project_id=project_id, token=token)
+    except NotFoundError:
+        if expected is not None:
+            logger.warning(f"[SHADOW] {operation} {project_id}: Node.js cannot find the project")
+        return
+    except Exception as e:
+        logger.warning(f"[SHADOW] {operation} {project_id}: Node.js read failed: {e}")
+        return
+
+    if expected is None:
+        logger.warning(f"[SHADOW] {operation} {project_id}: project still visible to Node.js")
+        return
+
+    actual = project_fields(proxied.data)
+    diff = {key: (value, actual.get(key)) for key, value in expected.items() if actual.get(key) != value}
+    if diff:
+        logger.warning(f"[SHADOW] {operation} {project_id}: mismatch (native, nodejs) {diff}")
+    else:
+        logger.info(f"[SHADOW] {operation} {project_id}: match")
+
+
+def shadow_project(operation: str, project_id: str, token: str, expected: dict[str, Any] | None):
+    """
+    Schedule a background comparison of a natively written project with Node.js.
+
+    Pass `expected=None` when the project should no longer exist.
+    """
+    if not is_shadow():
+        return
+    run_in_background(_compare_project(operation, project_id, token, expected))
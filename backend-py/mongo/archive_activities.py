@@ -0,0 +1,127 @@
+"""
+Move old activity buckets out of MongoDB into gzip-compressed NDJSON files.
+
+Buckets whose hour is older than `activities.archive_after_days` are streamed
+oldest first into one file per UTC day (`activity_buckets-YYYY-MM-DD.ndjson.gz`,
+Extended JSON, one bucket per line) and deleted once their batch has been
+written and flushed. A run that is interrupted can be repeated: files are
+appended to, and a batch is at worst archived twice, never lost.
+
+The per-event `activities` documents written by Node.js are archived the same
+way once they are older than `activities.legacy_ttl_days`, and only when that
+is set (or `--legacy-older-than-days` is given); this is the only place they
+are deleted.
+
+Usage (from backend-py/):
+    python -m mongo.archive_activities [--older-than-days 30] [--out archive/activities]
+    python -m mongo.archive_activities --legacy-older-than-days 90 --dry-run
+"""
+
+import argparse
+import gzip
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from typing import IO, Any
+
+from bson.binary import UuidRepresentation
+from bson.json_util import JSONMode, JSONOptions, dumps
+
+JSON_OPTIONS = JSONOptions(json_mode=JSONMode.RELAXED, uuid_representation=UuidRepresentation.STANDARD)
+BATCH_SIZE = 1000
+
+
+def archive_collection(
+    db,
+    collection_name: str,
+    time_field: str,
+    cutoff: datetime,
+    out_dir: str,
+    dry_run: bool = False,
+) -> int:
+    """
+    Stream every document of `collection_name` with `time_field` before `cutoff`
+    into per-day NDJSON.gz files under `out_dir`, deleting each batch after it is written.
+    """
+    collection = db[collection_name]
+    query = {time_field: {"$lt": cutoff}}
+    if dry_run:
+        count = collection.count_documents(query)
+        print(f"{collection_name}: {count} documents older than {cutoff.isoformat()} would be archived")
+        return count
+
+    os.makedirs(out_dir, exist_ok=True)
+    archived = 0
+    current_day: str | None = None
+    output: IO[bytes] | None = None
+    batch_ids: list[Any] = []
+
+    def flush_batch():
+        nonlocal archived
+        if not batch_ids:
+            return
+        if output:
+            output.flush()
+            os.fsync(output.fileno())
+        collection.delete_many({"_id": {"$in": batch_ids}})
+        archived += len(batch_ids)
+        batch_ids.clear()
+
+    try:
+        for document in collection.find(query, sort=[(time_field, 1)], batch_size=BATCH_SIZE):
+            day = document[time_field].strftime("%Y-%m-%d")
+            if day != current_day:
+                flush_batch()
+                if output:
+                    output.close()
+                path = os.path.join(out_dir, f"{collection_name}-{day}.ndjson.gz")
+                output = gzip.open(path, "ab")
+                current_day = day
+            output.write(dumps(document, json_options=JSON_OPTIONS).encode() + b"\n")
+            batch_ids.append(document["_id"])
+            if len(batch_ids) >= BATCH_SIZE:
+                flush_batch()
+        flush_batch()
+    finally:
+        if output:
+            output.close()
+
+    print(f"{collection_name}: archived {archived} documents older than {cutoff.isoformat()} to {out_dir}")
+    return archived
+
+
+def main() -> int:
+    from pymongo import MongoClient
+
+    from configs import activities_config, mongo_config
+    from configs.activities_config import ActivitiesConfig
+
+    config = activities_config or ActivitiesConfig()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--older-than-days", type=int, default=config.archive_after_days)
+    parser.add_argument("--out", default=config.archive_dir, help="Directory for the NDJSON.gz files")
+    parser.add_argument(
+        "--legacy-older-than-days",
+        type=int,
+        default=config.legacy_ttl_days,
+        help="Also archive per-event `activities` documents older than this (default: activities.legacy_ttl_days)",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only count what would be archived")
+    args = parser.parse_args()
+
+    now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(days=args.older_than_days)
+    client = MongoClient(mongo_config.uri, uuidRepresentation="standard", tz_aware=True)
+    db = client[mongo_config.db_name]
+    try:
+        archive_collection(db, "activity_buckets", "hour", cutoff, args.out, args.dry_run)
+        if args.legacy_older_than_days is not None:
+            legacy_cutoff = now - timedelta(days=args.legacy_older_than_days)
+            archive_collection(db, "activities", "createdAt", legacy_cutoff, args.out, args.dry_run)
+        return 0
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,314 @@
+"""
+Materialized project boards: one `boards` document per project.
+
+GET /projects/{id}/board used to read the project, its columns, every task
+and then the users and labels those tasks reference. With
+`mongo.materialized_boards` enabled the board is kept, already assembled, in
+the `boards` collection and read with a single fetch by `_id`.
+
+The write paths keep it current with targeted updates (`board_task_saved`,
+`board_column_renamed`, ...). Every helper is a no-op while the option is
+off; if one fails, the board is dropped and rebuilt on its next read, so a
+board can be missing but is never knowingly stale. Changes made outside these
+helpers are picked up from the change stream in `services.caches`; anything
+else is repaired by rebuilding.
+
+Usage (from backend-py/):
+    python -m mongo.boards rebuild [--project PROJECT_ID]
+"""
+
+import argparse
+import asyncio
+import sys
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from functools import wraps
+from typing import Any, ParamSpec
+from uuid import UUID
+
+from beanie.operators import In
+from pydantic import BaseModel, Field
+
+from configs import get_logger, mongo_config
+from mongo.schemas import (
+    BoardCard,
+    BoardCardLabel,
+    BoardCardUser,
+    BoardColumnEntry,
+    Boards,
+    Columns,
+    Labels,
+    Projects,
+    Tasks,
+    Users,
+)
+
+logger = get_logger("boards")
+
+P = ParamSpec("P")
+
+
+class _BoardTask(BaseModel):
+    """Task fields a board card needs; description and checklists are never read"""
+    id: UUID = Field(alias="_id")
+    title: str
+    projectId: UUID
+    columnId: UUID
+    creatorId: UUID
+    dueDate: datetime | None = None
+    assignees: list[UUID] = Field(default_factory=list)
+    labels: list[UUID] = Field(default_factory=list)
+    createdAt: datetime
+    updatedAt: datetime
+
+
+class _ProjectId(BaseModel):
+    id: UUID = Field(alias="_id")
+
+
+def boards_enabled() -> bool:
+    return bool(mongo_config and mongo_config.materialized_boards)
+
+
+async def build_cards(tasks: list[Tasks] | list[_BoardTask]) -> list[BoardCard]:
+    """Board cards for `tasks`, with assignees and labels resolved in one query each."""
+    user_ids = list({user_id for task in tasks for user_id in task.assignees})
+    label_ids = list({label_id for task in tasks for label_id in task.labels})
+    users = {
+        user.id: user
+        for user in (
+            await Users.find(In(Users.id, user_ids), projection_model=BoardCardUser).to_list() if user_ids else []
+        )
+    }
+    labels = {
+        label.id: label
+        for label in (
+            await Labels.find(In(Labels.id, label_ids), projection_model=BoardCardLabel).to_list() if label_ids else []
+        )
+    }
+    return [
+        BoardCard(
+            id=task.id,
+            title=task.title,
+            projectId=task.projectId,
+            columnId=task.columnId,
+            creatorId=task.creatorId,
+            dueDate=task.dueDate,
+            # Like Node.js populate(): references to deleted users or labels are dropped
+            assignees=[users[user_id] for user_id in task.assignees if user_id in users],
+            labels=[labels[label_id] for label_id in task.labels if label_id in labels],
+            createdAt=task.createdAt,
+            updatedAt=task.updatedAt,
+        )
+        for task in tasks
+    ]
+
+
+async def build_board(project: Projects) -> Boards:
+    """Assemble the board of `project` from its columns and tasks, as Node.js getProjectBoard does."""
+    columns = await Columns.find(Columns.projectId == project.id, sort=[("createdAt", 1)]).to_list()
+    tasks = await Tasks.find(Tasks.projectId == project.id, projection_model=_BoardTask).to_list()
+    cards = {card.id: card for card in await build_cards(tasks)}
+    return Boards(
+        id=project.id,
+        name=project.name,
+        ownerId=project.ownerId,
+        members=project.members,
+        columnOrder=project.columnOrder,
+        columns=[
+            BoardColumnEntry(
+                id=column.id,
+                title=column.title,
+                createdAt=column.createdAt,
+                updatedAt=column.updatedAt,
+                tasks=[cards[task_id] for task_id in column.taskOrder if task_id in cards],
+            )
+            for column in columns
+        ],
+    )
+
+
+async def rebuild_board(project_id: UUID) -> Boards | None:
+    """Rebuild and store the board of a project; None (and no board) if the project is gone."""
+    project = await Projects.get(project_id)
+    if project is None:
+        await drop_board(project_id)
+        return None
+    board = await build_board(project)
+    await Boards.get_pymongo_collection().replace_one(
+        {"_id": project_id},
+        board.model_dump(by_alias=True),
+        upsert=True,
+    )
+    return board
+
+
+async def drop_board(project_id: UUID):
+    await Boards.get_pymongo_collection().delete_one({"_id": project_id})
+
+
+async def drop_boards(query: dict[str, Any]):
+    """Drop every board matching `query`; they are rebuilt on their next read."""
+    result = await Boards.get_pymongo_collection().delete_many(query)
+    if result.deleted_count:
+        logger.info(f"Dropped {result.deleted_count} boards matching {query}")
+
+
+def _maintains_board(
+    func: Callable[P, Awaitable[Any]],
+) -> Callable[P, Awaitable[None]]:
+    """
+    Run a board update only when boards are materialized. Failures are logged
+    and drop the board (first argument is always the project id) instead of
+    failing the write that triggered them.
+    """
+    @wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> None:
+        if not boards_enabled():
+            return
+        try:
+            await func(*args, **kwargs)
+        except Exception as e:
+            project_id = args[0]
+            logger.error(f"{func.__name__} failed for board {project_id}, dropping it: {e}")
+            try:
+                await drop_board(project_id)
+            except Exception as drop_error:
+                logger.error(f"Could not drop board {project_id}: {drop_error}")
+
+    return wrapper
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+@_maintains_board
+async def board_task_saved(project_id: UUID, task: Tasks, position: int | None = None):
+    """Put the card of a created or moved task into its column, at `position` (default: last)."""
+    card = (await build_cards([task]))[0]
+    collection = Boards.get_pymongo_collection()
+    # Two writes: pulling from every column and pushing into one touch the same array path.
+    await collection.update_one({"_id": project_id}, {"$pull": {"columns.$[].tasks": {"_id": task.id}}})
+    push: dict[str, Any] = {"$each": [card.model_dump(by_alias=True)]}
+    if position is not None:
+        push["$position"] = position
+    await collection.update_one(
+        {"_id": project_id},
+        {"$push": {"columns.$[c].tasks": push}, "$set": {"updatedAt": _now()}},
+        array_filters=[{"c._id": task.columnId}],
+    )
+
+
+@_maintains_board
+async def board_task_updated(project_id: UUID, task: Tasks):
+    """Replace the card of a task that stayed in its column (fields, assignees, labels)."""
+    card = (await build_cards([task]))[0]
+    result = await Boards.get_pymongo_collection().update_one(
+        {"_id": project_id},
+        {"$set": {"columns.$[].tasks.$[t]": card.model_dump(by_alias=True), "updatedAt": _now()}},
+        array_filters=[{"t._id": task.id}],
+    )
+    # The card always changes (updatedAt), so a board that matched but did not change lacks it.
+    if result.matched_count and not result.modified_count:
+        logger.warning(f"Task {task.id} missing from board {project_id}, dropping it")
+        await drop_board(project_id)
+
+
+@_maintains_board
+async def board_task_deleted(project_id: UUID, task_id: UUID):
+    await Boards.get_pymongo_collection().update_one(
+        {"_id": project_id},
+        {"$pull": {"columns.$[].tasks": {"_id": task_id}}, "$set": {"updatedAt": _now()}},
+    )
+
+
+@_maintains_board
+async def board_column_created(project_id: UUID, column: Columns):
+    entry = BoardColumnEntry(
+        id=column.id,
+        title=column.title,
+        createdAt=column.createdAt,
+        updatedAt=column.updatedAt,
+    )
+    await Boards.get_pymongo_collection().update_one(
+        {"_id": project_id},
+        {
+            "$push": {"columns": entry.model_dump(by_alias=True), "columnOrder": column.id},
+            "$set": {"updatedAt": _now()},
+        },
+    )
+
+
+@_maintains_board
+async def board_column_renamed(project_id: UUID, column_id: UUID, title: str, updated_at: datetime):
+    await Boards.get_pymongo_collection().update_one(
+        {"_id": project_id},
+        {"$set": {"columns.$[c].title": title, "columns.$[c].updatedAt": updated_at, "updatedAt": _now()}},
+        array_filters=[{"c._id": column_id}],
+    )
+
+
+@_maintains_board
+async def board_column_deleted(project_id: UUID):
+    # Its tasks move to a neighbouring column in taskOrder order; rebuilding is simpler than replaying that.
+    await rebuild_board(project_id)
+
+
+@_maintains_board
+async def board_project_changed(project_id: UUID, project: Projects):
+    """Copy the project fields shown on the board (name, owner, members, column order)."""
+    await Boards.get_pymongo_collection().update_one(
+        {"_id": project_id},
+        {"$set": {
+            "name": project.name,
+            "ownerId": project.ownerId,
+            "members": [member.model_dump() for member in project.members],
+            "columnOrder": project.columnOrder,
+            "updatedAt": _now(),
+        }},
+    )
+
+
+@_maintains_board
+async def board_project_deleted(project_id: UUID):
+    await drop_board(project_id)
+
+
+async def _rebuild(project_id: UUID | None) -> int:
+    from beanie import init_beanie
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    from clients.mongo_client import client_options
+    from mongo.schemas import DocumentModels
+
+    client = AsyncIOMotorClient(mongo_config.uri, **client_options(mongo_config))
+    try:
+        await init_beanie(database=client[mongo_config.db_name], document_models=DocumentModels)
+        project_ids = [project_id] if project_id else [
+            project.id for project in await Projects.find_all(projection_model=_ProjectId).to_list()
+        ]
+        rebuilt = 0
+        for current_id in project_ids:
+            if await rebuild_board(current_id) is not None:
+                rebuilt += 1
+        if project_id is None:
+            # Boards of projects deleted behind our back
+            await drop_boards({"_id": {"$nin": project_ids}})
+        print(f"Rebuilt {rebuilt} boards")
+        return 0
+    finally:
+        client.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    rebuild = subcommands.add_parser("rebuild", help="Rebuild materialized boards from projects, columns and tasks")
+    rebuild.add_argument("--project", type=UUID, help="Only rebuild this project's board")
+    args = parser.parse_args()
+    return asyncio.run(_rebuild(args.project))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,239 @@
+"""
+Declarative index catalog for the Mongo collections.
+
+`INDEXES` is the single source of truth: `mongo/schemas.py` hands each list
+to Beanie through `Settings.indexes`, and this module's CLI applies the
+catalog online and checks that the router queries in `QUERY_SHAPES` are
+served by an index.
+
+Usage (from backend-py/):
+    python -m mongo.indexes apply [--drop-unlisted]
+    python -m mongo.indexes explain
+"""
+
+import argparse
+import sys
+from datetime import datetime, timezone
+from typing import Any
+from uuid import uuid4
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+
+from configs import activities_config
+from configs.activities_config import ActivitiesConfig
+
+_activities = activities_config or ActivitiesConfig()
+_DAY = 24 * 60 * 60
+
+INDEXES: dict[str, list[IndexModel]] = {
+    "users": [
+        IndexModel([("email", ASCENDING)], unique=True),
+    ],
+    "workspaces": [
+        IndexModel([("ownerId", ASCENDING)]),
+        IndexModel([("members.userId", ASCENDING)]),
+    ],
+    "projects": [
+        IndexModel([("workspaceId", ASCENDING)]),
+        IndexModel([("members.userId", ASCENDING)]),
+    ],
+    "columns": [
+        IndexModel([("projectId", ASCENDING)]),
+    ],
+    "tasks": [
+        # Boards and dashboards: every task of a project, grouped by column
+        IndexModel([("projectId", ASCENDING), ("columnId", ASCENDING)]),
+        IndexModel([("columnId", ASCENDING)]),
+        # My tasks: tasks assigned to a user ordered by due date, then creation date
+        IndexModel([("assignees", ASCENDING), ("dueDate", ASCENDING), ("createdAt", ASCENDING)]),
+    ],
+    "labels": [
+        IndexModel([("projectId", ASCENDING), ("text", ASCENDING)]),
+        # My tasks filtered by label text
+        IndexModel([("text", ASCENDING)]),
+    ],
+    "comments": [
+        IndexModel([("taskId", ASCENDING), ("createdAt", ASCENDING)]),
+    ],
+    "activities": [
+        # Activity feed: newest first per project
+        IndexModel([("projectId", ASCENDING), ("createdAt", DESCENDING)]),
+        IndexModel([("taskId", ASCENDING)]),
+        # Per-event documents Node.js still writes, oldest first for mongo.archive_activities.
+        # No TTL: they are only deleted once archived.
+        IndexModel([("createdAt", ASCENDING)]),
+    ],
+    "activity_buckets": [
+        # One bucket per project and hour, upserted by record_activity
+        IndexModel([("projectId", ASCENDING), ("hour", DESCENDING)], unique=True),
+        IndexModel([("hour", ASCENDING)], name="hour_ttl", expireAfterSeconds=_activities.ttl_days * _DAY),
+    ],
+    "boards": [
+        # Boards are read by _id; these find the boards to drop when a column, label or user changes
+        IndexModel([("columns._id", ASCENDING)]),
+        IndexModel([("columns.tasks.labels._id", ASCENDING)]),
+        IndexModel([("columns.tasks.assignees._id", ASCENDING)]),
+    ],
+    "memberships": [
+        # Access checks and "projects/workspaces of user" (projectId None for workspace rows)
+        IndexModel([("userId", ASCENDING), ("projectId", ASCENDING), ("workspaceId", ASCENDING)], unique=True),
+        # Re-syncing the rows of one project or workspace
+        IndexModel([("projectId", ASCENDING)]),
+        IndexModel([("workspaceId", ASCENDING), ("projectId", ASCENDING)]),
+    ],
+}
+
+# Indexes of earlier catalogs that conflict with the current one (same key, other options);
+# dropped before the catalog is applied.
+OBSOLETE_INDEXES: dict[str, list[str]] = {
+    # TTL on the legacy activities' createdAt, which deleted them without archiving them
+    "activities": ["createdAt_ttl"],
+}
+
+# Router queries that must be answered by an index: (name, collection, filter, sort)
+_SAMPLE_ID = uuid4()
+_SAMPLE_TIME = datetime(2000, 1, 1, tzinfo=timezone.utc)
+QUERY_SHAPES: list[tuple[str, str, dict[str, Any], dict[str, int] | None]] = [
+    ("login: user by email", "users", {"email": "user@example.com"}, None),
+    ("workspaces owned by user", "workspaces", {"ownerId": _SAMPLE_ID}, None),
+    ("workspaces joined by user", "workspaces", {"members.userId": _SAMPLE_ID}, None),
+    ("workspaces of user", "workspaces", {"$or": [{"ownerId": _SAMPLE_ID}, {"members.userId": _SAMPLE_ID}]}, None),
+    ("projects in workspace", "projects", {"workspaceId": _SAMPLE_ID}, None),
+    ("projects joined by user", "projects", {"members.userId": _SAMPLE_ID}, None),
+    ("columns of project", "columns", {"projectId": _SAMPLE_ID}, None),
+    ("board tasks", "tasks", {"projectId": _SAMPLE_ID, "columnId": _SAMPLE_ID}, None),
+    ("dashboard tasks", "tasks", {"projectId": _SAMPLE_ID}, None),
+    ("tasks of column", "tasks", {"columnId": _SAMPLE_ID}, None),
+    ("my tasks by due date", "tasks", {"assignees": _SAMPLE_ID, "dueDate": {"$ne": None}}, {"dueDate": ASCENDING, "createdAt": ASCENDING}),
+    ("my tasks without due date", "tasks", {"assignees": _SAMPLE_ID, "dueDate": None}, {"createdAt": ASCENDING}),
+    ("labels of project", "labels", {"projectId": _SAMPLE_ID}, None),
+    ("labels by text", "labels", {"text": "High Priority"}, None),
+    ("search tasks in projects", "tasks", {"projectId": {"$in": [_SAMPLE_ID]}, "$or": [{"title": {"$regex": "x", "$options": "i"}}]}, None),
+    ("comments of task", "comments", {"taskId": _SAMPLE_ID}, {"createdAt": ASCENDING}),
+    ("project activity feed", "activities", {"projectId": _SAMPLE_ID}, {"createdAt": DESCENDING}),
+    ("task activities", "activities", {"taskId": _SAMPLE_ID}, None),
+    ("project activity buckets", "activity_buckets", {"projectId": _SAMPLE_ID}, {"hour": DESCENDING}),
+    ("activity buckets to archive", "activity_buckets", {"hour": {"$lt": _SAMPLE_TIME}}, {"hour": ASCENDING}),
+    ("legacy activities to archive", "activities", {"createdAt": {"$lt": _SAMPLE_TIME}}, {"createdAt": ASCENDING}),
+    ("project access check", "memberships", {"userId": _SAMPLE_ID, "projectId": _SAMPLE_ID}, None),
+    ("workspace rows of user", "memberships", {"userId": _SAMPLE_ID, "projectId": None}, None),
+    ("project rows of user", "memberships", {"userId": _SAMPLE_ID, "projectId": {"$ne": None}}, None),
+]
+
+_FORBIDDEN_STAGES = {"COLLSCAN", "SORT"}
+
+
+def _plan_stages(plan: dict[str, Any]) -> set[str]:
+    stages = {plan.get("stage", "")}
+    for key in ("inputStage", "queryPlan"):
+        if key in plan:
+            stages |= _plan_stages(plan[key])
+    for child in plan.get("inputStages", []):
+        stages |= _plan_stages(child)
+    return stages
+
+
+def ttl_changes(models: list[IndexModel], index_information: dict[str, Any]) -> list[tuple[str, int]]:
+    """
+    (name, expireAfterSeconds) of existing TTL indexes whose expiry differs from the catalog.
+
+    createIndexes refuses to change the option of an existing index, so a new
+    TTL from app-config.yaml has to be applied with collMod first.
+    """
+    changes = []
+    for model in models:
+        document = model.document
+        if "expireAfterSeconds" in document and document["name"] in index_information:
+            if index_information[document["name"]].get("expireAfterSeconds") != document["expireAfterSeconds"]:
+                changes.append((document["name"], document["expireAfterSeconds"]))
+    return changes
+
+
+async def sync_index_options(db):
+    """
+    Async (Motor) variant of the obsolete-index and TTL steps of `apply_indexes`,
+    run before Beanie creates indexes.
+    """
+    for collection_name, models in INDEXES.items():
+        index_information = await db[collection_name].index_information()
+        for name in OBSOLETE_INDEXES.get(collection_name, []):
+            if name in index_information:
+                await db[collection_name].drop_index(name)
+        for name, seconds in ttl_changes(models, index_information):
+            await db.command("collMod", collection_name, index={"name": name, "expireAfterSeconds": seconds})
+
+
+def apply_indexes(db, drop_unlisted: bool = False):
+    """
+    Create every catalog index that is missing; optionally drop the ones not in the catalog.
+    """
+    for collection_name, models in INDEXES.items():
+        collection = db[collection_name]
+        index_information = collection.index_information()
+        for name in OBSOLETE_INDEXES.get(collection_name, []):
+            if name in index_information:
+                collection.drop_index(name)
+                print(f"{collection_name}: dropped obsolete {name}")
+        for name, seconds in ttl_changes(models, index_information):
+            db.command("collMod", collection_name, index={"name": name, "expireAfterSeconds": seconds})
+            print(f"{collection_name}: {name} now expires after {seconds}s")
+        created = collection.create_indexes(models)
+        print(f"{collection_name}: ensured {', '.join(created)}")
+
+        if drop_unlisted:
+            wanted = {model.document["name"] for model in models} | {"_id_"}
+            for name in collection.index_information():
+                if name not in wanted:
+                    collection.drop_index(name)
+                    print(f"{collection_name}: dropped {name}")
+
+
+def explain_queries(db) -> list[str]:
+    """
+    Explain every query in QUERY_SHAPES and return the ones that scan or sort in memory.
+    """
+    failures = []
+    for name, collection_name, query_filter, sort in QUERY_SHAPES:
+        command: dict[str, Any] = {"find": collection_name, "filter": query_filter}
+        if sort:
+            command["sort"] = sort
+        explain = db.command("explain", command, verbosity="queryPlanner")
+        stages = _plan_stages(explain["queryPlanner"]["winningPlan"])
+        bad = stages & _FORBIDDEN_STAGES
+        status = "FAIL" if bad else "ok"
+        print(f"[{status:>4}] {name:<32} {collection_name:<11} {' -> '.join(sorted(s for s in stages if s))}")
+        if bad:
+            failures.append(f"{name}: {', '.join(sorted(bad))}")
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    apply_parser = subparsers.add_parser("apply", help="Create the catalog indexes")
+    apply_parser.add_argument("--drop-unlisted", action="store_true", help="Drop indexes that are not in the catalog")
+    subparsers.add_parser("explain", help="Fail if a router query needs a COLLSCAN or an in-memory SORT")
+    args = parser.parse_args()
+
+    from pymongo import MongoClient
+
+    from configs import mongo_config
+
+    client = MongoClient(mongo_config.uri, uuidRepresentation="standard")
+    db = client[mongo_config.db_name]
+    try:
+        if args.command == "apply":
+            apply_indexes(db, drop_unlisted=args.drop_unlisted)
+            return 0
+
+        failures = explain_queries(db)
+        if failures:
+            print("\nQueries without a usable index:\n  " + "\n  ".join(failures))
+            return 1
+        return 0
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
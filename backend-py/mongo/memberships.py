@@ -0,0 +1,154 @@
+"""
+Denormalized membership rows: (userId, workspaceId, projectId, role).
+
+Workspaces and projects keep their members embedded, so "is user X in
+project Y" needs the project document and "which projects can X see" a
+multikey query over projects. With `mongo.membership_index` enabled both are
+answered from the small `memberships` rows through the (userId, projectId)
+index. Workspace rows have `projectId` None.
+
+Rows are derived data: `sync_workspace_memberships` / `sync_project_memberships`
+rewrite the rows of one workspace or project from its document and are called
+wherever members change. A missing row only costs a fallback read to the
+project document (see `api.dependencies.get_project_role`), but an existing
+row is trusted: member and project writes made by Node.js (outside migration
+mode "native") reach the rows only through the change-stream subscriber in
+`services.caches`, which is why the config refuses `membership_index`
+without `cache.enabled` there.
+
+Usage (from backend-py/):
+    python -m mongo.memberships rebuild
+"""
+
+import argparse
+import asyncio
+import sys
+from typing import Any
+from uuid import UUID, uuid4
+
+from pymongo import DeleteMany, UpdateOne
+
+from configs import get_logger, mongo_config
+from mongo.schemas import Memberships, Projects, Workspaces
+
+logger = get_logger("memberships")
+
+
+def membership_index_enabled() -> bool:
+    return bool(mongo_config and mongo_config.membership_index)
+
+
+def member_roles(owner_id: UUID, members: list[Any]) -> dict[UUID, str]:
+    """Role of every member of a workspace or project; the owner is always "owner"."""
+    roles = {member.userId: member.role for member in members}
+    roles[owner_id] = "owner"
+    return roles
+
+
+async def _sync(scope: dict[str, Any], workspace_id: UUID, roles: dict[UUID, str]):
+    await Memberships.get_pymongo_collection().bulk_write(
+        [
+            DeleteMany({**scope, "userId": {"$nin": list(roles)}}),
+            *(
+                UpdateOne(
+                    {**scope, "userId": user_id},
+                    {"$set": {"workspaceId": workspace_id, "role": role}, "$setOnInsert": {"_id": uuid4()}},
+                    upsert=True,
+                )
+                for user_id, role in roles.items()
+            ),
+        ],
+        ordered=False,
+    )
+
+
+async def sync_workspace_memberships(workspace: Workspaces):
+    if membership_index_enabled():
+        await _sync(
+            {"workspaceId": workspace.id, "projectId": None},
+            workspace.id,
+            member_roles(workspace.ownerId, workspace.members),
+        )
+
+
+async def sync_project_memberships(project: Projects):
+    if membership_index_enabled():
+        await _sync({"projectId": project.id}, project.workspaceId, member_roles(project.ownerId, project.members))
+
+
+async def drop_project_memberships(project_id: UUID):
+    if membership_index_enabled():
+        await Memberships.get_pymongo_collection().delete_many({"projectId": project_id})
+
+
+async def indexed_project_role(user_id: UUID, project_id: UUID) -> str | None:
+    """Role from the membership rows; None when there is no row or the index is disabled."""
+    if not membership_index_enabled():
+        return None
+    row = await Memberships.get_pymongo_collection().find_one(
+        {"userId": user_id, "projectId": project_id},
+        {"role": 1},
+    )
+    return row["role"] if row else None
+
+
+async def user_project_roles(user_id: UUID, workspace_id: UUID | None = None) -> dict[UUID, str]:
+    """Projects of a user (optionally in one workspace) with the user's role, from the rows."""
+    query: dict[str, Any] = {"userId": user_id, "projectId": {"$ne": None}}
+    if workspace_id is not None:
+        query["workspaceId"] = workspace_id
+    cursor = Memberships.get_pymongo_collection().find(query, {"projectId": 1, "role": 1})
+    return {row["projectId"]: row["role"] async for row in cursor}
+
+
+async def user_workspace_ids(user_id: UUID) -> list[UUID]:
+    cursor = Memberships.get_pymongo_collection().find({"userId": user_id, "projectId": None}, {"workspaceId": 1})
+    return [row["workspaceId"] async for row in cursor]
+
+
+async def rebuild_memberships() -> int:
+    """Rewrite every row from the workspace and project documents; returns the number of rows."""
+    collection = Memberships.get_pymongo_collection()
+    workspace_ids, project_ids = [], []
+    async for workspace in Workspaces.find_all():
+        await _sync(
+            {"workspaceId": workspace.id, "projectId": None},
+            workspace.id,
+            member_roles(workspace.ownerId, workspace.members),
+        )
+        workspace_ids.append(workspace.id)
+    async for project in Projects.find_all():
+        await _sync({"projectId": project.id}, project.workspaceId, member_roles(project.ownerId, project.members))
+        project_ids.append(project.id)
+    # Rows of workspaces and projects deleted behind our back
+    await collection.delete_many({"projectId": None, "workspaceId": {"$nin": workspace_ids}})
+    await collection.delete_many({"projectId": {"$nin": [None, *project_ids]}})
+    return await collection.count_documents({})
+
+
+async def _rebuild() -> int:
+    from beanie import init_beanie
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    from clients.mongo_client import client_options
+    from mongo.schemas import DocumentModels
+
+    client = AsyncIOMotorClient(mongo_config.uri, **client_options(mongo_config))
+    try:
+        await init_beanie(database=client[mongo_config.db_name], document_models=DocumentModels)
+        print(f"Rebuilt memberships: {await rebuild_memberships()} rows")
+        return 0
+    finally:
+        client.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    subcommands.add_parser("rebuild", help="Rewrite the membership rows from workspaces and projects")
+    parser.parse_args()
+    return asyncio.run(_rebuild())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+Slim read models for list and search endpoints.
+
+Passed as `projection_model=` to Beanie's `find`, they make Mongo return only
+the fields a view needs, so long descriptions, checklists and member lists
+neither cross the wire nor get validated when a list does not show them.
+"""
+
+from datetime import datetime
+from typing import Any, AsyncIterator, TypeVar
+from uuid import UUID
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pydantic import BaseModel, Field
+
+from mongo.schemas import ChecklistItem, ProjectMember
+
+
+class ProjectRefView(BaseModel):
+    id: UUID = Field(alias="_id")
+
+
+class ProjectNameView(BaseModel):
+    id: UUID = Field(alias="_id")
+    name: str
+
+
+class ProjectWorkspaceView(BaseModel):
+    id: UUID = Field(alias="_id")
+    name: str
+    workspaceId: UUID
+
+
+class ProjectSummaryView(BaseModel):
+    id: UUID = Field(alias="_id")
+    name: str
+    description: str | None = None
+    workspaceId: UUID
+    status: str = "active"
+    deadline: datetime | None = None
+    createdAt: datetime
+    updatedAt: datetime
+
+
+class ProjectMembershipView(BaseModel):
+    id: UUID = Field(alias="_id")
+    name: str
+    workspaceId: UUID
+    members: list[ProjectMember] = Field(default_factory=list)
+
+
+class ColumnTitleView(BaseModel):
+    id: UUID = Field(alias="_id")
+    title: str
+
+
+class LabelTextView(BaseModel):
+    id: UUID = Field(alias="_id")
+    text: str
+
+
+class TaskSearchView(BaseModel):
+    id: UUID = Field(alias="_id")
+    title: str
+    description: str | None = None
+    projectId: UUID
+    columnId: UUID
+    dueDate: datetime | None = None
+    labels: list[UUID] = Field(default_factory=list)
+    createdAt: datetime
+    updatedAt: datetime
+
+
+class TaskListView(BaseModel):
+    """Fields of `TaskResponse`, without Beanie's revision and comment lookups."""
+    id: UUID = Field(alias="_id")
+    title: str
+    description: str | None = None
+    projectId: UUID
+    columnId: UUID
+    creatorId: UUID
+    assignees: list[UUID] = Field(default_factory=list)
+    dueDate: datetime | None = None
+    labels: list[UUID] = Field(default_factory=list)
+    checklists: list[ChecklistItem] = Field(default_factory=list)
+    createdAt: datetime
+    updatedAt: datetime
+
+
+View = TypeVar("View", bound=BaseModel)
+
+# Documents fetched per cursor round trip by `iter_view`.
+DEFAULT_BATCH_SIZE = 100
+
+
+def projection_of(view: type[BaseModel]) -> dict[str, int]:
+    """Mongo projection selecting the (aliased) fields of `view`."""
+    return {field.alias or name: 1 for name, field in view.model_fields.items()}
+
+
+async def iter_view(
+    collection: AsyncIOMotorCollection,
+    query_filter: dict[str, Any],
+    view: type[View],
+    sort: list[tuple[str, int]] | None = None,
+    skip: int = 0,
+    limit: int = 0,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> AsyncIterator[View]:
+    """
+    Stream `view`s of the matching documents, `batch_size` documents per round trip.
+
+    Only one batch of raw documents is held at a time; `limit` is pushed to the
+    server so the cursor is closed as soon as the page is filled.
+    """
+    cursor = collection.find(
+        query_filter,
+        projection_of(view),
+        sort=sort,
+        skip=skip,
+        limit=limit,
+        batch_size=min(batch_size, limit) if limit else batch_size,
+    )
+    async for document in cursor:
+        yield view.model_validate(document)
+
+
+async def find_view(
+    collection: AsyncIOMotorCollection,
+    query_filter: dict[str, Any],
+    view: type[View],
+    sort: list[tuple[str, int]] | None = None,
+    skip: int = 0,
+    limit: int = 0,
+) -> list[View]:
+    """
+    `find(..., projection_model=view)` for a raw collection, e.g. one with a
+    non-default read preference from `MongoClient.collection`.
+    """
+    return [item async for item in iter_view(collection, query_filter, view, sort=sort, skip=skip, limit=limit)]
@@ -1,15 +1,18 @@
 import time
 from datetime import datetime, timezone
+from typing import Any
 from uuid import UUID, uuid4
 
-from beanie import Document, Indexed
-from pydantic import BaseModel, EmailStr, Field
+from beanie import Document
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+
+from mongo.indexes import INDEXES
 
 
 class Users(Document):
     id: UUID = Field(default_factory=uuid4, alias="_id")
     name: str
-    email: Indexed(EmailStr, unique=True)
+    email: EmailStr
     passwordHash: str
     avatarUrl: str | None = None
     createdAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -18,6 +21,7 @@ class Users(Document):
     class Settings:
         name = "users"
         validate_on_save = True
+        indexes = INDEXES["users"]
 
 
 class WorkspaceMember(BaseModel):
@@ -36,6 +40,7 @@ class Workspaces(Document):
     class Settings:
         name = "workspaces"
         validate_on_save = True
+        indexes = INDEXES["workspaces"]
 
 
 class ProjectMember(BaseModel):
@@ -62,9 +67,7 @@ class Projects(Document):
     class Settings:
         name = "projects"
         validate_on_save = True
-        indexes = [
-            "workspaceId",
-        ]
+        indexes = INDEXES["projects"]
 
 
 class Columns(Document):
@@ -78,9 +81,7 @@ class Columns(Document):
     class Settings:
         name = "columns"
         validate_on_save = True
-        indexes = [
-            "projectId",
-        ]
+        indexes = INDEXES["columns"]
 
 class ChecklistItem(BaseModel):
     """Individual checklist item within a task"""
@@ -104,12 +105,7 @@ class Tasks(Document):
     class Settings:
         name = "tasks"
         validate_on_save = True
-        indexes = [
-            "projectId",
-            "columnId",
-            "dueDate",
-            "assignees",
-        ]
+        indexes = INDEXES["tasks"]
 
 class Labels(Document):
     id: UUID = Field(default_factory=uuid4, alias="_id")
@@ -120,9 +116,7 @@ class Labels(Document):
     class Settings:
         name = "labels"
         validate_on_save = True
-        indexes = [
-            "projectId",
-        ]
+        indexes = INDEXES["labels"]
 
 
 class Comments(Document):
@@ -135,27 +129,115 @@ class Comments(Document):
     class Settings:
         name = "comments"
         validate_on_save = True
-        indexes = [
-            "taskId",
-        ]
+        indexes = INDEXES["comments"]
 
 class Activities(Document):
     id: UUID = Field(default_factory=uuid4, alias="_id")
     projectId: UUID
-    taskId: UUID
+    taskId: UUID | None = None  # None for project/column level activities
     userId: UUID
     action: str  # e.g. "created task", "updated task", "added comment"
-    details: dict[str, str] = Field(default_factory=dict)
+    details: dict[str, Any] = Field(default_factory=dict)
     createdAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
     class Settings:
         name = "activities"
         validate_on_save = True
-        indexes = [
-            "projectId",
-            "taskId",
-            "createdAt",
-        ]
+        indexes = INDEXES["activities"]
+
+
+class ActivityEvent(BaseModel):
+    """Single activity inside an hourly bucket"""
+    taskId: UUID | None = None
+    userId: UUID
+    action: str
+    details: dict[str, Any] = Field(default_factory=dict)
+    createdAt: datetime
+
+
+class ActivityBuckets(Document):
+    """All activities of one project in one hour; written by `utils.activity_log.record_activity`"""
+    id: UUID = Field(default_factory=uuid4, alias="_id")
+    projectId: UUID
+    hour: datetime  # start of the hour, UTC; the TTL index expires buckets relative to it
+    eventCount: int = 0
+    events: list[ActivityEvent] = Field(default_factory=list)
+
+    class Settings:
+        name = "activity_buckets"
+        validate_on_save = True
+        indexes = INDEXES["activity_buckets"]
+
+
+class BoardCardUser(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+    id: UUID = Field(alias="_id")
+    name: str
+    avatarUrl: str | None = None
+
+
+class BoardCardLabel(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+    id: UUID = Field(alias="_id")
+    text: str
+    color: str | None = None
+
+
+class BoardCard(BaseModel):
+    """Task as shown on a board card: no description or checklists, assignees and labels resolved"""
+    model_config = ConfigDict(populate_by_name=True)
+    id: UUID = Field(alias="_id")
+    title: str
+    projectId: UUID
+    columnId: UUID
+    creatorId: UUID
+    dueDate: datetime | None = None
+    assignees: list[BoardCardUser] = Field(default_factory=list)
+    labels: list[BoardCardLabel] = Field(default_factory=list)
+    createdAt: datetime
+    updatedAt: datetime
+
+
+class BoardColumnEntry(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+    id: UUID = Field(alias="_id")
+    title: str
+    createdAt: datetime
+    updatedAt: datetime
+    tasks: list[BoardCard] = Field(default_factory=list)  # in the column's taskOrder
+
+
+class Boards(Document):
+    """Materialized board of one project (`_id` is the project id), maintained by `mongo.boards`"""
+    id: UUID = Field(alias="_id")
+    name: str
+    ownerId: UUID
+    members: list[ProjectMember] = Field(default_factory=list)
+    columnOrder: list[UUID] = Field(default_factory=list)
+    columns: list[BoardColumnEntry] = Field(default_factory=list)  # by creation time, like Node.js
+    updatedAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+    class Settings:
+        name = "boards"
+        validate_on_save = True
+        indexes = INDEXES["boards"]
+
+
+class Memberships(Document):
+    """
+    One row per (user, workspace) with `projectId` None, and per (user, project);
+    owners included. Derived from Workspaces/Projects members by `mongo.memberships`.
+    """
+    id: UUID = Field(default_factory=uuid4, alias="_id")
+    userId: UUID
+    workspaceId: UUID
+    projectId: UUID | None = None
+    role: str = Field(default="member")  # 'owner', 'admin', 'member'
+
+    class Settings:
+        name = "memberships"
+        validate_on_save = True
+        indexes = INDEXES["memberships"]
 
 
 DocumentModels = [
@@ -166,4 +248,7 @@ DocumentModels = [
     Tasks,
     Labels,
     Comments,
-    Activities,]
\ No newline at end of file
+    Activities,
+    ActivityBuckets,
+    Boards,
+    Memberships,]
\ No newline at end of file
@@ -0,0 +1,42 @@
+"""
+Fire-and-forget work started by requests: WebSocket broadcasts, shadow
+comparisons, board refreshes.
+
+`run_in_background` keeps a reference to every task until it is done (the
+event loop only holds a weak one), and `drain_background_tasks` lets the
+lifespan shutdown wait for them before the Mongo client is closed.
+"""
+
+import asyncio
+from collections.abc import Coroutine
+from typing import Any
+
+from configs import get_logger
+
+logger = get_logger("background")
+
+_pending: set[asyncio.Task] = set()
+
+
+def run_in_background(coroutine: Coroutine[Any, Any, Any]) -> asyncio.Task:
+    task = asyncio.create_task(coroutine)
+    _pending.add(task)
+    task.add_done_callback(_pending.discard)
+    return task
+
+
+def pending_background_tasks() -> int:
+    return len(_pending)
+
+
+async def drain_background_tasks(timeout: float):
+    """Wait up to `timeout` seconds for pending background tasks, then cancel the rest."""
+    if not _pending:
+        return
+    logger.info(f"Waiting for {len(_pending)} background task(s)")
+    _, unfinished = await asyncio.wait(set(_pending), timeout=timeout)
+    for task in unfinished:
+        task.cancel()
+    if unfinished:
+        logger.warning(f"Cancelled {len(unfinished)} background task(s) still running after {timeout:.0f} s")
+        await asyncio.gather(*unfinished, return_exceptions=True)
@@ -0,0 +1,118 @@
+"""
+In-process caches kept coherent by `services.change_stream`.
+
+Every cache is attached to `invalidation_bus` with the collections whose
+changes affect it; it only serves entries while the change stream is live
+(`cache.enabled` is switched by the consumer).
+
+Materialized boards (`mongo.boards`) are maintained by the Python write
+paths; the bus only drops the boards touched by writes those paths never
+see: Node.js project and column writes outside native mode, and user or
+label edits. Membership rows (`mongo.memberships`) are re-synced from Node.js
+project writes the same way.
+"""
+
+from typing import Any
+from uuid import UUID
+
+from configs import cache_config, get_logger
+from configs.cache_config import CacheConfig
+from migrate_nodejs_backend.shadow import is_native
+from mongo.boards import boards_enabled, drop_boards
+from mongo.memberships import (
+    drop_project_memberships,
+    membership_index_enabled,
+    sync_project_memberships,
+)
+from mongo.schemas import Projects, Users
+from services.background import run_in_background
+from services.change_stream import InvalidationEvent, invalidation_bus
+from services.ttl_cache import TTLCache
+
+logger = get_logger("caches")
+
+_config = cache_config or CacheConfig()
+
+# Users by id, read on every authenticated request by `get_current_user`.
+users_cache: TTLCache[UUID, Users] = TTLCache("users", _config.ttl_seconds, _config.max_entries)
+invalidation_bus.attach_cache(users_cache, ["users"], lambda event: event.document_id)
+
+
+# Fields copied onto boards, per collection; other updates leave boards alone.
+_BOARD_FIELDS = {
+    "projects": {"name", "ownerId", "members", "columnOrder"},
+    "columns": {"title"},
+    "users": {"name", "avatarUrl"},
+    "labels": {"text", "color"},
+}
+
+
+def _boards_query(event: InvalidationEvent) -> dict[str, Any] | None:
+    """Boards affected by `event`, or None when they are already up to date."""
+    if event.operation == "reset":
+        return {}
+    if event.operation == "update" and not any(
+        field.split(".")[0] in _BOARD_FIELDS[event.collection] for field in event.updated_fields
+    ):
+        return None
+    if event.collection == "users":
+        return {"columns.tasks.assignees._id": event.document_id}
+    if event.collection == "labels":
+        # A new label is on no card yet
+        return None if event.operation == "insert" else {"columns.tasks.labels._id": event.document_id}
+    if is_native():
+        # Project and column writes go through native_projects / native_columns
+        return None
+    if event.collection == "projects":
+        return {"_id": event.document_id}
+    if event.operation == "insert":
+        return {"_id": event.project_id} if event.project_id else {}
+    return {"columns._id": event.document_id}
+
+
+async def _drop_boards(query: dict[str, Any]):
+    try:
+        await drop_boards(query)
+    except Exception as e:
+        logger.error(f"Could not drop boards matching {query}: {e}")
+
+
+def _drop_affected_boards(event: InvalidationEvent):
+    if not boards_enabled():
+        return
+    query = _boards_query(event)
+    if query is None:
+        return
+    run_in_background(_drop_boards(query))
+
+
+invalidation_bus.subscribe(["projects", "columns", "users", "labels"], _drop_affected_boards)
+
+
+_MEMBERSHIP_FIELDS = {"members", "ownerId", "workspaceId"}
+
+
+async def _resync_memberships(project_id: UUID):
+    try:
+        project = await Projects.get(project_id)
+        if project is None:
+            await drop_project_memberships(project_id)
+        else:
+            await sync_project_memberships(project)
+    except Exception as e:
+        logger.error(f"Could not re-sync memberships of project {project_id}: {e}")
+
+
+def _resync_project_memberships(event: InvalidationEvent):
+    # Native writes sync their rows themselves. After a reset, missing rows are
+    # re-synced on the next access check; `python -m mongo.memberships rebuild` fixes the rest.
+    if not membership_index_enabled() or is_native() or event.operation == "reset":
+        return
+    if event.operation == "update" and not any(
+        field.split(".")[0] in _MEMBERSHIP_FIELDS for field in event.updated_fields
+    ):
+        return
+    run_in_background(_resync_memberships(event.document_id))
+
+
+invalidation_bus.subscribe(["projects"], _resync_project_memberships)
@@ -0,0 +1,262 @@
+"""
+Cache invalidation driven by MongoDB change streams.
+
+Node.js writes to the same database, so in-process caches cannot rely on the
+Python API seeing every write. `ChangeStreamConsumer` watches the database
+for changes to the collections in `WATCHED_COLLECTIONS` and publishes an
+`InvalidationEvent` for each one on `invalidation_bus`; caches attached to the
+bus drop the affected entries. The last processed resume token is stored in
+Mongo, so a restarted consumer continues where it stopped. If the oplog no
+longer holds that point, the consumer starts from now and publishes a
+"reset" event that empties every cache.
+
+Caches are only served while the stream is open: they are enabled once the
+watch cursor is established and disabled and cleared when it drops.
+
+Usage (prints events; needs a replica set, see database-mongo/docker-compose.replset.yaml):
+    python -m services.change_stream
+"""
+
+import asyncio
+import time
+from collections.abc import Callable, Hashable, Iterable
+from datetime import datetime, timezone
+from typing import Any, Literal
+from uuid import UUID
+
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pydantic import BaseModel
+from pymongo.errors import OperationFailure, PyMongoError
+
+from configs import get_logger
+from configs.cache_config import CacheConfig
+from services.ttl_cache import TTLCache
+
+logger = get_logger("change-stream")
+
+WatchedCollection = Literal["users", "projects", "columns", "tasks", "labels"]
+WATCHED_COLLECTIONS: tuple[WatchedCollection, ...] = ("users", "projects", "columns", "tasks", "labels")
+
+# ChangeStreamHistoryLost, ChangeStreamFatalError, InvalidResumeToken
+_RESUME_FAILED_CODES = {286, 280, 260}
+_RETRY_DELAYS = (0.5, 1, 2, 5, 10)
+
+
+class InvalidationEvent(BaseModel):
+    collection: WatchedCollection
+    # "reset" means events may have been missed: drop everything cached for the collection.
+    operation: Literal["insert", "update", "replace", "delete", "reset"]
+    document_id: Any | None = None
+    # Owning project of columns, tasks and labels, when the change carries it (not on deletes).
+    project_id: UUID | None = None
+    updated_fields: list[str] = []
+
+    @classmethod
+    def from_change(cls, change: dict[str, Any]) -> "InvalidationEvent":
+        full_document = change.get("fullDocument") or {}
+        description = change.get("updateDescription") or {}
+        return cls(
+            collection=change["ns"]["coll"],
+            operation=change["operationType"],
+            document_id=change.get("documentKey", {}).get("_id"),
+            project_id=full_document.get("projectId"),
+            updated_fields=[*description.get("updatedFields", {}), *description.get("removedFields", [])],
+        )
+
+
+Handler = Callable[[InvalidationEvent], None]
+
+
+class InvalidationBus:
+    def __init__(self):
+        self._handlers: dict[str, list[Handler]] = {}
+        self._caches: list[TTLCache[Any, Any]] = []
+
+    def subscribe(self, collections: Iterable[WatchedCollection], handler: Handler):
+        for collection in collections:
+            self._handlers.setdefault(collection, []).append(handler)
+
+    def attach_cache(
+        self,
+        cache: TTLCache[Any, Any],
+        collections: Iterable[WatchedCollection],
+        key: Callable[[InvalidationEvent], Hashable | None],
+    ):
+        """
+        Invalidate `key(event)` in `cache` on every change to `collections`;
+        a None key (or a reset) clears the whole cache.
+        """
+        def handle(event: InvalidationEvent):
+            cache_key = None if event.operation == "reset" else key(event)
+            if cache_key is None:
+                cache.clear()
+            else:
+                cache.invalidate(cache_key)
+
+        self._caches.append(cache)
+        self.subscribe(collections, handle)
+
+    def publish(self, event: InvalidationEvent):
+        for handler in self._handlers.get(event.collection, []):
+            try:
+                handler(event)
+            except Exception as e:
+                logger.error(f"Invalidation handler failed for {event.collection} {event.operation}: {e}")
+
+    def reset(self):
+        for collection in WATCHED_COLLECTIONS:
+            self.publish(InvalidationEvent(collection=collection, operation="reset"))
+
+    def set_live(self, live: bool):
+        for cache in self._caches:
+            cache.enabled = live
+            if not live:
+                cache.clear()
+
+
+invalidation_bus = InvalidationBus()
+
+
+class ChangeStreamConsumer:
+    def __init__(
+        self,
+        db: AsyncIOMotorDatabase[Any],
+        config: CacheConfig,
+        bus: InvalidationBus = invalidation_bus,
+        collections: Iterable[WatchedCollection] = WATCHED_COLLECTIONS,
+    ):
+        self.db = db
+        self.config = config
+        self.bus = bus
+        self.collections = list(collections)
+        self._token: dict[str, Any] | None = None
+        self._saved_token: dict[str, Any] | None = None
+        self._last_flush = 0.0
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def pipeline(self) -> list[dict[str, Any]]:
+        return [
+            {"$match": {"$or": [
+                {
+                    "ns.coll": {"$in": self.collections},
+                    "operationType": {"$in": ["insert", "update", "replace", "delete", "drop", "rename"]},
+                },
+                {"operationType": {"$in": ["dropDatabase", "invalidate"]}},
+            ]}},
+            # Keep events small: only the owning project of the looked-up document is needed.
+            {"$project": {
+                "operationType": 1,
+                "ns": 1,
+                "documentKey": 1,
+                "updateDescription": 1,
+                "fullDocument.projectId": 1,
+            }},
+        ]
+
+    async def start(self):
+        tokens = self.db[self.config.resume_token_collection]
+        stored = await tokens.find_one({"_id": self.config.consumer_name})
+        self._token = self._saved_token = stored["token"] if stored else None
+        self._task = asyncio.create_task(self._run())
+        logger.info(f"Change stream consumer started ({'resuming' if self._token else 'from now'})")
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.bus.set_live(False)
+        await self._flush_token()
+        logger.info("Change stream consumer stopped")
+
+    async def _run(self):
+        attempt = 0
+        while True:
+            try:
+                async with self.db.watch(
+                    self.pipeline,
+                    full_document="updateLookup",
+                    resume_after=self._token,
+                ) as stream:
+                    self.bus.set_live(True)
+                    attempt = 0
+                    async for change in stream:
+                        self._dispatch(change)
+                        self._token = stream.resume_token
+                        if time.monotonic() - self._last_flush >= self.config.token_flush_seconds:
+                            await self._flush_token()
+            except asyncio.CancelledError:
+                raise
+            except OperationFailure as e:
+                self.bus.set_live(False)
+                if e.code in _RESUME_FAILED_CODES:
+                    logger.warning(f"Cannot resume change stream ({e.code}), restarting from now and resetting caches")
+                    self._token = None
+                    await self._flush_token()
+                    self.bus.reset()
+                    continue
+                logger.error(f"Change stream failed: {e}")
+            except PyMongoError as e:
+                self.bus.set_live(False)
+                logger.error(f"Change stream interrupted: {e}")
+
+            delay = _RETRY_DELAYS[min(attempt, len(_RETRY_DELAYS) - 1)]
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def _dispatch(self, change: dict[str, Any]):
+        operation = change["operationType"]
+        if operation in ("drop", "rename", "dropDatabase", "invalidate"):
+            collection = change.get("ns", {}).get("coll")
+            if collection in self.collections:
+                self.bus.publish(InvalidationEvent(collection=collection, operation="reset"))
+            else:
+                self.bus.reset()
+            return
+        self.bus.publish(InvalidationEvent.from_change(change))
+
+    async def _flush_token(self):
+        self._last_flush = time.monotonic()
+        if self._token == self._saved_token:
+            return
+        try:
+            await self.db[self.config.resume_token_collection].update_one(
+                {"_id": self.config.consumer_name},
+                {"$set": {"token": self._token, "updatedAt": datetime.now(timezone.utc)}},
+                upsert=True,
+            )
+            self._saved_token = self._token
+        except PyMongoError as e:
+            logger.error(f"Could not store change stream resume token: {e}")
+
+
+async def _print_events():
+    from motor.motor_asyncio import AsyncIOMotorClient
+
+    from configs import mongo_config
+
+    client = AsyncIOMotorClient(mongo_config.uri, uuidRepresentation="standard")
+    bus = InvalidationBus()
+    bus.subscribe(WATCHED_COLLECTIONS, lambda event: print(event.model_dump_json()))
+    consumer = ChangeStreamConsumer(
+        client[mongo_config.db_name],
+        CacheConfig(enabled=True, consumer_name="change-stream-cli"),
+        bus=bus,
+    )
+    await consumer.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await consumer.stop()
+        client.close()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(_print_events())
+    except KeyboardInterrupt:
+        pass
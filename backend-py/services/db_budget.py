@@ -0,0 +1,185 @@
+"""
+Per-request Mongo call budgets and slow-command logging, configured under `db_budget`.
+
+`DBBudgetMiddleware` gives every HTTP request a `RequestDBUsage` in a context
+variable; `DBBudgetListener`, a pymongo command listener on the motor client,
+adds each command's count, driver-measured time and query shape to it (motor
+runs commands with a copy of the caller's context, which holds the same usage
+object). When the response is done the request is checked against its
+route's budget, and an over-budget request is logged with its most repeated
+query shapes: a hundred `find tasks {_id}` in one request is an N+1 loop.
+
+Query shapes keep the command, the collection and the filter's field names
+and operators, never values: `find tasks {_id:$in, projectId}`.
+
+Tests assert budgets with `db_call_budget`, which sees every request
+completed inside the block, whichever thread served it:
+
+    with db_call_budget(max_db_calls=3) as usages:
+        client.get(f"/api/v1/tasks/{task_id}")
+"""
+
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from pymongo import monitoring
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from configs import db_budget_config, get_logger
+from configs.db_budget_config import DBBudget
+from services.metrics import SIZE_BUCKETS, histogram
+
+logger = get_logger("db-budget")
+
+http_request_db_calls = histogram(
+    "http_request_db_calls",
+    "Mongo commands issued per HTTP request, by route template.",
+    ("route",),
+    buckets=SIZE_BUCKETS,
+)
+
+# Where the filter of each command lives
+_FILTER_PATHS: dict[str, tuple[Any, ...]] = {
+    "find": ("filter",),
+    "count": ("query",),
+    "distinct": ("query",),
+    "findAndModify": ("query",),
+    "delete": ("deletes", 0, "q"),
+    "update": ("updates", 0, "q"),
+    "aggregate": ("pipeline", 0, "$match"),
+}
+
+
+def filter_shape(query: Any) -> str:
+    """Field names and operators of a filter, values dropped."""
+    if not isinstance(query, dict):
+        return ""
+    fields = []
+    for key, value in query.items():
+        if key in ("$and", "$or", "$nor") and isinstance(value, list):
+            fields.append(f"{key}[{' | '.join(filter_shape(clause) for clause in value)}]")
+        elif isinstance(value, dict) and value and all(str(op).startswith("$") for op in value):
+            fields.append(f"{key}:{','.join(sorted(value))}")
+        else:
+            fields.append(key)
+    return "{" + ", ".join(sorted(fields)) + "}"
+
+
+def command_shape(command_name: str, command: Any) -> str:
+    if not command:
+        return command_name
+    collection = command.get("collection") if command_name == "getMore" else command.get(command_name)
+    query: Any = command
+    for step in _FILTER_PATHS.get(command_name, ()):
+        try:
+            query = query[step]
+        except (KeyError, IndexError, TypeError):
+            query = None
+            break
+    shape = f"{command_name} {collection}" if isinstance(collection, str) else command_name
+    return f"{shape} {filter_shape(query)}" if command_name in _FILTER_PATHS and query is not None else shape
+
+
+@dataclass
+class RequestDBUsage:
+    route: str = "unmatched"
+    calls: int = 0
+    db_ms: float = 0
+    shapes: Counter = field(default_factory=Counter)
+
+    def over(self, budget: DBBudget) -> bool:
+        return self.calls > budget.max_calls or self.db_ms > budget.max_db_ms
+
+    def describe(self, shapes: int) -> str:
+        repeated = ", ".join(f"{count}x {shape}" for shape, count in self.shapes.most_common(shapes))
+        return f"{self.route}: {self.calls} Mongo calls, {self.db_ms:.1f} ms in Mongo; top shapes: {repeated}"
+
+
+_usage: ContextVar[RequestDBUsage | None] = ContextVar("db_usage", default=None)
+# Open `db_call_budget` blocks, each collecting the usage of requests completed inside it
+_observers: list[list[RequestDBUsage]] = []
+
+
+def route_budget(route: str) -> DBBudget:
+    return db_budget_config.routes.get(route, db_budget_config.default)
+
+
+class DBBudgetListener(monitoring.CommandListener):
+    """Command listener adding each command to the current request's `RequestDBUsage`."""
+
+    def __init__(self):
+        self._started: dict[tuple[int, object], tuple[RequestDBUsage | None, str]] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        self._started[(event.request_id, event.connection_id)] = (
+            _usage.get(),
+            command_shape(event.command_name, event.command),
+        )
+
+    def _finished(self, event: monitoring.CommandSucceededEvent | monitoring.CommandFailedEvent):
+        usage, shape = self._started.pop((event.request_id, event.connection_id), (None, event.command_name))
+        elapsed_ms = event.duration_micros / 1000
+        if usage is not None:
+            usage.calls += 1
+            usage.db_ms += elapsed_ms
+            usage.shapes[shape] += 1
+        if elapsed_ms > db_budget_config.slow_command_ms:
+            route = usage.route if usage is not None else "background"
+            logger.warning(f"Slow Mongo command ({elapsed_ms:.1f} ms) in {route}: {shape}")
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        self._finished(event)
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        self._finished(event)
+
+
+def mongo_event_listeners() -> list[monitoring.CommandListener]:
+    return [DBBudgetListener()] if db_budget_config and db_budget_config.enabled else []
+
+
+class DBBudgetMiddleware:
+    """ASGI middleware checking each HTTP request's Mongo usage against its route's budget."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not (db_budget_config and db_budget_config.enabled):
+            await self.app(scope, receive, send)
+            return
+
+        usage = RequestDBUsage(route=scope["path"])
+        token = _usage.set(usage)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _usage.reset(token)
+            usage.route = getattr(scope.get("route"), "path", None) or "unmatched"
+            http_request_db_calls.observe(usage.calls, usage.route)
+            if usage.over(route_budget(usage.route)):
+                logger.warning(f"DB budget exceeded by {scope['method']} {usage.describe(db_budget_config.report_shapes)}")
+            for observer in _observers:
+                observer.append(usage)
+
+
+@contextmanager
+def db_call_budget(max_db_calls: int, max_db_ms: float | None = None) -> Iterator[list[RequestDBUsage]]:
+    """
+    Collect the usage of every request completed inside the block and raise
+    AssertionError if one of them issued more than `max_db_calls` commands (or
+    spent more than `max_db_ms` in Mongo).
+    """
+    usages: list[RequestDBUsage] = []
+    _observers.append(usages)
+    try:
+        yield usages
+    finally:
+        _observers.remove(usages)
+    budget = DBBudget(max_calls=max_db_calls, max_db_ms=max_db_ms if max_db_ms is not None else float("inf"))
+    over = [usage.describe(10) for usage in usages if usage.over(budget)]
+    assert not over, f"Over budget of {max_db_calls} Mongo calls: " + "; ".join(over)
@@ -0,0 +1,135 @@
+"""
+Event-loop lag sampling and blocking-call detection, configured under `loop_monitor`.
+
+`LoopLagSampler` sleeps `sample_interval_ms` in a loop and records how late it
+wakes up in `event_loop_lag_seconds`: any lag means some callback held the loop,
+and every WebSocket send and request waiting on it was delayed as long.
+
+With `blocking_debug`, `BlockingCallWatchdog` also runs a thread that expects a
+heartbeat from the loop every few milliseconds. When the heartbeat is older
+than `blocking_threshold_ms`, the loop is stuck inside a callback, and the
+watchdog logs the loop thread's current stack: the blocking call itself
+(bcrypt, a synchronous HTTP request, a large `json.dumps`), not just the
+handler it was called from. One stack is logged per stall.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+
+from configs import get_logger, loop_monitor_config
+from configs.loop_monitor_config import LoopMonitorConfig
+from services.metrics import counter, gauge, histogram, register_collector
+
+logger = get_logger("loop-monitor")
+
+event_loop_lag_seconds = histogram(
+    "event_loop_lag_seconds",
+    "How late the event loop ran a sleep that was due; time other callbacks held the loop.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+event_loop_max_lag_seconds = gauge(
+    "event_loop_max_lag_seconds",
+    "Largest event loop lag since the previous scrape of /metrics.",
+)
+event_loop_stalls = counter(
+    "event_loop_stalls_total",
+    "Stalls longer than loop_monitor.blocking_threshold_ms caught by the watchdog (blocking_debug only).",
+)
+
+
+class LoopLagSampler:
+    def __init__(self, interval_seconds: float):
+        self.interval_seconds = interval_seconds
+        self._task: asyncio.Task | None = None
+        self._max_lag = 0.0
+
+    async def _run(self):
+        while True:
+            due = time.perf_counter() + self.interval_seconds
+            await asyncio.sleep(self.interval_seconds)
+            lag = max(time.perf_counter() - due, 0.0)
+            event_loop_lag_seconds.observe(lag)
+            self._max_lag = max(self._max_lag, lag)
+
+    def collect_metrics(self):
+        event_loop_max_lag_seconds.set(self._max_lag)
+        self._max_lag = 0.0
+
+    def start(self):
+        self._task = asyncio.create_task(self._run(), name="loop-lag-sampler")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+class BlockingCallWatchdog:
+    def __init__(self, threshold_seconds: float):
+        self.threshold_seconds = threshold_seconds
+        self._heartbeat = time.monotonic()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _beat(self):
+        self._heartbeat = time.monotonic()
+        if not self._stop.is_set():
+            self._loop.call_later(self.threshold_seconds / 4, self._beat)
+
+    def _watch(self):
+        reported = 0.0
+        while not self._stop.wait(self.threshold_seconds / 4):
+            heartbeat = self._heartbeat
+            stalled = time.monotonic() - heartbeat
+            if stalled < self.threshold_seconds or heartbeat == reported:
+                continue
+            reported = heartbeat
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            event_loop_stalls.inc()
+            stack = "".join(traceback.format_stack(frame))
+            logger.warning(f"Event loop blocked for {stalled * 1000:.0f} ms so far; loop thread is at:\n{stack}")
+
+    def start(self):
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._stop.clear()
+        self._beat()
+        self._thread = threading.Thread(target=self._watch, name="blocking-call-watchdog", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+class LoopMonitor:
+    """The lag sampler, plus the watchdog when `blocking_debug` is on; started from the app's lifespan."""
+
+    def __init__(self, config: LoopMonitorConfig):
+        self.sampler = LoopLagSampler(config.sample_interval_ms / 1000)
+        self.watchdog = BlockingCallWatchdog(config.blocking_threshold_ms / 1000) if config.blocking_debug else None
+
+    def start(self):
+        self.sampler.start()
+        if self.watchdog is not None:
+            self.watchdog.start()
+            logger.info(f"Blocking call watchdog on, threshold {self.watchdog.threshold_seconds * 1000:.0f} ms")
+
+    async def stop(self):
+        if self.watchdog is not None:
+            self.watchdog.stop()
+        await self.sampler.stop()
+
+
+loop_monitor = LoopMonitor(loop_monitor_config or LoopMonitorConfig())
+register_collector(loop_monitor.sampler.collect_metrics)
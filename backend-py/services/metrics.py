@@ -0,0 +1,410 @@
+"""
+In-process metrics in the Prometheus text format, served at `GET /metrics`.
+
+Histograms and gauges live in this process: nothing is pushed anywhere, a
+Prometheus server (or `curl`) scrapes the endpoint. Recording an observation
+is a bisect over the bucket bounds and two additions under the GIL, so the
+hooks on the hot paths cost a few microseconds:
+
+- `MetricsMiddleware`: HTTP and WebSocket request latency by route template;
+- `MongoCommandMetrics`: Mongo command latency by collection and command,
+  registered on the motor client;
+- `upstream_trace_config`: latency of calls to the Node.js backend by method
+  and path, with id segments collapsed;
+- `ws_broadcast_seconds` / `ws_broadcast_recipients`: WebSocket fan-out.
+
+Values that are cheaper to read than to maintain (room sizes) are computed by
+collectors when the endpoint is scraped (see `register_collector`).
+
+Under `api.serve` every worker process has its own values, and a scrape is
+answered by whichever worker accepts it. `worker_metrics` therefore has each
+worker write a snapshot of its metrics to the supervisor's directory every
+`metrics.worker_snapshot_seconds`; the answering worker merges them with its
+own current values: histograms and counters are summed over the workers (an
+exited worker's last counts are kept), gauges get one series per live worker
+with a `worker` (pid) label.
+
+The endpoint is gated by the `metrics` config (`scrape_allowed`): it can be
+turned off, or restricted to a bearer token and to client networks.
+"""
+
+import asyncio
+import hmac
+import json
+import os
+import re
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from ipaddress import ip_address
+from pathlib import Path
+from types import SimpleNamespace
+
+from aiohttp import (
+    ClientSession,
+    TraceConfig,
+    TraceRequestEndParams,
+    TraceRequestExceptionParams,
+    TraceRequestStartParams,
+)
+from pymongo import monitoring
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from configs.metrics_config import MetricsConfig
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+Labels = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Labels, values: Labels, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Histogram:
+    """Cumulative-bucket histogram, one series per label combination."""
+
+    def __init__(self, name: str, documentation: str, label_names: Labels = (), buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = buckets
+        # labels -> [per-bucket counts (+Inf last), sum]
+        self._series: dict[Labels, list] = {}
+
+    def observe(self, value: float, *labels: str):
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series.setdefault(labels, [[0] * (len(self.buckets) + 1), 0.0])
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+
+    def samples(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        for labels, (counts, total) in list(self._series.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                le = 'le="+Inf"' if bound == "+Inf" else f'le="{_format_value(bound)}"'
+                yield f"{self.name}_bucket{_format_labels(self.label_names, labels, le)} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.label_names, labels)} {total!r}"
+            yield f"{self.name}_count{_format_labels(self.label_names, labels)} {cumulative}"
+
+    def snapshot(self) -> list:
+        return [[list(labels), series] for labels, series in list(self._series.items())]
+
+    def empty(self) -> "Histogram":
+        return Histogram(self.name, self.documentation, self.label_names, self.buckets)
+
+    def merge(self, snapshot: list, worker: str):
+        for labels, (counts, total) in snapshot:
+            series = self._series.setdefault(tuple(labels), [[0] * (len(self.buckets) + 1), 0.0])
+            series[0] = [a + b for a, b in zip(series[0], counts)]
+            series[1] += total
+
+
+class Gauge:
+    """Gauge set, incremented or decremented in place, one series per label combination."""
+
+    def __init__(self, name: str, documentation: str, label_names: Labels = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._values: dict[Labels, float] = {} if label_names else {(): 0}
+
+    def set(self, value: float, *labels: str):
+        self._values[labels] = value
+
+    def inc(self, amount: float = 1, *labels: str):
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def dec(self, amount: float = 1, *labels: str):
+        self.inc(-amount, *labels)
+
+    def samples(self) -> Iterable[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} gauge"
+        for labels, value in list(self._values.items()):
+            yield f"{self.name}{_format_labels(self.label_names, labels)} {_format_value(value)}"
+
+    def snapshot(self) -> list:
+        return [[list(labels), value] for labels, value in list(self._values.items())]
+
+    def empty(self) -> "Gauge":
+        # Lag, backlog or room sizes of different workers do not add up: one series per worker
+        return Gauge(self.name, self.documentation, (*self.label_names, "worker"))
+
+    def merge(self, snapshot: list, worker: str):
+        for labels, value in snapshot:
+            self._values[(*labels, worker)] = value
+
+
+class Counter(Gauge):
+    """Monotonic counter, one series per label combination."""
+
+    def samples(self) -> Iterable[str]:
+        for line in super().samples():
+            yield line.replace(" gauge", " counter", 1) if line.startswith("# TYPE") else line
+
+    def empty(self) -> "Counter":
+        return Counter(self.name, self.documentation, self.label_names)
+
+    def merge(self, snapshot: list, worker: str):
+        for labels, value in snapshot:
+            self.inc(value, *labels)
+
+
+_METRICS: list[Histogram | Gauge] = []
+_COLLECTORS: list[Callable[[], None]] = []
+
+
+def histogram(name: str, documentation: str, label_names: Labels = (), buckets: tuple[float, ...] = LATENCY_BUCKETS) -> Histogram:
+    metric = Histogram(name, documentation, label_names, buckets)
+    _METRICS.append(metric)
+    return metric
+
+
+def gauge(name: str, documentation: str, label_names: Labels = ()) -> Gauge:
+    metric = Gauge(name, documentation, label_names)
+    _METRICS.append(metric)
+    return metric
+
+
+def counter(name: str, documentation: str, label_names: Labels = ()) -> Counter:
+    metric = Counter(name, documentation, label_names)
+    _METRICS.append(metric)
+    return metric
+
+
+def register_collector(collector: Callable[[], None]):
+    """Run `collector` before every scrape, to set gauges that are computed on demand."""
+    _COLLECTORS.append(collector)
+
+
+class WorkerMetrics:
+    """Snapshots of the metrics of every `api.serve` worker, merged when one of them is scraped."""
+
+    def __init__(self):
+        # Set by the supervisor before it forks the workers; None when serving with one process
+        self.directory: Path | None = None
+        self._task: asyncio.Task | None = None
+
+    @property
+    def active(self) -> bool:
+        return self.directory is not None
+
+    def snapshot_path(self, pid: int, exited: bool = False) -> Path:
+        return self.directory / f"metrics-{pid}{'.exited' if exited else ''}.json"
+
+    def start(self, interval: float):
+        if self.directory is not None:
+            self._task = asyncio.create_task(self._run(interval), name="metrics-snapshots")
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self, interval: float):
+        while True:
+            self.write()
+            await asyncio.sleep(interval)
+
+    def write(self):
+        path = self.snapshot_path(os.getpid())
+        partial = path.with_suffix(".tmp")
+        partial.write_text(json.dumps({metric.name: metric.snapshot() for metric in _METRICS}))
+        os.replace(partial, path)
+
+    def worker_exited(self, pid: int):
+        """Called by the supervisor: keep the worker's last counts, drop its gauges."""
+        path = self.snapshot_path(pid)
+        if path.exists():
+            path.replace(self.snapshot_path(pid, exited=True))
+
+    def render(self) -> str:
+        self.write()
+        merged = [metric.empty() for metric in _METRICS]
+        for path in self.directory.glob("metrics-*.json"):
+            worker, _, state = path.name.removeprefix("metrics-").removesuffix(".json").partition(".")
+            try:
+                snapshot = json.loads(path.read_text())
+            except (OSError, ValueError):
+                # Replaced or removed while listing
+                continue
+            for metric in merged:
+                if state and type(metric) is Gauge:
+                    continue
+                metric.merge(snapshot.get(metric.name, []), worker)
+        return "\n".join(line for metric in merged for line in metric.samples()) + "\n"
+
+
+worker_metrics = WorkerMetrics()
+
+
+def render_metrics() -> str:
+    for collector in _COLLECTORS:
+        collector()
+    if worker_metrics.active:
+        return worker_metrics.render()
+    return "\n".join(line for metric in _METRICS for line in metric.samples()) + "\n"
+
+
+def scrape_allowed(request: Request, config: MetricsConfig) -> bool:
+    """Whether `request` may read /metrics: from an allowed network and with the bearer token, when configured."""
+    if config.allowed_ips:
+        try:
+            client = ip_address(request.client.host) if request.client else None
+        except ValueError:
+            client = None
+        if client is None or not any(client in network for network in config.allowed_ips):
+            return False
+    if config.bearer_token:
+        scheme, _, token = request.headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(token.encode(), config.bearer_token.encode()):
+            return False
+    return True
+
+
+http_request_seconds = histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template, until the response has been sent.",
+    ("method", "route", "status"),
+)
+websocket_session_seconds = histogram(
+    "websocket_session_duration_seconds",
+    "WebSocket session duration by route template.",
+    ("route",),
+    buckets=(1, 10, 60, 300, 900, 3600, 14400),
+)
+mongo_command_seconds = histogram(
+    "mongo_command_duration_seconds",
+    "MongoDB command latency as measured by the driver.",
+    ("collection", "command", "outcome"),
+)
+upstream_request_seconds = histogram(
+    "nodejs_request_duration_seconds",
+    "Latency of requests to the Node.js backend, until the response headers arrive.",
+    ("method", "path", "status"),
+)
+ws_broadcast_seconds = histogram(
+    "ws_broadcast_duration_seconds",
+    "Time to send one event to every client of a project room.",
+)
+ws_broadcast_recipients = histogram(
+    "ws_broadcast_recipients",
+    "Number of clients an event is sent to.",
+    buckets=SIZE_BUCKETS,
+)
+ws_broadcasts_in_flight = gauge(
+    "ws_broadcasts_in_flight",
+    "Broadcasts started and not yet sent to every client: the WebSocket send backlog.",
+)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording `http_request_duration_seconds` and
+    `websocket_session_duration_seconds`.
+
+    Routes are labelled by their template (`/api/v1/tasks/{task_id}`), read from
+    the route FastAPI stores in the scope once it has matched the request;
+    unmatched paths share the "unmatched" label so ids never become labels.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = SimpleNamespace(code=500)
+
+        async def send_with_status(message: Message):
+            if message["type"] == "http.response.start":
+                status.code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status if scope["type"] == "http" else send)
+        finally:
+            route = scope.get("route")
+            template = getattr(route, "path", None) or "unmatched"
+            elapsed = time.perf_counter() - started
+            if scope["type"] == "http":
+                http_request_seconds.observe(elapsed, scope["method"], template, str(status.code))
+            else:
+                websocket_session_seconds.observe(elapsed, template)
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """Command listener recording `mongo_command_duration_seconds`; pass it in `event_listeners`."""
+
+    def __init__(self):
+        self._collections: dict[tuple[int, object], str] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        target = event.command.get(event.command_name) if event.command else None
+        if event.command_name == "getMore":
+            target = event.command.get("collection")
+        self._collections[(event.request_id, event.connection_id)] = target if isinstance(target, str) else ""
+
+    def _finished(self, event: monitoring.CommandSucceededEvent | monitoring.CommandFailedEvent, outcome: str):
+        collection = self._collections.pop((event.request_id, event.connection_id), "")
+        mongo_command_seconds.observe(event.duration_micros / 1_000_000, collection, event.command_name, outcome)
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        self._finished(event, "success")
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        self._finished(event, "failure")
+
+
+_ID_SEGMENT = re.compile(r"^(?=.*\d)[0-9A-Za-z_\-+=]{16,}$")
+
+
+def upstream_path(path: str) -> str:
+    """`/api/v1/projects/6f1c.../board` -> `/api/v1/projects/{id}/board`, to keep label values bounded."""
+    return "/".join("{id}" if _ID_SEGMENT.match(segment) else segment for segment in path.split("/"))
+
+
+async def _on_request_start(session: ClientSession, context: SimpleNamespace, params: TraceRequestStartParams):
+    context.started = time.perf_counter()
+
+
+async def _on_request_end(session: ClientSession, context: SimpleNamespace, params: TraceRequestEndParams):
+    upstream_request_seconds.observe(
+        time.perf_counter() - context.started, params.method, upstream_path(params.url.path), str(params.response.status)
+    )
+
+
+async def _on_request_exception(session: ClientSession, context: SimpleNamespace, params: TraceRequestExceptionParams):
+    upstream_request_seconds.observe(
+        time.perf_counter() - context.started, params.method, upstream_path(params.url.path), "error"
+    )
+
+
+upstream_trace_config = TraceConfig()
+upstream_trace_config.on_request_start.append(_on_request_start)
+upstream_trace_config.on_request_end.append(_on_request_end)
+upstream_trace_config.on_request_exception.append(_on_request_exception)
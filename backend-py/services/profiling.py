@@ -0,0 +1,190 @@
+"""
+On-demand request profiling, configured under `profiling`.
+
+`ProfilingMiddleware` profiles a request when an admin (a user listed in
+`profiling.admin_user_ids`) sends `X-Profile: 1`, or when the request is
+picked by `sample_ratio`. While the request runs, a `RequestProfiler` thread
+samples the request's asyncio task every `interval_ms`:
+
+- when the task is running, the stack of the event loop thread from the
+  task's outermost coroutine down (pydantic validation, JSON encoding, ...);
+- when the task is suspended, the chain of coroutines it is awaiting through,
+  ending in `[await <what>]`, so time spent waiting on Mongo or the Node.js
+  backend lands under the call that is waiting.
+
+Samples are weighted by the wall time they stand for, in microseconds, and
+written as folded stacks (`frame;frame;frame weight`), which flamegraph.pl,
+inferno and speedscope read. The profile id is returned in the `X-Profile-Id`
+response header and the profile is served to admins at `/api/v1/profiles/{id}`.
+
+The middleware is only installed when `profiling.enabled` is true; other
+requests then cost one header lookup.
+"""
+
+import asyncio
+import os
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from types import FrameType
+from uuid import uuid4
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from configs import get_logger, profiling_config
+from core.security import get_user_id_from_token
+
+logger = get_logger("profiling")
+
+PROFILE_SUFFIX = ".folded"
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    path = code.co_filename
+    for prefix in sys.path:
+        if prefix and path.startswith(prefix):
+            path = path[len(prefix):].lstrip(os.sep)
+            break
+    return f"{code.co_name} ({path}:{code.co_firstlineno})".replace(";", ",")
+
+
+def _awaited_frames(task: asyncio.Task) -> tuple[list[FrameType], object | None]:
+    """Frames of the coroutines `task` is awaiting through, outermost first, and what the innermost awaits."""
+    frames = []
+    awaitable: object | None = task.get_coro()
+    while awaitable is not None:
+        frame = getattr(awaitable, "cr_frame", None) or getattr(awaitable, "gi_frame", None)
+        if frame is None:
+            break
+        frames.append(frame)
+        awaitable = getattr(awaitable, "cr_await", None) or getattr(awaitable, "gi_yieldfrom", None)
+    return frames, awaitable
+
+
+class RequestProfiler:
+    """Thread sampling one asyncio task's stack until stopped."""
+
+    def __init__(self, task: asyncio.Task, interval_seconds: float):
+        self.task = task
+        self.interval_seconds = interval_seconds
+        self.stacks: Counter[str] = Counter()
+        self._loop_thread_id = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def _sample(self) -> str | None:
+        frames, awaited = _awaited_frames(self.task)
+        if not frames:
+            return None
+        labels = [_frame_label(frame) for frame in frames]
+        if awaited is not None:
+            # Awaiting a Future shows up as its C iterator
+            awaited_name = "Future" if type(awaited).__name__ == "FutureIter" else type(awaited).__name__
+            return ";".join([*labels, f"[await {awaited_name}]"])
+
+        # The innermost coroutine is executing: take the loop thread's stack from the task's outermost coroutine down
+        frame = sys._current_frames().get(self._loop_thread_id)
+        running = []
+        while frame is not None and frame is not frames[0]:
+            running.append(frame)
+            frame = frame.f_back
+        if frame is None:
+            # Between two steps of the task
+            return ";".join([*labels, "[scheduled]"])
+        running.append(frame)
+        return ";".join(_frame_label(frame) for frame in reversed(running))
+
+    def _run(self):
+        previous = time.perf_counter()
+        while not self._stop.wait(self.interval_seconds):
+            stack = self._sample()
+            now = time.perf_counter()
+            if stack is not None:
+                self.stacks[stack] += int((now - previous) * 1_000_000)
+            previous = now
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def folded(self) -> str:
+        return "".join(f"{stack} {weight}\n" for stack, weight in self.stacks.items() if weight)
+
+
+def profile_path(profile_id: str) -> Path | None:
+    """Stored profile with this id, or None for unknown or malformed ids."""
+    if not profile_id.replace("-", "").isalnum():
+        return None
+    path = Path(profiling_config.output_dir) / f"{profile_id}{PROFILE_SUFFIX}"
+    return path if path.is_file() else None
+
+
+def list_profiles() -> list[str]:
+    """Ids of stored profiles, newest first."""
+    directory = Path(profiling_config.output_dir)
+    if not directory.is_dir():
+        return []
+    return sorted((path.stem for path in directory.glob(f"*{PROFILE_SUFFIX}")), reverse=True)
+
+
+def _store(profile_id: str, folded: str):
+    directory = Path(profiling_config.output_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / f"{profile_id}{PROFILE_SUFFIX}").write_text(folded)
+    for stale in list_profiles()[profiling_config.keep:]:
+        (directory / f"{stale}{PROFILE_SUFFIX}").unlink(missing_ok=True)
+
+
+def is_profiling_admin(authorization: str | None) -> bool:
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return False
+    return get_user_id_from_token(token) in profiling_config.admin_user_ids
+
+
+class ProfilingMiddleware:
+    """ASGI middleware profiling requests asked for with `X-Profile: 1` by an admin, or sampled."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        requested = False
+        if any(name == b"x-profile" for name, _ in scope["headers"]):
+            headers = Headers(scope=scope)
+            requested = headers.get("x-profile") == "1" and is_profiling_admin(headers.get("authorization"))
+        if not requested and not (profiling_config.sample_ratio and random.random() < profiling_config.sample_ratio):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S}-{uuid4().hex[:8]}"
+
+        async def send_with_profile_id(message: Message):
+            if message["type"] == "http.response.start" and requested:
+                MutableHeaders(scope=message).append("X-Profile-Id", profile_id)
+            await send(message)
+
+        profiler = RequestProfiler(asyncio.current_task(), profiling_config.interval_ms / 1000)
+        started = time.perf_counter()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profiler.stop()
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            route = getattr(scope.get("route"), "path", None) or scope["path"]
+            await asyncio.to_thread(_store, profile_id, profiler.folded())
+            logger.info(f"Profiled {scope['method']} {route} ({elapsed_ms:.1f} ms) as {profile_id}")
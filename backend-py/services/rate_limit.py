@@ -0,0 +1,166 @@
+"""
+Token-bucket rate limiting per client and route class, configured under `rate_limit`.
+
+Each class of routes (`search`, `auth`) has a rule: a client may send `burst`
+requests at once and `rate` per second after that. A client is the user of
+the request's bearer token or, for `key: ip` rules and requests without a
+valid token, the client IP. A request finding its bucket empty is answered
+with 429 and a Retry-After header of the seconds until a token is back,
+before the route runs: no Mongo query, no bcrypt hash.
+
+Buckets live in process memory (`memory`, an LRU of `max_clients`), so each
+worker of `api.serve` allows the full rate; or in one shared-memory table
+(`shared`) created at import, before the supervisor forks, so all workers
+draw from the same bucket. The shared table is direct-mapped by a hash of the
+key: a client landing on a slot held by another starts with a full bucket.
+
+`rate_limit_requests_total{route_class, outcome}` counts the allowed and the
+limited (shed) requests.
+"""
+
+import math
+import multiprocessing
+import time
+from collections import OrderedDict
+from hashlib import blake2b
+
+from starlette.routing import compile_path
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from configs import rate_limit_config
+from configs.rate_limit_config import RateLimitRule
+from core.security import get_user_id_from_token
+from services.metrics import counter
+from utils.json_response import FastJSONResponse
+
+rate_limit_requests = counter(
+    "rate_limit_requests_total",
+    "Requests checked by the rate limiter, by route class and outcome (allowed, limited).",
+    ("route_class", "outcome"),
+)
+
+
+def take(tokens: float, updated: float, now: float, rule: RateLimitRule) -> tuple[float, float]:
+    """
+    Refill a bucket holding `tokens` at `updated` up to `now` and take one
+    token. Returns the tokens left and 0, or the unchanged refilled tokens and
+    the seconds until one is available.
+    """
+    tokens = min(float(rule.burst), tokens + (now - updated) * rule.rate)
+    if tokens >= 1:
+        return tokens - 1, 0.0
+    return tokens, (1 - tokens) / rule.rate
+
+
+class MemoryBuckets:
+    """Buckets of this process, forgetting the least recently seen client past `max_clients`."""
+
+    def __init__(self, max_clients: int):
+        self.max_clients = max_clients
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+
+    def acquire(self, key: str, rule: RateLimitRule) -> float:
+        now = time.monotonic()
+        tokens, updated = self._buckets.pop(key, (float(rule.burst), now))
+        tokens, retry_after = take(tokens, updated, now, rule)
+        self._buckets[key] = (tokens, now)
+        if len(self._buckets) > self.max_clients:
+            self._buckets.popitem(last=False)
+        return retry_after
+
+
+class SharedBuckets:
+    """Buckets in anonymous shared memory, inherited by forked workers; one slot per key hash."""
+
+    def __init__(self, slots: int):
+        self.slots = slots
+        self._keys = multiprocessing.RawArray("Q", slots)
+        self._tokens = multiprocessing.RawArray("d", slots)
+        self._updated = multiprocessing.RawArray("d", slots)
+        self._lock = multiprocessing.Lock()
+
+    def acquire(self, key: str, rule: RateLimitRule) -> float:
+        # 0 marks an empty slot, so hashes are made odd
+        digest = int.from_bytes(blake2b(key.encode(), digest_size=8).digest(), "little") | 1
+        slot = digest % self.slots
+        # CLOCK_MONOTONIC is system-wide, so the workers' timestamps compare
+        now = time.monotonic()
+        with self._lock:
+            if self._keys[slot] == digest:
+                tokens, updated = self._tokens[slot], self._updated[slot]
+            else:
+                self._keys[slot] = digest
+                tokens, updated = float(rule.burst), now
+            tokens, retry_after = take(tokens, updated, now, rule)
+            self._tokens[slot] = tokens
+            self._updated[slot] = now
+        return retry_after
+
+
+def _create_buckets() -> MemoryBuckets | SharedBuckets | None:
+    if not (rate_limit_config and rate_limit_config.enabled):
+        return None
+    if rate_limit_config.backend == "shared":
+        return SharedBuckets(rate_limit_config.max_clients)
+    return MemoryBuckets(rate_limit_config.max_clients)
+
+
+buckets = _create_buckets()
+
+
+def _compile_routes() -> list[tuple[object, str, RateLimitRule]]:
+    if not (rate_limit_config and rate_limit_config.enabled):
+        return []
+    return [
+        (compile_path(template)[0], route_class, rate_limit_config.classes[route_class])
+        for template, route_class in rate_limit_config.routes.items()
+    ]
+
+
+def client_key(scope: Scope, rule: RateLimitRule) -> str:
+    if rule.key == "user":
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                scheme, _, token = value.decode("latin-1").partition(" ")
+                user_id = get_user_id_from_token(token) if scheme.lower() == "bearer" and token else None
+                if user_id is not None:
+                    return f"user:{user_id}"
+                break
+    client = scope.get("client")
+    return f"ip:{client[0] if client else 'unknown'}"
+
+
+class RateLimitMiddleware:
+    """ASGI middleware answering 429 to clients over their route class's rate."""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.routes = _compile_routes()
+
+    def _match(self, path: str) -> tuple[str, RateLimitRule] | None:
+        for regex, route_class, rule in self.routes:
+            if regex.match(path):
+                return route_class, rule
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        matched = self._match(scope["path"]) if scope["type"] == "http" and buckets is not None else None
+        if matched is None:
+            await self.app(scope, receive, send)
+            return
+
+        route_class, rule = matched
+        key = f"{route_class}:{client_key(scope, rule)}"
+        retry_after = buckets.acquire(key, rule)
+        if not retry_after:
+            rate_limit_requests.inc(1, route_class, "allowed")
+            await self.app(scope, receive, send)
+            return
+
+        rate_limit_requests.inc(1, route_class, "limited")
+        response = FastJSONResponse(
+            {"detail": "Too many requests"},
+            status_code=429,
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+        await response(scope, receive, send)
@@ -0,0 +1,153 @@
+"""
+OpenTelemetry tracing, configured under `tracing` (off by default).
+
+When enabled, `configure_tracing` installs a tracer provider sampling
+`sample_ratio` of new traces and instruments:
+
+- FastAPI: one server span per request (`excluded_urls` skipped);
+- aiohttp: one client span per Node.js call, with `traceparent` propagated;
+- Mongo: one span per command through `MongoCommandTracing`, passed to the
+  motor client by `mongo_event_listeners`, so N+1 query patterns show up as
+  runs of sibling `find` spans under one request;
+- WebSocket broadcasts: `broadcast_span`; the broadcast task inherits the
+  request's context, so its span joins the request's trace.
+
+Log records carry the trace and span ids (`LoggingInstrumentor`).
+"""
+
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from fastapi import FastAPI
+from opentelemetry import trace
+from opentelemetry.trace import Span, SpanKind, Status, StatusCode
+from pymongo import monitoring
+
+from configs import get_logger, tracing_config
+from configs.tracing_config import TracingConfig
+
+logger = get_logger("tracing")
+
+tracer = trace.get_tracer("backend-py")
+
+
+def tracing_enabled() -> bool:
+    return bool(tracing_config and tracing_config.enabled)
+
+
+def _span_exporter(config: TracingConfig):
+    from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+
+    if config.exporter == "otlp":
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+            OTLPSpanExporter,
+        )
+
+        return OTLPSpanExporter(endpoint=config.otlp_endpoint)
+    if config.exporter == "console":
+        return ConsoleSpanExporter(service_name=config.service_name)
+    directory = os.path.dirname(config.file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    return ConsoleSpanExporter(
+        service_name=config.service_name,
+        out=open(config.file_path, "a", encoding="utf-8"),
+        formatter=lambda span: span.to_json(indent=None) + "\n",
+    )
+
+
+def configure_tracing(app: FastAPI):
+    """Install the tracer provider and instrument `app`, aiohttp and logging; no-op unless enabled."""
+    if not tracing_enabled():
+        return
+
+    from opentelemetry.instrumentation.aiohttp_client import AioHttpClientInstrumentor
+    from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
+    from opentelemetry.instrumentation.logging import LoggingInstrumentor
+    from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    provider = TracerProvider(
+        resource=Resource.create({SERVICE_NAME: tracing_config.service_name}),
+        sampler=ParentBased(TraceIdRatioBased(tracing_config.sample_ratio)),
+    )
+    provider.add_span_processor(BatchSpanProcessor(_span_exporter(tracing_config)))
+    trace.set_tracer_provider(provider)
+
+    LoggingInstrumentor().instrument(set_logging_format=True)
+    AioHttpClientInstrumentor().instrument()
+    FastAPIInstrumentor.instrument_app(
+        app,
+        excluded_urls=tracing_config.excluded_urls,
+        exclude_spans=["receive", "send"],
+    )
+    logger.info(
+        f"Tracing enabled: exporter={tracing_config.exporter}, sample_ratio={tracing_config.sample_ratio}"
+    )
+
+
+def shutdown_tracing():
+    provider = trace.get_tracer_provider()
+    if tracing_enabled() and hasattr(provider, "shutdown"):
+        provider.shutdown()
+
+
+class MongoCommandTracing(monitoring.CommandListener):
+    """
+    Command listener opening a client span per Mongo command.
+
+    Motor runs commands on its executor with a copy of the caller's context,
+    so the span's parent is the request (or broadcast) span that issued it.
+    """
+
+    def __init__(self):
+        self._spans: dict[tuple[int, object], Span] = {}
+
+    def started(self, event: monitoring.CommandStartedEvent):
+        target = event.command.get(event.command_name) if event.command else None
+        if event.command_name == "getMore":
+            target = event.command.get("collection")
+        collection = target if isinstance(target, str) else ""
+        span = tracer.start_span(
+            f"mongo {event.command_name} {collection}".rstrip(),
+            kind=SpanKind.CLIENT,
+            attributes={
+                "db.system": "mongodb",
+                "db.name": event.database_name,
+                "db.operation": event.command_name,
+                "db.mongodb.collection": collection,
+            },
+        )
+        if span.is_recording():
+            self._spans[(event.request_id, event.connection_id)] = span
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent):
+        span = self._spans.pop((event.request_id, event.connection_id), None)
+        if span is not None:
+            span.end()
+
+    def failed(self, event: monitoring.CommandFailedEvent):
+        span = self._spans.pop((event.request_id, event.connection_id), None)
+        if span is not None:
+            span.set_status(Status(StatusCode.ERROR, str(event.failure.get("errmsg", ""))))
+            span.end()
+
+
+def mongo_event_listeners() -> list[monitoring.CommandListener]:
+    return [MongoCommandTracing()] if tracing_enabled() else []
+
+
+@contextmanager
+def broadcast_span(project_id: str, recipients: int) -> Iterator[None]:
+    """Span around one WebSocket fan-out, a child of the request that scheduled it."""
+    if not tracing_enabled():
+        yield
+        return
+    with tracer.start_as_current_span(
+        "ws broadcast",
+        attributes={"ws.project_id": project_id, "ws.recipients": recipients},
+    ):
+        yield
@@ -0,0 +1,42 @@
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID, uuid4
+
+from clients import Clients
+from clients.mongo_client import BEST_EFFORT_WRITES
+from mongo.schemas import ActivityBuckets, ActivityEvent
+from utils.timestamp import floor_to_hour
+
+
+def activity_hour(moment: datetime) -> datetime:
+    """Start of the UTC hour bucket that `moment` falls into."""
+    return datetime.fromtimestamp(floor_to_hour(int(moment.timestamp())), tz=timezone.utc)
+
+
+async def record_activity(
+    projectId: UUID,
+    userId: UUID,
+    action: str,
+    details: dict[str, Any] | None = None,
+    taskId: UUID | None = None,
+):
+    """
+    Append an activity to its project's bucket for the current hour.
+
+    One atomic upsert: the bucket is created on the first activity of the hour,
+    later ones are pushed onto it, so the collection grows by one document per
+    active project per hour instead of one per event. The activity log is an
+    audit trail, not task data: it is written with the best-effort write concern.
+    """
+    now = datetime.now(timezone.utc)
+    event = ActivityEvent(taskId=taskId, userId=userId, action=action, details=details or {}, createdAt=now)
+    buckets = Clients.get_mongo_client().collection(ActivityBuckets, write_tier=BEST_EFFORT_WRITES)
+    await buckets.update_one(
+        {"projectId": projectId, "hour": activity_hour(now)},
+        {
+            "$setOnInsert": {"_id": uuid4()},
+            "$push": {"events": event.model_dump()},
+            "$inc": {"eventCount": 1},
+        },
+        upsert=True,
+    )
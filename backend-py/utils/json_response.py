@@ -0,0 +1,30 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse, Response
+from pydantic_core import to_json
+
+
+def encode_json(content: Any) -> bytes:
+    """
+    Compact UTF-8 JSON, encoded in Rust by pydantic-core.
+
+    Handles models, UUIDs and datetimes natively (ISO 8601); anything else falls back to `str()`.
+    """
+    return to_json(content, fallback=str)
+
+
+class FastJSONResponse(JSONResponse):
+    """Default response class of the app: same output as `JSONResponse`, without the stdlib encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return encode_json(content)
+
+
+class EncodedJSONResponse(Response):
+    """
+    Response for a body that is already JSON, e.g. one also sent over the WebSocket.
+
+    Returning it from an endpoint skips FastAPI's `response_model` validation and
+    serialization, so only encode data that was built from validated documents.
+    """
+    media_type = "application/json"
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, List, Optional
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -87,6 +87,31 @@ class TaskResponse(BaseModel):
     createdAt: datetime = Field(..., description="Creation timestamp")
     updatedAt: datetime = Field(..., description="Last update timestamp")
     comments: list[CommentData] | None = Field(default=None, description="Comments on the task")
+
+    @classmethod
+    def from_task(cls, task: Any, comments: list[CommentData] | None = None) -> "TaskResponse":
+        """
+        Response for a `Tasks` document (or a view with the same fields), built with
+        `model_construct`: the document was validated when it was loaded or written.
+        """
+        return cls.model_construct(
+            id=task.id,
+            title=task.title,
+            description=task.description,
+            projectId=task.projectId,
+            columnId=task.columnId,
+            creatorId=task.creatorId,
+            assignees=task.assignees,
+            dueDate=task.dueDate,
+            labels=task.labels,
+            checklists=[
+                ChecklistItemSchema.model_construct(text=item.text, checked=item.checked)
+                for item in task.checklists
+            ],
+            createdAt=task.createdAt,
+            updatedAt=task.updatedAt,
+            comments=comments,
+        )
     
     class Config:
         from_attributes = True
@@ -276,4 +301,25 @@ class MyTasksFilter(BaseModel):
                 "overdue": False,
                 "thisWeek": True
             }
-        }
\ No newline at end of file
+        }
+
+# ==================== PROJECT STATS ====================
+
+class ProjectTaskStatsResponse(BaseModel):
+    """Schema for the counters kept in Projects.taskStats"""
+    projectId: str = Field(..., description="Project ID")
+    open: int = Field(..., description="Tasks outside the 'Done' column")
+    closed: int = Field(..., description="Tasks in the 'Done' column")
+    totalTasks: int = Field(..., description="open + closed")
+    completion_rate: float = Field(..., description="closed / totalTasks * 100")
+
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "projectId": "123e4567-e89b-12d3-a456-426614174004",
+                "open": 6,
+                "closed": 2,
+                "totalTasks": 8,
+                "completion_rate": 25.0
+            }
+        }
@@ -0,0 +1,32 @@
+from uuid import UUID
+
+from clients import Clients
+from clients.mongo_client import BEST_EFFORT_WRITES
+from mongo.schemas import Projects
+
+# Tasks in this column count as closed in Projects.taskStats, every other column as open.
+DONE_COLUMN_TITLE = "Done"
+
+
+def stats_key(column_title: str | None) -> str:
+    return "closed" if column_title == DONE_COLUMN_TITLE else "open"
+
+
+async def inc_task_stats(project_id: UUID, **deltas: int):
+    """
+    Atomically adjust `Projects.taskStats`, e.g. `inc_task_stats(pid, open=-1, closed=1)`.
+
+    Written with the best-effort write concern: the dashboard aggregation
+    counts the tasks itself and logs counters that have drifted.
+    """
+    inc = {f"taskStats.{key}": value for key, value in deltas.items() if value}
+    if inc:
+        projects = Clients.get_mongo_client().collection(Projects, write_tier=BEST_EFFORT_WRITES)
+        await projects.update_one({"_id": project_id}, {"$inc": inc})
+
+
+async def move_task_stats(project_id: UUID, old_column_title: str | None, new_column_title: str | None):
+    old_key = stats_key(old_column_title)
+    new_key = stats_key(new_column_title)
+    if old_key != new_key:
+        await inc_task_stats(project_id, **{old_key: -1, new_key: 1})
@@ -2,6 +2,6 @@ import datetime
 
 
 def floor_to_hour(ts: int) -> int:
-    dt = datetime.datetime.utcfromtimestamp(ts)
+    dt = datetime.datetime.fromtimestamp(ts, tz=datetime.timezone.utc)
     floored = dt.replace(minute=0, second=0, microsecond=0)
     return int(floored.timestamp())
@@ -1,10 +1,21 @@
 import asyncio
-import json
+import time
 from typing import Dict, List
 
 from fastapi import WebSocket
 
 from configs import get_logger
+from services.background import run_in_background
+from services.metrics import (
+    gauge,
+    register_collector,
+    ws_broadcast_recipients,
+    ws_broadcast_seconds,
+    ws_broadcasts_in_flight,
+)
+from services.tracing import broadcast_span
+from utils.json_response import encode_json
+from websocket.worker_bus import WorkerBus
 
 logger = get_logger("websocket-manager")
 
@@ -36,30 +47,75 @@ class ConnectionManager:
             if not self.active_connections[project_id]:
                 del self.active_connections[project_id]
 
-    async def broadcast_to_project(self, project_id: str, event_type: str, data: dict):
+    async def broadcast_to_project(self, project_id: str, event_type: str, data: dict, across_workers: bool = True):
         """
         Hàm quan trọng nhất: Gửi data cho TẤT CẢ client đang xem Project đó.
         Dùng hàm này để gọi từ các API khác (Create Column, Move Task, etc.)
+        `across_workers=False` khi mọi worker đều tự nhận được event này (relay từ Node.js).
         """
-        if project_id not in self.active_connections:
+        relay = across_workers and worker_bus.active
+        if project_id not in self.active_connections and not relay:
             return 
 
         payload = {
             "event": event_type,
             "data": data
         }
-        
-        message_json = json.dumps(payload, default=str) 
 
+        message_json = encode_json(payload).decode()
+        if relay:
+            worker_bus.publish(project_id, message_json)
+        await self._send_to_project(project_id, message_json)
+
+    async def broadcast_json(self, project_id: str, event_type: str, data_json: bytes):
+        """
+        Như broadcast_to_project, với data đã được encode sẵn thành JSON
+        (ví dụ body của HTTP response), để không serialize cùng một object hai lần.
+        """
+        if project_id not in self.active_connections and not worker_bus.active:
+            return
+
+        message_json = (b'{"event":' + encode_json(event_type) + b',"data":' + data_json + b"}").decode()
+        worker_bus.publish(project_id, message_json)
+        await self._send_to_project(project_id, message_json)
+
+    async def _send_to_project(self, project_id: str, message_json: str):
+        """Gửi cho các client của project đang kết nối tới worker này."""
+        connections = list(self.active_connections.get(project_id, ()))
+        if not connections:
+            return
         to_remove = []
-        for connection in self.active_connections[project_id]:
-            try:
-                await connection.send_text(message_json)
-            except Exception as e:
-                logger.warning(f"Error sending to client: {e}")
-                to_remove.append(connection)
+        started = time.perf_counter()
+        ws_broadcasts_in_flight.inc()
+        try:
+            with broadcast_span(project_id, len(connections)):
+                for connection in connections:
+                    try:
+                        await connection.send_text(message_json)
+                    except Exception as e:
+                        logger.warning(f"Error sending to client: {e}")
+                        to_remove.append(connection)
+        finally:
+            ws_broadcasts_in_flight.dec()
+            ws_broadcast_seconds.observe(time.perf_counter() - started)
+            ws_broadcast_recipients.observe(len(connections))
         
         for dead_conn in to_remove:
             self.disconnect(dead_conn, project_id)
 
-ws_manager = ConnectionManager()
\ No newline at end of file
+    def collect_metrics(self):
+        """Room gauges, computed when `/metrics` is scraped."""
+        sizes = [len(connections) for connections in self.active_connections.values()]
+        ws_rooms.set(len(sizes))
+        ws_connections.set(sum(sizes))
+        ws_largest_room.set(max(sizes, default=0))
+
+
+ws_rooms = gauge("ws_rooms", "Project rooms with at least one WebSocket client.")
+ws_connections = gauge("ws_connections", "Open WebSocket connections across all rooms.")
+ws_largest_room = gauge("ws_largest_room", "WebSocket clients in the largest project room.")
+
+ws_manager = ConnectionManager()
+register_collector(ws_manager.collect_metrics)
+# Broadcasts from sibling workers go only to this worker's own clients
+worker_bus = WorkerBus(lambda project_id, message: run_in_background(ws_manager._send_to_project(project_id, message)))
\ No newline at end of file
@@ -0,0 +1,100 @@
+"""
+Relay of WebSocket broadcasts between the workers of one `api.serve` server.
+
+Every worker holds only the WebSocket clients it accepted, while a task update
+may be handled by any worker. With more than one worker, each binds a Unix
+datagram socket `worker-<pid>.sock` in the directory the supervisor created,
+and every broadcast is also sent, as one datagram, to the sockets of its
+siblings, which deliver it to their own clients.
+
+Datagrams are dropped rather than queued when a sibling is not reading (its
+socket buffer is full) or has just exited; a WebSocket client that misses an
+event catches up on its next load, as after a reconnect.
+"""
+
+import asyncio
+import os
+import socket
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from configs import get_logger
+
+logger = get_logger("worker-bus")
+
+# How long the list of sibling sockets is reused before the directory is listed again
+PEERS_TTL_SECONDS = 1.0
+# Larger broadcasts fail to send (EMSGSIZE) and are logged; the kernel caps them near this anyway
+MAX_DATAGRAM = 256 * 1024
+
+
+class WorkerBus:
+    def __init__(self, deliver: Callable[[str, str], None]):
+        # Called with (project_id, message) for every broadcast received from a sibling
+        self.deliver = deliver
+        # Set by the supervisor before it forks the workers; None when serving with one process
+        self.directory: Path | None = None
+        self._sock: socket.socket | None = None
+        self._path: Path | None = None
+        self._peers: list[str] = []
+        self._peers_listed = 0.0
+
+    @property
+    def active(self) -> bool:
+        return self._sock is not None
+
+    def socket_path(self, pid: int) -> Path:
+        return self.directory / f"worker-{pid}.sock"
+
+    def start(self):
+        if self.directory is None:
+            return
+        self._path = self.socket_path(os.getpid())
+        self._path.unlink(missing_ok=True)
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sock.bind(str(self._path))
+        self._sock.setblocking(False)
+        asyncio.get_running_loop().add_reader(self._sock.fileno(), self._receive)
+        logger.info(f"Relaying WebSocket broadcasts to sibling workers through {self.directory}")
+
+    def stop(self):
+        if self._sock is None:
+            return
+        asyncio.get_running_loop().remove_reader(self._sock.fileno())
+        self._sock.close()
+        self._sock = None
+        self._path.unlink(missing_ok=True)
+
+    def _peer_paths(self, refresh: bool = False) -> list[str]:
+        now = time.monotonic()
+        if refresh or now - self._peers_listed > PEERS_TTL_SECONDS:
+            self._peers = [str(path) for path in self.directory.glob("worker-*.sock") if path != self._path]
+            self._peers_listed = now
+        return self._peers
+
+    def publish(self, project_id: str, message: str):
+        if self._sock is None:
+            return
+        datagram = project_id.encode() + b"\n" + message.encode()
+        stale = False
+        for peer in self._peer_paths():
+            try:
+                self._sock.sendto(datagram, peer)
+            except (FileNotFoundError, ConnectionRefusedError):
+                stale = True
+            except BlockingIOError:
+                logger.warning(f"Worker {peer} is not keeping up; broadcast to project {project_id} dropped there")
+            except OSError as e:
+                logger.warning(f"Broadcast to project {project_id} not relayed to {peer}: {e}")
+        if stale:
+            self._peer_paths(refresh=True)
+
+    def _receive(self):
+        while True:
+            try:
+                datagram = self._sock.recv(MAX_DATAGRAM)
+            except BlockingIOError:
+                return
+            project_id, _, message = datagram.partition(b"\n")
+            self.deliver(project_id.decode(), message.decode())